@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Multi-year degradation analysis — estimates battery capacity over mission life."""
 
+import numpy as np
+
 from satpower.battery._aging import AgingModel
 from satpower.solar._degradation import apply_radiation_degradation
 
@@ -21,10 +23,11 @@ def main():
     print(f"{'Year':>6} {'Cycles':>8} {'Capacity':>10}")
     print("-" * 50)
 
-    for year in range(6):
-        n_cycles = int(orbits_per_day * 365.25 * year)
-        remaining = aging.capacity_remaining(year, n_cycles, avg_dod)
-        print(f"{year:>6} {n_cycles:>8} {remaining:>9.1%}")
+    years = np.arange(6)
+    n_cycles = (orbits_per_day * 365.25 * years).astype(int)
+    remaining = aging.capacity_remaining(years, n_cycles, avg_dod)
+    for year, cycles, frac in zip(years, n_cycles, remaining):
+        print(f"{year:>6} {cycles:>8} {frac:>9.1%}")
 
     # Solar panel degradation over mission life
     bol_power = 10.0  # W at BOL
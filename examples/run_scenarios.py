@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """Run multiple CubeSat scenarios and save plots for review."""
 
+import contextlib
+import io
 import os
+from concurrent.futures import ProcessPoolExecutor
+
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -10,6 +14,26 @@ import satpower as sp
 OUT_DIR = os.path.join(os.path.dirname(__file__), "plots")
 os.makedirs(OUT_DIR, exist_ok=True)
 
+_FIGURE = None
+
+
+def save_plot(results, plot: str, title: str, filename: str) -> None:
+    """Render one results plot into a reused figure and save it as PNG.
+
+    A single figure/axes pair per process is cleared and redrawn for every
+    plot instead of allocating (and tight-bbox re-rendering) a new one.
+    """
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.subplots(figsize=(10, 4))
+    fig, ax = _FIGURE
+
+    ax.cla()
+    getattr(results, plot)(ax=ax)
+    fig.suptitle(title, fontsize=12)
+    fig.tight_layout(rect=(0, 0, 1, 0.95))
+    fig.savefig(os.path.join(OUT_DIR, filename), dpi=100)
+
 
 def scenario_1_3u_sso():
     """Scenario 1: Standard 3U CubeSat at 550 km Sun-synchronous orbit."""
@@ -35,20 +59,9 @@ def scenario_1_3u_sso():
     print(f"  Energy balance/orbit: {summary['energy_balance_per_orbit_wh']:.2f} Wh")
     print(f"  Battery voltage: {summary['min_battery_voltage_v']:.2f} - {summary['max_battery_voltage_v']:.2f} V")
 
-    fig = results.plot_soc()
-    fig.suptitle("Scenario 1: 3U SSO 550 km — State of Charge", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s1_soc.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
-
-    fig = results.plot_power_balance()
-    fig.suptitle("Scenario 1: 3U SSO 550 km — Power Balance", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s1_power.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
-
-    fig = results.plot_battery_voltage()
-    fig.suptitle("Scenario 1: 3U SSO 550 km — Battery Voltage", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s1_voltage.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    save_plot(results, "plot_soc", "Scenario 1: 3U SSO 550 km — State of Charge", "s1_soc.png")
+    save_plot(results, "plot_power_balance", "Scenario 1: 3U SSO 550 km — Power Balance", "s1_power.png")
+    save_plot(results, "plot_battery_voltage", "Scenario 1: 3U SSO 550 km — Battery Voltage", "s1_voltage.png")
 
     return results
 
@@ -76,20 +89,9 @@ def scenario_2_iss_orbit():
     print(f"  Power margin: {summary['power_margin_w']:.2f} W")
     print(f"  Energy balance/orbit: {summary['energy_balance_per_orbit_wh']:.2f} Wh")
 
-    fig = results.plot_soc()
-    fig.suptitle("Scenario 2: ISS Orbit 408 km — State of Charge", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s2_soc.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
-
-    fig = results.plot_power_balance()
-    fig.suptitle("Scenario 2: ISS Orbit 408 km — Power Balance", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s2_power.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
-
-    fig = results.plot_battery_voltage()
-    fig.suptitle("Scenario 2: ISS Orbit 408 km — Battery Voltage", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s2_voltage.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    save_plot(results, "plot_soc", "Scenario 2: ISS Orbit 408 km — State of Charge", "s2_soc.png")
+    save_plot(results, "plot_power_balance", "Scenario 2: ISS Orbit 408 km — Power Balance", "s2_power.png")
+    save_plot(results, "plot_battery_voltage", "Scenario 2: ISS Orbit 408 km — Battery Voltage", "s2_voltage.png")
 
     return results
 
@@ -118,26 +120,28 @@ def scenario_3_heavy_payload():
     print(f"  Power margin: {summary['power_margin_w']:.2f} W")
     print(f"  Energy balance/orbit: {summary['energy_balance_per_orbit_wh']:.2f} Wh")
 
-    fig = results.plot_soc()
-    fig.suptitle("Scenario 3: Heavy Payload Stress Test — State of Charge", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s3_soc.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    save_plot(results, "plot_soc", "Scenario 3: Heavy Payload Stress Test — State of Charge", "s3_soc.png")
+    save_plot(results, "plot_power_balance", "Scenario 3: Heavy Payload Stress Test — Power Balance", "s3_power.png")
+    save_plot(results, "plot_battery_voltage", "Scenario 3: Heavy Payload Stress Test — Battery Voltage", "s3_voltage.png")
 
-    fig = results.plot_power_balance()
-    fig.suptitle("Scenario 3: Heavy Payload Stress Test — Power Balance", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s3_power.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
+    return results
 
-    fig = results.plot_battery_voltage()
-    fig.suptitle("Scenario 3: Heavy Payload Stress Test — Battery Voltage", fontsize=12, y=1.02)
-    fig.savefig(os.path.join(OUT_DIR, "s3_voltage.png"), dpi=150, bbox_inches="tight")
-    plt.close(fig)
 
-    return results
+SCENARIOS = [scenario_1_3u_sso, scenario_2_iss_orbit, scenario_3_heavy_payload]
+
+
+def run_one(scenario) -> str:
+    """Run one scenario in a worker process and return its console output."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        scenario()
+    return buf.getvalue()
 
 
 if __name__ == "__main__":
-    scenario_1_3u_sso()
-    scenario_2_iss_orbit()
-    scenario_3_heavy_payload()
+    # Scenarios share no state, so run them in parallel; each worker renders
+    # and saves its own figures with the Agg backend.
+    with ProcessPoolExecutor(max_workers=len(SCENARIOS)) as pool:
+        for output in pool.map(run_one, SCENARIOS):
+            print(output, end="")
     print(f"\nAll plots saved to: {OUT_DIR}/")
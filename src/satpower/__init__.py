@@ -2,7 +2,7 @@
 
 from satpower._version import __version__
 from satpower.orbit._propagator import Orbit, OrbitState
-from satpower.orbit._eclipse import EclipseModel, EclipseEvent
+from satpower.orbit._eclipse import EclipseModel, EclipseEvent, EclipseEvents
 from satpower.orbit._environment import OrbitalEnvironment
 from satpower.orbit._geometry import sun_vector, panel_incidence_angle
 from satpower.solar._cell import SolarCell
@@ -29,6 +29,7 @@ __all__ = [
     "OrbitState",
     "EclipseModel",
     "EclipseEvent",
+    "EclipseEvents",
     "OrbitalEnvironment",
     "sun_vector",
     "panel_incidence_angle",
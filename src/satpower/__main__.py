@@ -20,7 +20,6 @@ from pathlib import Path
 def _cmd_run(args: argparse.Namespace) -> None:
     from satpower.mission._builder import load_mission, build_simulation
     from satpower.simulation._report import generate_power_budget
-    from satpower.loads._profile import LoadProfile
 
     config = load_mission(args.mission)
     sim = build_simulation(config)
@@ -32,25 +31,8 @@ def _cmd_run(args: argparse.Namespace) -> None:
         dt_max=config.simulation.dt_max,
     )
 
-    # Build loads for report
-    loads = LoadProfile()
-    for load in config.loads:
-        loads.add_mode(
-            name=load.name,
-            power_w=load.power_w,
-            duty_cycle=load.duty_cycle,
-            trigger=load.trigger,
-        )
-
-    # Battery for report
-    from satpower.battery._pack import BatteryPack
-
-    battery = BatteryPack.from_cell(
-        config.satellite.battery.cell,
-        config.satellite.battery.config,
-    )
-
-    report = generate_power_budget(results, loads, battery, config.name)
+    # Report on the same load profile and battery the simulation used
+    report = generate_power_budget(results, sim.loads, sim.battery, config.name)
     print(report.to_text())
 
     if args.plot or args.save_plots:
@@ -29,12 +29,15 @@ from satpower.api._schemas import (
     PresetListResponse,
 )
 from satpower.api._services import (
+    clear_caches,
     run_simulation,
     run_simulation_async,
+    run_simulation_json,
     run_preset,
     list_components,
     get_component,
     get_presets,
+    shutdown_executor,
 )
 
 __all__ = [
@@ -67,8 +70,11 @@ __all__ = [
     # Services
     "run_simulation",
     "run_simulation_async",
+    "run_simulation_json",
     "run_preset",
     "list_components",
     "get_component",
     "get_presets",
+    "shutdown_executor",
+    "clear_caches",
 ]
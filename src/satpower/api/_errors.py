@@ -12,6 +12,12 @@ class SatpowerAPIError(Exception):
         self.code = code
         self.details = details or {}
 
+    # Subclasses take different constructor arguments than (message, code,
+    # details); each rebuilds from its own so errors survive pickling, e.g.
+    # back from a worker process.
+    def __reduce__(self):
+        return type(self), (self.message, self.code, self.details)
+
 
 class ComponentNotFoundError(SatpowerAPIError):
     """Raised when a component is not found in the registry."""
@@ -23,6 +29,9 @@ class ComponentNotFoundError(SatpowerAPIError):
             details={"category": category, "name": name},
         )
 
+    def __reduce__(self):
+        return type(self), (self.details["category"], self.details["name"])
+
 
 class InvalidConfigurationError(SatpowerAPIError):
     """Raised when a configuration is invalid."""
@@ -34,6 +43,9 @@ class InvalidConfigurationError(SatpowerAPIError):
             details=details or {},
         )
 
+    def __reduce__(self):
+        return type(self), (self.message, self.details)
+
 
 class SimulationError(SatpowerAPIError):
     """Raised when a simulation fails."""
@@ -45,6 +57,9 @@ class SimulationError(SatpowerAPIError):
             details=details or {},
         )
 
+    def __reduce__(self):
+        return type(self), (self.message, self.details)
+
 
 class PresetNotFoundError(SatpowerAPIError):
     """Raised when a preset mission is not found."""
@@ -55,3 +70,6 @@ class PresetNotFoundError(SatpowerAPIError):
             code="PRESET_NOT_FOUND",
             details={"name": name},
         )
+
+    def __reduce__(self):
+        return type(self), (self.details["name"],)
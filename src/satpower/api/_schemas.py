@@ -3,18 +3,89 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Literal
-
-from pydantic import BaseModel, Field
+from typing import Annotated, Any
+
+import numpy as np
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    WithJsonSchema,
+)
+
+from satpower.mission._config import (
+    EclipseModelName,
+    FormFactor,
+    LoadTrigger,
+    WingCount,
+)
 
 
 # --- Enums ---
 
 class PlotFormat(str, Enum):
+    """How plots are returned.
+
+    STRUCTURED sends the raw time series for client-side plotting and is
+    far smaller and cheaper to produce than a rendered PNG_BASE64 image.
+    """
+
     STRUCTURED = "structured"
     PNG_BASE64 = "png_base64"
 
 
+# --- Array fields ---
+
+def _as_float_array(value: Any) -> np.ndarray:
+    """Accept a 1-D numeric sequence, keeping float ndarrays as they are."""
+    arr = np.asarray(value)
+    if arr.dtype.kind != "f":
+        arr = arr.astype(float)
+    if arr.ndim != 1:
+        raise ValueError(f"expected a 1-D array, got shape {arr.shape}")
+    return arr
+
+
+# Significant digits kept when dumping float32 series: about what float32
+# resolves, without the binary noise that widening to a double exposes
+_FLOAT32_DUMP_DIGITS = 7
+
+
+def _float_list(arr: np.ndarray) -> list[float]:
+    """Dump a float array as a list of Python floats.
+
+    float64 arrays are dumped exactly. float32 arrays (the display-only
+    simulation series) are rounded to _FLOAT32_DUMP_DIGITS significant
+    digits, so e.g. 5.123457f dumps as 5.123457 and not 5.123456954956055.
+    """
+    if arr.dtype != np.float32:
+        return arr.tolist()
+    values = arr.astype(np.float64)
+    nonzero = np.isfinite(values) & (values != 0.0)
+    magnitude = np.abs(values, where=nonzero, out=np.ones_like(values))
+    places = _FLOAT32_DUMP_DIGITS - 1 - np.floor(np.log10(magnitude))
+    # Scale by exact powers of ten: multiply for decimal places, divide for
+    # rounding above the units digit
+    up = 10.0 ** np.maximum(places, 0.0)
+    down = 10.0 ** np.maximum(-places, 0.0)
+    rounded = np.where(
+        places >= 0, np.round(values * up) / up, np.round(values / down) * down
+    )
+    return np.where(nonzero, rounded, values).tolist()
+
+
+# Time series values held as ndarrays: no per-element validation or Python
+# float boxing when building responses; lists are produced only on dump.
+FloatArray = Annotated[
+    np.ndarray,
+    PlainValidator(_as_float_array),
+    PlainSerializer(_float_list, return_type=list[float]),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
 # --- Request schemas ---
 
 class OrbitRequest(BaseModel):
@@ -22,15 +93,15 @@ class OrbitRequest(BaseModel):
     inclination_deg: float = Field(ge=0.0, le=180.0)
     raan_deg: float = 0.0
     j2: bool = False
-    eclipse_model: Literal["cylindrical", "conical"] = "cylindrical"
+    eclipse_model: EclipseModelName = "cylindrical"
 
 
 class SolarRequest(BaseModel):
     cell: str
-    form_factor: Literal["1U", "3U", "6U"] = "3U"
+    form_factor: FormFactor = "3U"
     body_panels: bool = True
     exclude_faces: list[str] | None = None
-    deployed_wings_count: Literal[2, 4] | None = None
+    deployed_wings_count: WingCount | None = None
     deployed_wings_area_m2: float | None = Field(default=None, gt=0.0)
 
 
@@ -43,7 +114,9 @@ class LoadRequest(BaseModel):
     name: str
     power_w: float = Field(ge=0.0)
     duty_cycle: float = Field(default=1.0, ge=0.0, le=1.0)
-    trigger: Literal["always", "sunlight", "eclipse", "scheduled"] = "always"
+    trigger: LoadTrigger = "always"
+    period_s: float = Field(default=5400.0, gt=0.0)
+    phase_s: float = 0.0
 
 
 class SimulationParametersRequest(BaseModel):
@@ -76,14 +149,24 @@ class PresetSimulationRequest(BaseModel):
 
 # --- Response schemas ---
 
-class TimeSeriesData(BaseModel):
+class _ResponseModel(BaseModel):
+    """Base for response models.
+
+    Immutable once built, so instances can be shared or cached between
+    requests without defensive copies.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class TimeSeriesData(_ResponseModel):
     label: str
     unit: str
-    x: list[float]
-    y: list[float]
+    x: FloatArray
+    y: FloatArray
 
 
-class PlotData(BaseModel):
+class PlotData(_ResponseModel):
     plot_type: str
     format: PlotFormat
     time_series: list[TimeSeriesData] | None = None
@@ -91,7 +174,7 @@ class PlotData(BaseModel):
     eclipse_regions: list[tuple[float, float]] = Field(default_factory=list)
 
 
-class SimulationSummary(BaseModel):
+class SimulationSummary(_ResponseModel):
     min_soc: float
     max_soc: float
     worst_case_dod: float
@@ -105,7 +188,7 @@ class SimulationSummary(BaseModel):
     duration_orbits: float
 
 
-class PowerBudgetResponse(BaseModel):
+class PowerBudgetResponse(_ResponseModel):
     mission_name: str
     subsystems: list[dict]
     avg_generated_w: float
@@ -118,13 +201,13 @@ class PowerBudgetResponse(BaseModel):
     verdict: str
 
 
-class ValidationResponse(BaseModel):
+class ValidationResponse(_ResponseModel):
     passed: bool
     warnings: list[str] = Field(default_factory=list)
     errors: list[str] = Field(default_factory=list)
 
 
-class SimulationResponse(BaseModel):
+class SimulationResponse(_ResponseModel):
     simulation_id: str
     name: str
     summary: SimulationSummary
@@ -133,27 +216,27 @@ class SimulationResponse(BaseModel):
     plots: list[PlotData] = Field(default_factory=list)
 
 
-class ComponentInfo(BaseModel):
+class ComponentInfo(_ResponseModel):
     name: str
     category: str
     highlights: dict[str, Any] = Field(default_factory=dict)
 
 
-class ComponentListResponse(BaseModel):
+class ComponentListResponse(_ResponseModel):
     category: str
     components: list[ComponentInfo]
 
 
-class ComponentDetailResponse(BaseModel):
+class ComponentDetailResponse(_ResponseModel):
     name: str
     category: str
     data: dict[str, Any]
 
 
-class PresetInfo(BaseModel):
+class PresetInfo(_ResponseModel):
     name: str
     application: str = ""
 
 
-class PresetListResponse(BaseModel):
+class PresetListResponse(_ResponseModel):
     presets: list[PresetInfo]
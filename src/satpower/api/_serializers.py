@@ -1,4 +1,8 @@
-"""NumPy-to-JSON and matplotlib-to-base64 serializers for the API."""
+"""NumPy-to-JSON and matplotlib-to-base64 serializers for the API.
+
+Plot models are built with model_construct(): their contents come straight
+from SimulationResults and need no revalidation.
+"""
 
 from __future__ import annotations
 
@@ -17,31 +21,20 @@ from satpower.simulation._results import SimulationResults
 
 def _extract_eclipse_regions(results: SimulationResults) -> list[tuple[float, float]]:
     """Extract eclipse regions as (start_orbit, end_orbit) pairs."""
+    starts, ends = results._eclipse_spans()
     t_orbits = results.time_orbits
-    regions = []
-    in_ecl = False
-    start = 0.0
-
-    for i in range(len(results.eclipse)):
-        if results.eclipse[i] and not in_ecl:
-            start = float(t_orbits[i])
-            in_ecl = True
-        elif not results.eclipse[i] and in_ecl:
-            regions.append((start, float(t_orbits[i])))
-            in_ecl = False
-    if in_ecl:
-        regions.append((start, float(t_orbits[-1])))
-
-    return regions
+    return list(zip(t_orbits[starts].tolist(), t_orbits[ends].tolist()))
 
 
 def _fig_to_base64(fig) -> str:
-    """Render matplotlib figure to base64-encoded PNG string."""
-    buf = io.BytesIO()
-    fig.savefig(buf, format="png", dpi=100, bbox_inches="tight")
-    buf.seek(0)
-    encoded = base64.b64encode(buf.read()).decode("ascii")
-    buf.close()
+    """Render matplotlib figure to base64-encoded PNG string.
+
+    The plot methods already call ``tight_layout()``, so the figure is saved
+    as laid out; ``bbox_inches="tight"`` would cost an extra draw pass.
+    """
+    with io.BytesIO() as buf:
+        fig.savefig(buf, format="png", dpi=100)
+        encoded = base64.b64encode(buf.getbuffer()).decode("ascii")
     # Use the same safe pyplot import as _results.py
     from satpower.simulation._results import _pyplot
     plt = _pyplot()
@@ -50,21 +43,28 @@ def _fig_to_base64(fig) -> str:
 
 
 def serialize_plot_soc(
-    results: SimulationResults, fmt: PlotFormat
+    results: SimulationResults,
+    fmt: PlotFormat,
+    eclipse_regions: list[tuple[float, float]] | None = None,
 ) -> PlotData:
-    """Serialize SoC plot as structured data or base64 PNG."""
-    eclipse_regions = _extract_eclipse_regions(results)
+    """Serialize SoC plot as structured data or base64 PNG.
+
+    ``eclipse_regions`` may be passed in when several plots of the same
+    results are serialized, so the eclipse flags are scanned only once.
+    """
+    if eclipse_regions is None:
+        eclipse_regions = _extract_eclipse_regions(results)
 
     if fmt == PlotFormat.STRUCTURED:
-        return PlotData(
+        return PlotData.model_construct(
             plot_type="soc",
             format=fmt,
             time_series=[
-                TimeSeriesData(
+                TimeSeriesData.model_construct(
                     label="State of Charge",
                     unit="%",
-                    x=results.time_orbits.tolist(),
-                    y=(results.soc * 100).tolist(),
+                    x=results.time_orbits,
+                    y=results.soc_percent,
                 )
             ],
             eclipse_regions=eclipse_regions,
@@ -72,7 +72,7 @@ def serialize_plot_soc(
 
     # PNG_BASE64
     fig = results.plot_soc()
-    return PlotData(
+    return PlotData.model_construct(
         plot_type="soc",
         format=fmt,
         png_base64=_fig_to_base64(fig),
@@ -81,34 +81,38 @@ def serialize_plot_soc(
 
 
 def serialize_plot_power_balance(
-    results: SimulationResults, fmt: PlotFormat
+    results: SimulationResults,
+    fmt: PlotFormat,
+    eclipse_regions: list[tuple[float, float]] | None = None,
 ) -> PlotData:
-    """Serialize power balance plot."""
-    eclipse_regions = _extract_eclipse_regions(results)
+    """Serialize power balance plot (``eclipse_regions`` as in serialize_plot_soc)."""
+    if eclipse_regions is None:
+        eclipse_regions = _extract_eclipse_regions(results)
 
     if fmt == PlotFormat.STRUCTURED:
-        return PlotData(
+        t_orbits = results.time_orbits
+        return PlotData.model_construct(
             plot_type="power_balance",
             format=fmt,
             time_series=[
-                TimeSeriesData(
+                TimeSeriesData.model_construct(
                     label="Generated",
                     unit="W",
-                    x=results.time_orbits.tolist(),
-                    y=results.power_generated.tolist(),
+                    x=t_orbits,
+                    y=results.power_generated,
                 ),
-                TimeSeriesData(
+                TimeSeriesData.model_construct(
                     label="Consumed",
                     unit="W",
-                    x=results.time_orbits.tolist(),
-                    y=results.power_consumed.tolist(),
+                    x=t_orbits,
+                    y=results.power_consumed,
                 ),
             ],
             eclipse_regions=eclipse_regions,
         )
 
     fig = results.plot_power_balance()
-    return PlotData(
+    return PlotData.model_construct(
         plot_type="power_balance",
         format=fmt,
         png_base64=_fig_to_base64(fig),
@@ -117,28 +121,31 @@ def serialize_plot_power_balance(
 
 
 def serialize_plot_battery_voltage(
-    results: SimulationResults, fmt: PlotFormat
+    results: SimulationResults,
+    fmt: PlotFormat,
+    eclipse_regions: list[tuple[float, float]] | None = None,
 ) -> PlotData:
-    """Serialize battery voltage plot."""
-    eclipse_regions = _extract_eclipse_regions(results)
+    """Serialize battery voltage plot (``eclipse_regions`` as in serialize_plot_soc)."""
+    if eclipse_regions is None:
+        eclipse_regions = _extract_eclipse_regions(results)
 
     if fmt == PlotFormat.STRUCTURED:
-        return PlotData(
+        return PlotData.model_construct(
             plot_type="battery_voltage",
             format=fmt,
             time_series=[
-                TimeSeriesData(
+                TimeSeriesData.model_construct(
                     label="Battery Voltage",
                     unit="V",
-                    x=results.time_orbits.tolist(),
-                    y=results.battery_voltage.tolist(),
+                    x=results.time_orbits,
+                    y=results.battery_voltage,
                 )
             ],
             eclipse_regions=eclipse_regions,
         )
 
     fig = results.plot_battery_voltage()
-    return PlotData(
+    return PlotData.model_construct(
         plot_type="battery_voltage",
         format=fmt,
         png_base64=_fig_to_base64(fig),
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
 import uuid
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from pydantic import ValidationError
 
 from satpower.api._errors import (
     ComponentNotFoundError,
@@ -27,6 +32,7 @@ from satpower.api._schemas import (
     ValidationResponse,
 )
 from satpower.api._serializers import (
+    _extract_eclipse_regions,
     serialize_plot_battery_voltage,
     serialize_plot_power_balance,
     serialize_plot_soc,
@@ -44,51 +50,87 @@ from satpower.mission._config import (
     SolarConfig,
 )
 
-_executor = ThreadPoolExecutor(max_workers=4)
+# Created on first async request so importing the API never forks workers
+_executor: ProcessPoolExecutor | None = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Return the shared simulation worker pool, creating it if needed."""
+    global _executor
+    if _executor is None:
+        # Workers validate the bundled datasheets once at start-up, not
+        # inside their first request
+        _executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), initializer=registry.preload
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stop the simulation worker pool (e.g. from an app shutdown hook).
+
+    A later async request starts a fresh pool.
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
 
 
 def _request_to_mission_config(request: SimulationRequest) -> MissionConfig:
-    """Convert a SimulationRequest into a MissionConfig."""
+    """Convert a SimulationRequest into a MissionConfig.
+
+    The request schemas carry the same field constraints as the mission
+    config models and have already been validated, so the configs are built
+    with model_construct() rather than validating every field again.
+    """
+    solar = request.solar
     deployed_wings = None
-    if request.solar.deployed_wings_count is not None:
-        deployed_wings = DeployedWingsConfig(
-            count=request.solar.deployed_wings_count,
-            area_m2=request.solar.deployed_wings_area_m2,
+    if solar.deployed_wings_count is not None:
+        deployed_wings = DeployedWingsConfig.model_construct(
+            count=solar.deployed_wings_count,
+            area_m2=solar.deployed_wings_area_m2,
         )
 
-    return MissionConfig(
+    exclude_faces = solar.exclude_faces
+    if exclude_faces is not None:
+        exclude_faces = list(exclude_faces)
+
+    return MissionConfig.model_construct(
         name=request.name,
-        orbit=OrbitConfig(
+        orbit=OrbitConfig.model_construct(
             altitude_km=request.orbit.altitude_km,
             inclination_deg=request.orbit.inclination_deg,
             raan_deg=request.orbit.raan_deg,
             j2=request.orbit.j2,
             eclipse_model=request.orbit.eclipse_model,
         ),
-        satellite=SatelliteConfig(
-            form_factor=request.solar.form_factor,
+        satellite=SatelliteConfig.model_construct(
+            form_factor=solar.form_factor,
             eps_board=request.eps_board,
-            solar=SolarConfig(
-                cell=request.solar.cell,
-                body_panels=request.solar.body_panels,
-                exclude_faces=request.solar.exclude_faces,
+            solar=SolarConfig.model_construct(
+                cell=solar.cell,
+                body_panels=solar.body_panels,
+                exclude_faces=exclude_faces,
                 deployed_wings=deployed_wings,
             ),
-            battery=BatteryConfig(
+            battery=BatteryConfig.model_construct(
                 cell=request.battery.cell,
                 config=request.battery.config,
             ),
         ),
         loads=[
-            LoadConfig(
+            LoadConfig.model_construct(
                 name=load.name,
                 power_w=load.power_w,
                 duty_cycle=load.duty_cycle,
                 trigger=load.trigger,
+                period_s=load.period_s,
+                phase_s=load.phase_s,
             )
             for load in request.loads
         ],
-        simulation=SimulationConfig(
+        simulation=SimulationConfig.model_construct(
             duration_orbits=request.simulation.duration_orbits,
             initial_soc=request.simulation.initial_soc,
             dt_max=request.simulation.dt_max,
@@ -126,26 +168,15 @@ def run_simulation(request: SimulationRequest) -> SimulationResponse:
     except Exception as e:
         raise SimulationError(str(e))
 
-    # Build response
+    # Build response. Response models are filled from trusted internal data,
+    # so they are built with model_construct() (no field revalidation);
+    # inbound request models above stay fully validated.
     summary_dict = results.summary()
-    summary = SimulationSummary(**summary_dict)
-
-    # Power budget
-    from satpower.loads._profile import LoadProfile
-    from satpower.battery._pack import BatteryPack
-
-    loads = LoadProfile()
-    for load in request.loads:
-        loads.add_mode(
-            name=load.name,
-            power_w=load.power_w,
-            duty_cycle=load.duty_cycle,
-            trigger=load.trigger,
-        )
+    summary = SimulationSummary.model_construct(**summary_dict)
 
-    battery = BatteryPack.from_cell(request.battery.cell, request.battery.config)
-    report = results.report(loads, battery, request.name)
-    power_budget = PowerBudgetResponse(
+    # Power budget, on the same load profile and battery the simulation used
+    report = results.report(sim.loads, sim.battery, request.name)
+    power_budget = PowerBudgetResponse.model_construct(
         mission_name=report.mission_name,
         subsystems=report.subsystems,
         avg_generated_w=report.avg_generated_w,
@@ -162,30 +193,10 @@ def run_simulation(request: SimulationRequest) -> SimulationResponse:
     validation = None
     if request.validate_system and request.eps_board:
         from satpower.validation._checks import validate_system as _validate
-        from satpower.regulation._eps_board import EPSBoard
-        from satpower.solar._panel import SolarPanel
-
-        eps = EPSBoard.from_datasheet(request.eps_board)
-        sc = request.solar
-        if sc.deployed_wings_count is not None:
-            panels = SolarPanel.cubesat_with_wings(
-                form_factor=sc.form_factor,
-                cell_type=sc.cell,
-                wing_count=sc.deployed_wings_count,
-                wing_area_m2=sc.deployed_wings_area_m2,
-                exclude_faces=sc.exclude_faces,
-            )
-        elif sc.body_panels:
-            panels = SolarPanel.cubesat_body(
-                form_factor=sc.form_factor,
-                cell_type=sc.cell,
-                exclude_faces=sc.exclude_faces,
-            )
-        else:
-            panels = []
 
-        val_result = _validate(eps, battery, panels)
-        validation = ValidationResponse(
+        # Validate the EPS board, battery and panels the simulation ran with
+        val_result = _validate(sim.eps_board, sim.battery, sim.panels)
+        validation = ValidationResponse.model_construct(
             passed=val_result.passed,
             warnings=val_result.warnings,
             errors=val_result.errors,
@@ -193,13 +204,14 @@ def run_simulation(request: SimulationRequest) -> SimulationResponse:
 
     # Plots
     fmt = request.plot_format
+    eclipse_regions = _extract_eclipse_regions(results)
     plots = [
-        serialize_plot_soc(results, fmt),
-        serialize_plot_power_balance(results, fmt),
-        serialize_plot_battery_voltage(results, fmt),
+        serialize_plot_soc(results, fmt, eclipse_regions),
+        serialize_plot_power_balance(results, fmt, eclipse_regions),
+        serialize_plot_battery_voltage(results, fmt, eclipse_regions),
     ]
 
-    return SimulationResponse(
+    return SimulationResponse.model_construct(
         simulation_id=str(uuid.uuid4()),
         name=request.name,
         summary=summary,
@@ -210,9 +222,33 @@ def run_simulation(request: SimulationRequest) -> SimulationResponse:
 
 
 async def run_simulation_async(request: SimulationRequest) -> SimulationResponse:
-    """Async wrapper for run_simulation (CPU-bound, runs in thread pool)."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(_executor, run_simulation, request)
+    """Async wrapper for run_simulation.
+
+    The simulation is CPU-bound and mostly pure Python between numpy calls,
+    so it runs in a worker process rather than a thread; concurrent requests
+    then use separate cores instead of queueing on the GIL. Request and
+    response models are pickled across the process boundary, as are the
+    API errors raised in the worker.
+
+    A pool broken by a dead worker is dropped, so the next request starts
+    a fresh one instead of failing too.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_executor(), run_simulation, request)
+    except BrokenProcessPool as e:
+        shutdown_executor()
+        raise SimulationError(f"Simulation worker failed: {e}")
+
+
+def run_simulation_json(request: SimulationRequest) -> bytes:
+    """Run a simulation and return the response rendered as UTF-8 JSON.
+
+    Intended for HTTP layers: the body can be sent as is with media type
+    ``application/json``, so no framework encoder walks the response model
+    (and its time series arrays) a second time.
+    """
+    return run_simulation(request).model_dump_json().encode()
 
 
 def run_preset(request: PresetSimulationRequest) -> SimulationResponse:
@@ -262,6 +298,8 @@ def run_preset(request: PresetSimulationRequest) -> SimulationResponse:
                 power_w=load.power_w,
                 duty_cycle=load.duty_cycle,
                 trigger=load.trigger,
+                period_s=load.period_s,
+                phase_s=load.phase_s,
             )
             for load in config.loads
         ],
@@ -274,24 +312,37 @@ def run_preset(request: PresetSimulationRequest) -> SimulationResponse:
         plot_format=request.plot_format,
     )
 
-    # Apply overrides
-    unknown_overrides = []
-    for key, value in request.overrides.items():
-        if hasattr(sim_request, key):
-            setattr(sim_request, key, value)
-        else:
-            unknown_overrides.append(key)
-
+    # Apply overrides. run_simulation() builds the mission config without
+    # revalidating, so the overridden request is validated as a whole here.
+    unknown_overrides = [
+        key for key in request.overrides if key not in SimulationRequest.model_fields
+    ]
     if unknown_overrides:
         raise InvalidConfigurationError(
             f"Unknown override keys: {', '.join(sorted(unknown_overrides))}"
         )
 
+    if request.overrides:
+        try:
+            sim_request = SimulationRequest.model_validate(
+                {**sim_request.model_dump(), **request.overrides}
+            )
+        except ValidationError as e:
+            raise InvalidConfigurationError(
+                f"Invalid overrides: {e}",
+                details={"errors": e.errors(include_url=False, include_context=False)},
+            )
+
     return run_simulation(sim_request)
 
 
+@functools.cache
 def list_components(category: str) -> ComponentListResponse:
-    """List all components in a category."""
+    """List all components in a category.
+
+    The bundled datasheets do not change while the process runs, so the
+    response is built once per category and shared; see clear_caches().
+    """
     if category == "solar_cells":
         names = registry.list_solar_cells()
         components = []
@@ -363,8 +414,9 @@ def get_component(category: str, name: str) -> ComponentDetailResponse:
     )
 
 
+@functools.cache
 def get_presets() -> PresetListResponse:
-    """List all bundled mission presets."""
+    """List all bundled mission presets (built once, see clear_caches())."""
     names = registry.list_missions()
     presets = []
     for name in names:
@@ -375,3 +427,10 @@ def get_presets() -> PresetListResponse:
             presets.append(PresetInfo(name=name))
 
     return PresetListResponse(presets=presets)
+
+
+def clear_caches() -> None:
+    """Forget cached listings, datasheets and cell models (e.g. after data edits)."""
+    list_components.cache_clear()
+    get_presets.cache_clear()
+    registry.clear_cache()
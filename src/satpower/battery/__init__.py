@@ -3,11 +3,12 @@
 from satpower.battery._cell import BatteryCell
 from satpower.battery._pack import BatteryPack
 from satpower.battery._aging import AgingModel
-from satpower.battery._soc import CoulombCounter
+from satpower.battery._soc import CoulombCounter, integrate_soc
 
 __all__ = [
     "BatteryCell",
     "BatteryPack",
     "AgingModel",
     "CoulombCounter",
+    "integrate_soc",
 ]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 # Universal gas constant (J/(mol·K))
@@ -29,50 +31,84 @@ class AgingModel:
         self._reference_temp_k = reference_temp_k
         self._activation_energy = activation_energy_j
 
-    def _arrhenius_factor(self, temperature_k: float) -> float:
+        # Derived constants for the hot paths
+        self._ea_over_r = activation_energy_j / _R_GAS
+        self._inv_t_ref = 1.0 / reference_temp_k
+        # Cycle fade per unit DoD below and above 50%
+        self._cyc_fade_slope_low = cycle_fade_per_cycle_50dod / 0.5
+        self._cyc_fade_slope = (
+            cycle_fade_per_cycle_100dod - cycle_fade_per_cycle_50dod
+        ) / 0.5
+
+    def _arrhenius_factor(self, temperature_k: float | np.ndarray) -> float | np.ndarray:
         """Arrhenius acceleration factor relative to reference temperature.
 
         factor = exp(Ea/R * (1/T_ref - 1/T))
 
         Returns 1.0 at reference temperature, >1 at higher temps, <1 at lower.
+        Non-positive temperatures return 1.0.
         """
+        if np.ndim(temperature_k):
+            temperature_k = np.asarray(temperature_k, dtype=float)
+            valid = temperature_k > 0
+            safe_t = np.where(valid, temperature_k, self._reference_temp_k)
+            exponent = self._ea_over_r * (self._inv_t_ref - 1.0 / safe_t)
+            return np.where(valid, np.exp(exponent), 1.0)
+
         if temperature_k <= 0:
             return 1.0
-        exponent = (
-            self._activation_energy
-            / _R_GAS
-            * (1.0 / self._reference_temp_k - 1.0 / temperature_k)
-        )
-        return float(np.exp(exponent))
+        return math.exp(self._ea_over_r * (self._inv_t_ref - 1.0 / temperature_k))
 
     def capacity_remaining(
         self,
-        years: float,
-        n_cycles: int,
-        avg_dod: float,
-        temperature_k: float = 298.15,
-    ) -> float:
+        years: float | np.ndarray,
+        n_cycles: int | np.ndarray,
+        avg_dod: float | np.ndarray,
+        temperature_k: float | np.ndarray = 298.15,
+    ) -> float | np.ndarray:
         """Fraction of original capacity remaining.
 
+        All arguments broadcast against each other, so a whole mission
+        timeline can be evaluated in one call; scalar inputs return a float.
+
         Parameters
         ----------
         years : Calendar time
         n_cycles : Number of charge/discharge cycles
-        avg_dod : Average depth of discharge per cycle [0, 1]
+        avg_dod : Average depth of discharge per cycle, clamped to [0, 1]
         temperature_k : Average battery temperature (K). Default 298.15K
             gives factor=1.0 (no acceleration).
         """
         arrhenius = self._arrhenius_factor(temperature_k)
 
-        calendar_loss = self._cal_fade * years * arrhenius
+        if not (np.ndim(years) or np.ndim(n_cycles) or np.ndim(avg_dod)) and (
+            type(arrhenius) is float
+        ):
+            # Scalar path in plain Python; called once per step by lifetime
+            # and Monte Carlo runs, where numpy dispatch would dominate
+            dod = min(max(float(avg_dod), 0.0), 1.0)
+            if dod <= 0.5:
+                fade_per_cycle = self._cyc_fade_slope_low * dod
+            else:
+                fade_per_cycle = self._cyc_fade_50 + self._cyc_fade_slope * (dod - 0.5)
+            remaining = 1.0 - (
+                self._cal_fade * float(years) + fade_per_cycle * float(n_cycles)
+            ) * arrhenius
+            return min(max(remaining, 0.0), 1.0)
+
+        calendar_loss = self._cal_fade * np.asarray(years, dtype=float) * arrhenius
 
-        # Interpolate cycle fade between 50% and 100% DoD
-        if avg_dod <= 0.5:
-            fade_per_cycle = self._cyc_fade_50 * (avg_dod / 0.5)
-        else:
-            t = (avg_dod - 0.5) / 0.5
-            fade_per_cycle = self._cyc_fade_50 + t * (self._cyc_fade_100 - self._cyc_fade_50)
+        # Piecewise-linear cycle fade: 0 -> 50% DoD ramps up to the 50% rate,
+        # 50% -> 100% DoD blends toward the 100% rate. Written as the sum of
+        # two clamped ramps so no branch or np.where is needed.
+        dod = np.clip(avg_dod, 0.0, 1.0)
+        fade_per_cycle = (
+            self._cyc_fade_slope_low * np.minimum(dod, 0.5)
+            + self._cyc_fade_slope * np.maximum(dod - 0.5, 0.0)
+        )
 
-        cycle_loss = fade_per_cycle * n_cycles * arrhenius
-        remaining = 1.0 - calendar_loss - cycle_loss
-        return float(np.clip(remaining, 0.0, 1.0))
+        cycle_loss = fade_per_cycle * np.asarray(n_cycles, dtype=float) * arrhenius
+        remaining = np.clip(1.0 - calendar_loss - cycle_loss, 0.0, 1.0)
+        if remaining.ndim == 0:
+            return float(remaining)
+        return remaining
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
-from scipy.interpolate import interp1d
 
 from satpower.data._loader import load_battery_cell, BatteryCellData
 
@@ -35,16 +36,36 @@ class BatteryCell:
         self._r2 = tm.r2_ohm
         self._c2 = tm.c2_f
 
-        # Build OCV interpolator from SoC table
-        soc_points = [row[0] for row in data.ocv_soc_table]
-        ocv_points = [row[1] for row in data.ocv_soc_table]
-        self._ocv_interp = interp1d(
-            soc_points, ocv_points, kind="linear", fill_value="extrapolate"
-        )
+        # OCV table columns for np.interp. SoC is clipped to [0, 1]
+        # before lookup, so a table not spanning that range is extended with
+        # linearly extrapolated end points once here.
+        soc_pts, ocv_pts = data.ocv_soc_arrays
+        if soc_pts[0] > 0.0:
+            slope = (ocv_pts[1] - ocv_pts[0]) / (soc_pts[1] - soc_pts[0])
+            ocv_pts = np.concatenate(([ocv_pts[0] - slope * soc_pts[0]], ocv_pts))
+            soc_pts = np.concatenate(([0.0], soc_pts))
+        if soc_pts[-1] < 1.0:
+            slope = (ocv_pts[-1] - ocv_pts[-2]) / (soc_pts[-1] - soc_pts[-2])
+            ocv_pts = np.append(ocv_pts, ocv_pts[-1] + slope * (1.0 - soc_pts[-1]))
+            soc_pts = np.append(soc_pts, 1.0)
+        self._soc_pts = soc_pts
+        self._ocv_pts = ocv_pts
+
+        # RC branch coefficients as reciprocals (a disabled branch 2 gets zeros)
+        self._inv_c1 = 1.0 / self._c1
+        self._inv_tau1 = 1.0 / (self._r1 * self._c1)
+        if self._c2 > 0 and self._r2 > 0:
+            self._inv_c2 = 1.0 / self._c2
+            self._inv_tau2 = 1.0 / (self._r2 * self._c2)
+        else:
+            self._inv_c2 = 0.0
+            self._inv_tau2 = 0.0
 
         # Temperature model
         self._ea = data.temperature.ro_activation_energy_j
         self._t_ref = data.temperature.reference_temp_c + 273.15
+        self._ea_over_r = self._ea / R_GAS
+        self._inv_t_ref = 1.0 / self._t_ref
 
     @classmethod
     def from_datasheet(cls, name: str) -> BatteryCell:
@@ -83,31 +104,54 @@ class BatteryCell:
     def max_discharge_current_a(self) -> float:
         return self._data.max_discharge_current_a
 
-    def ocv(self, soc: float) -> float:
-        """Open-circuit voltage at given state of charge."""
-        soc = np.clip(soc, 0.0, 1.0)
-        return float(self._ocv_interp(soc))
+    def ocv(self, soc: float | np.ndarray) -> float | np.ndarray:
+        """Open-circuit voltage at given state(s) of charge."""
+        if np.ndim(soc):
+            return np.interp(np.clip(soc, 0.0, 1.0), self._soc_pts, self._ocv_pts)
+        return float(
+            np.interp(min(max(soc, 0.0), 1.0), self._soc_pts, self._ocv_pts)
+        )
+
+    def ocv_slope(self, soc: float | np.ndarray) -> float | np.ndarray:
+        """dOCV/dSoC (V) of the piecewise-linear OCV curve.
 
-    def internal_resistance(self, soc: float, temperature_k: float = 298.15) -> float:
+        Zero outside [0, 1], where ocv() is clamped; at a table knot the
+        slope of the segment above it is returned.
+        """
+        soc_pts, ocv_pts = self._soc_pts, self._ocv_pts
+        i = np.clip(np.searchsorted(soc_pts, soc, side="right") - 1, 0, len(soc_pts) - 2)
+        slope = (ocv_pts[i + 1] - ocv_pts[i]) / (soc_pts[i + 1] - soc_pts[i])
+        slope = np.where((soc >= 0.0) & (soc <= 1.0), slope, 0.0)
+        if np.ndim(slope):
+            return slope
+        return float(slope)
+
+    def internal_resistance(
+        self, soc: float | np.ndarray, temperature_k: float | np.ndarray = 298.15
+    ) -> float | np.ndarray:
         """Total internal resistance (R0) with temperature correction.
 
-        Uses Arrhenius relation for temperature dependence.
+        Uses Arrhenius relation for temperature dependence. Accepts a scalar
+        or array temperature.
         """
-        temp_factor = np.exp(
-            self._ea / R_GAS * (1.0 / temperature_k - 1.0 / self._t_ref)
-        )
-        return self._r0 * temp_factor
+        exponent = self._ea_over_r * (1.0 / temperature_k - self._inv_t_ref)
+        if np.ndim(exponent):
+            return self._r0 * np.exp(exponent)
+        return self._r0 * math.exp(exponent)
 
     def terminal_voltage(
         self,
-        soc: float,
-        current: float,
-        temperature_k: float = 298.15,
-        v_rc1: float = 0.0,
-        v_rc2: float = 0.0,
-    ) -> float:
+        soc: float | np.ndarray,
+        current: float | np.ndarray,
+        temperature_k: float | np.ndarray = 298.15,
+        v_rc1: float | np.ndarray = 0.0,
+        v_rc2: float | np.ndarray = 0.0,
+    ) -> float | np.ndarray:
         """Terminal voltage under load.
 
+        All arguments may be scalars or broadcastable (N,) arrays, so a whole
+        trajectory can be evaluated in one call.
+
         Parameters
         ----------
         soc : State of charge [0, 1]
@@ -120,9 +164,16 @@ class BatteryCell:
         v = self.ocv(soc) - current * r0 - v_rc1 - v_rc2
         return v
 
-    def derivatives(self, current: float, v_rc1: float, v_rc2: float = 0.0) -> tuple[float, float]:
+    def derivatives(
+        self,
+        current: float | np.ndarray,
+        v_rc1: float | np.ndarray,
+        v_rc2: float | np.ndarray = 0.0,
+    ) -> tuple[float | np.ndarray, float | np.ndarray]:
         """Compute dV_rc1/dt and dV_rc2/dt for ODE integration.
 
+        Scalar or array inputs; arrays are evaluated elementwise.
+
         Parameters
         ----------
         current : Current (A), positive = discharge
@@ -133,11 +184,6 @@ class BatteryCell:
         -------
         (dV_rc1_dt, dV_rc2_dt)
         """
-        dv_rc1_dt = current / self._c1 - v_rc1 / (self._r1 * self._c1)
-
-        if self._c2 > 0 and self._r2 > 0:
-            dv_rc2_dt = current / self._c2 - v_rc2 / (self._r2 * self._c2)
-        else:
-            dv_rc2_dt = 0.0
-
+        dv_rc1_dt = current * self._inv_c1 - v_rc1 * self._inv_tau1
+        dv_rc2_dt = current * self._inv_c2 - v_rc2 * self._inv_tau2
         return dv_rc1_dt, dv_rc2_dt
@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
-import re
+import functools
+
+import numpy as np
 
 from satpower.battery._cell import BatteryCell
 
 
 def _parse_config(config: str) -> tuple[int, int]:
     """Parse a battery configuration string like '2S2P' -> (n_series, n_parallel)."""
-    match = re.match(r"^(\d+)S(\d+)P$", config.upper())
-    if not match:
+    # Grammar is <digits>S<digits>P; plain string checks, no regex needed
+    series, sep, parallel = config.upper().partition("S")
+    parallel, suffix = parallel[:-1], parallel[-1:]
+    if not (sep and suffix == "P" and series.isdecimal() and parallel.isdecimal()):
         raise ValueError(
             f"Invalid battery config: {config!r}. Expected format like '2S2P'."
         )
-    n_series, n_parallel = int(match.group(1)), int(match.group(2))
+    n_series, n_parallel = int(series), int(parallel)
     if n_series <= 0 or n_parallel <= 0:
         raise ValueError(
             f"Invalid battery config: {config!r}. Series/parallel counts must be > 0."
@@ -22,6 +26,16 @@ def _parse_config(config: str) -> tuple[int, int]:
     return n_series, n_parallel
 
 
+@functools.lru_cache(maxsize=32)
+def _get_cell(cell_name: str) -> BatteryCell:
+    """Cell model for a datasheet name, shared between packs.
+
+    BatteryCell holds no state beyond its datasheet-derived tables, so packs
+    that differ only in configuration can use the same instance.
+    """
+    return BatteryCell.from_datasheet(cell_name)
+
+
 class BatteryPack:
     """Battery pack with series/parallel cell configuration."""
 
@@ -29,6 +43,17 @@ class BatteryPack:
         self._cell = cell
         self._n_series = n_series
         self._n_parallel = n_parallel
+        self._inv_n_parallel = 1.0 / n_parallel
+
+        # Pack ratings are fixed once built; scaled here instead of on every
+        # read (the engine reads the current limits on each RHS call)
+        self._capacity_ah = cell.capacity_ah * n_parallel
+        self._nominal_voltage = cell.nominal_voltage * n_series
+        self._energy_wh = self._capacity_ah * cell.nominal_voltage * n_series
+        self._max_voltage = cell.max_voltage * n_series
+        self._min_voltage = cell.min_voltage * n_series
+        self._max_charge_current_a = cell.max_charge_current_a * n_parallel
+        self._max_discharge_current_a = cell.max_discharge_current_a * n_parallel
 
     @classmethod
     def from_cell(cls, cell_name: str, config: str) -> BatteryPack:
@@ -39,7 +64,7 @@ class BatteryPack:
         cell_name : Name of battery cell (e.g. 'panasonic_ncr18650b')
         config : Configuration string (e.g. '2S2P')
         """
-        cell = BatteryCell.from_datasheet(cell_name)
+        cell = _get_cell(cell_name)
         n_s, n_p = _parse_config(config)
         return cls(cell, n_s, n_p)
 
@@ -58,45 +83,45 @@ class BatteryPack:
     @property
     def capacity_ah(self) -> float:
         """Total pack capacity in Ah (parallel cells add capacity)."""
-        return self._cell.capacity_ah * self._n_parallel
+        return self._capacity_ah
 
     @property
     def energy_wh(self) -> float:
         """Total pack energy in Wh."""
-        return self.capacity_ah * self._cell.nominal_voltage * self._n_series
+        return self._energy_wh
 
     @property
     def nominal_voltage(self) -> float:
         """Nominal pack voltage (series cells add voltage)."""
-        return self._cell.nominal_voltage * self._n_series
+        return self._nominal_voltage
 
     @property
     def max_voltage(self) -> float:
-        return self._cell.max_voltage * self._n_series
+        return self._max_voltage
 
     @property
     def min_voltage(self) -> float:
-        return self._cell.min_voltage * self._n_series
+        return self._min_voltage
 
     @property
     def max_charge_current_a(self) -> float:
         """Maximum pack charge current (A)."""
-        return self._cell.max_charge_current_a * self._n_parallel
+        return self._max_charge_current_a
 
     @property
     def max_discharge_current_a(self) -> float:
         """Maximum pack discharge current (A)."""
-        return self._cell.max_discharge_current_a * self._n_parallel
+        return self._max_discharge_current_a
 
     def terminal_voltage(
         self,
-        soc: float,
-        current: float,
-        temperature_k: float = 298.15,
-        v_rc1: float = 0.0,
-        v_rc2: float = 0.0,
-    ) -> float:
-        """Pack terminal voltage.
+        soc: float | np.ndarray,
+        current: float | np.ndarray,
+        temperature_k: float | np.ndarray = 298.15,
+        v_rc1: float | np.ndarray = 0.0,
+        v_rc2: float | np.ndarray = 0.0,
+    ) -> float | np.ndarray:
+        """Pack terminal voltage (scalars or (N,) arrays, as for the cell).
 
         Parameters
         ----------
@@ -107,15 +132,18 @@ class BatteryPack:
         v_rc2 : Per-cell RC2 voltage
         """
         # Current per parallel string
-        cell_current = current / self._n_parallel
+        cell_current = current * self._inv_n_parallel
         cell_v = self._cell.terminal_voltage(
             soc, cell_current, temperature_k, v_rc1, v_rc2
         )
         return cell_v * self._n_series
 
     def derivatives(
-        self, current: float, v_rc1: float, v_rc2: float = 0.0
-    ) -> tuple[float, float]:
+        self,
+        current: float | np.ndarray,
+        v_rc1: float | np.ndarray,
+        v_rc2: float | np.ndarray = 0.0,
+    ) -> tuple[float | np.ndarray, float | np.ndarray]:
         """Pack-level RC derivatives (same as cell since RC is per-cell)."""
-        cell_current = current / self._n_parallel
+        cell_current = current * self._inv_n_parallel
         return self._cell.derivatives(cell_current, v_rc1, v_rc2)
@@ -12,8 +12,9 @@ class CoulombCounter:
     """
 
     def __init__(self, capacity_ah: float, initial_soc: float = 1.0):
+        self._capacity_ah = capacity_ah
         self._capacity_as = capacity_ah * 3600.0  # Ah -> As (coulombs)
-        self._soc = np.clip(initial_soc, 0.0, 1.0)
+        self._soc = min(max(float(initial_soc), 0.0), 1.0)
 
     @property
     def soc(self) -> float:
@@ -33,9 +34,32 @@ class CoulombCounter:
         """
         # dSoC = -I * dt / Q  (discharge decreases SoC)
         dsoc = -current * dt / self._capacity_as
-        self._soc = float(np.clip(self._soc + dsoc, 0.0, 1.0))
+        # Plain float clamp: np.clip on a scalar costs a 0-d array round trip
+        self._soc = min(max(self._soc + dsoc, 0.0), 1.0)
         return self._soc
 
+    def update_series(
+        self, current: np.ndarray, dt: float | np.ndarray
+    ) -> np.ndarray:
+        """Apply a whole current series; same result as update() per sample.
+
+        Clamping is exact per step (see integrate_soc()), but the stretch
+        before the first bound crossing is a single cumulative sum.
+
+        Parameters
+        ----------
+        current : (N,) current (A), positive = discharge, negative = charge
+        dt : Time step(s) (seconds), scalar or (N,)
+
+        Returns
+        -------
+        (N,) SoC after each step
+        """
+        soc = integrate_soc(self._soc, current, dt, self._capacity_ah)
+        if soc.size:
+            self._soc = float(soc[-1])
+        return soc
+
     @staticmethod
     def dsoc_dt(current: float, capacity_ah: float) -> float:
         """Compute dSoC/dt for ODE integration.
@@ -46,3 +70,49 @@ class CoulombCounter:
         capacity_ah : Battery capacity (Ah)
         """
         return -current / (capacity_ah * 3600.0)
+
+
+def integrate_soc(
+    soc0: float,
+    current: np.ndarray,
+    dt: float | np.ndarray,
+    capacity_ah: float,
+    soc_min: float = 0.0,
+    soc_max: float = 1.0,
+) -> np.ndarray:
+    """Coulomb-count a whole current series in one call.
+
+    Equivalent to calling CoulombCounter.update() once per sample, but the
+    unclamped path is a single cumulative sum; per-step stepping is only
+    used from the first sample that would cross a SoC bound.
+
+    Parameters
+    ----------
+    soc0 : Initial state of charge
+    current : (N,) current (A), positive = discharge, negative = charge
+    dt : Time step(s) (seconds), scalar or (N,)
+    capacity_ah : Battery capacity (Ah)
+    soc_min, soc_max : SoC clamp bounds
+
+    Returns
+    -------
+    (N,) SoC after each step
+    """
+    current = np.asarray(current, dtype=float)
+    dsoc = -current * dt / (capacity_ah * 3600.0)
+    level = min(max(float(soc0), soc_min), soc_max)
+
+    soc = level + np.cumsum(dsoc)
+    out_of_bounds = (soc < soc_min) | (soc > soc_max)
+    if not out_of_bounds.any():
+        return soc
+
+    # Clamp events: continue step by step from the first bound crossing
+    first = int(np.argmax(out_of_bounds))
+    if first > 0:
+        level = float(soc[first - 1])
+    steps = np.broadcast_to(dsoc, soc.shape)[first:].tolist()
+    for i, step in enumerate(steps, start=first):
+        level = min(max(level + step, soc_min), soc_max)
+        soc[i] = level
+    return soc
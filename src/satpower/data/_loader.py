@@ -2,45 +2,68 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 
 _DATA_DIR = Path(__file__).parent
 
+# libyaml-backed safe loader when PyYAML was built with it; parsing dominates
+# datasheet and mission load time and the C loader is roughly 10x faster
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class DiodeModelData(BaseModel):
+# Parsed YAML by path, most recently used last: (mtime_ns, size, data)
+_YAML_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_YAML_CACHE_MAX = 128
+
+
+class _DatasheetModel(BaseModel):
+    """Base for datasheet models.
+
+    Loaded datasheets are cached and shared by every component built from
+    them, so the models are frozen; vary one with model_copy(update=...).
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DiodeModelData(_DatasheetModel):
     ideality_factor: float
     series_resistance_ohm: float
     shunt_resistance_ohm: float
 
 
-class TemperatureCoeffData(BaseModel):
+class TemperatureCoeffData(_DatasheetModel):
     dvoc_dt_mv_per_c: float
     disc_dt_ua_cm2_per_c: float
     dpmp_dt_percent_per_c: float
 
 
-class RadiationData(BaseModel):
+class RadiationData(_DatasheetModel):
     remaining_factor_1e14: float
     remaining_factor_1e15: float
 
 
-class OpticalData(BaseModel):
+class OpticalData(_DatasheetModel):
     absorptance: float
     emittance: float
     packing_factor: float
 
 
-class TestConditionsData(BaseModel):
+class TestConditionsData(_DatasheetModel):
     spectrum: str
     irradiance_w_m2: float
     temperature_c: float
 
 
-class SolarCellParams(BaseModel):
+class SolarCellParams(_DatasheetModel):
     voc_v: float
     isc_a: float
     vmp_v: float
@@ -49,7 +72,7 @@ class SolarCellParams(BaseModel):
     area_cm2: float
 
 
-class SolarCellData(BaseModel):
+class SolarCellData(_DatasheetModel):
     name: str
     type: str
     junctions: list[str]
@@ -61,7 +84,7 @@ class SolarCellData(BaseModel):
     optical: OpticalData
 
 
-class TheveninModelData(BaseModel):
+class TheveninModelData(_DatasheetModel):
     ro_ohm: float
     r1_ohm: float
     c1_f: float
@@ -69,19 +92,19 @@ class TheveninModelData(BaseModel):
     c2_f: float = 0.0
 
 
-class BatteryTemperatureData(BaseModel):
+class BatteryTemperatureData(_DatasheetModel):
     ro_activation_energy_j: float
     reference_temp_c: float
     capacity_derating: list[list[float]]
 
 
-class BatteryAgingData(BaseModel):
+class BatteryAgingData(_DatasheetModel):
     calendar_fade_per_year_25c: float
     cycle_fade_per_cycle_50dod: float
     cycle_fade_per_cycle_100dod: float
 
 
-class BatteryCellData(BaseModel):
+class BatteryCellData(_DatasheetModel):
     name: str
     chemistry: str
     form_factor: str
@@ -97,8 +120,28 @@ class BatteryCellData(BaseModel):
     temperature: BatteryTemperatureData
     aging: BatteryAgingData
 
+    # (source table, soc column, ocv column) — rebuilt if the table is replaced
+    _ocv_soc_cache: tuple | None = PrivateAttr(default=None)
 
-class EPSData(BaseModel):
+    @property
+    def ocv_soc_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """OCV table as read-only (soc, ocv) float64 columns sorted by SoC.
+
+        Built once per datasheet and shared by every cell constructed from it.
+        """
+        table = self.ocv_soc_table
+        cache = self._ocv_soc_cache
+        if cache is None or cache[0] is not table:
+            arr = np.asarray(table, dtype=np.float64)
+            arr = arr[np.argsort(arr[:, 0], kind="stable")]
+            soc, ocv = np.ascontiguousarray(arr[:, 0]), np.ascontiguousarray(arr[:, 1])
+            soc.flags.writeable = False
+            ocv.flags.writeable = False
+            cache = self._ocv_soc_cache = (table, soc, ocv)
+        return cache[1], cache[2]
+
+
+class EPSData(_DatasheetModel):
     name: str
     bus_voltage_v: float
     bus_voltage_range_v: list[float]
@@ -113,29 +156,59 @@ class EPSData(BaseModel):
 
 
 def _load_yaml(path: Path) -> dict:
-    with open(path) as f:
-        return yaml.safe_load(f)
-
-
+    """Parse a YAML file, reusing the previous parse while the file is unchanged.
+
+    Entries are revalidated against the file's mtime and size. Callers get
+    a deep copy, so they may mutate the result freely.
+    """
+    key = str(path)
+    st = os.stat(path)
+    hit = _YAML_CACHE.get(key)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(hit[2])
+
+    with open(path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+# Datasheet loaders are memoized per name: every SolarCell, BatteryCell or
+# EPSBoard built from the same datasheet shares one frozen, validated model.
+# This is the cache that serves datasheet lookups; it is not revalidated
+# against the files, so edits to a datasheet take effect only after
+# ComponentRegistry.clear_cache() (or load_*.cache_clear()). The reload then
+# goes through _load_yaml(), whose mtime/size check re-parses only the files
+# that changed. Mission files, which are not memoized here, rely on that
+# check directly.
+
+
+@functools.lru_cache(maxsize=128)
 def load_solar_cell(name: str) -> SolarCellData:
     """Load a solar cell datasheet by name (e.g. 'azur_3g30c')."""
     path = _DATA_DIR / "cells" / f"{name}.yaml"
     if not path.exists():
         raise FileNotFoundError(f"Solar cell datasheet not found: {name}")
-    return SolarCellData(**_load_yaml(path))
+    return SolarCellData.model_validate(_load_yaml(path))
 
 
+@functools.lru_cache(maxsize=128)
 def load_battery_cell(name: str) -> BatteryCellData:
     """Load a battery cell datasheet by name (e.g. 'panasonic_ncr18650b')."""
     path = _DATA_DIR / "batteries" / f"{name}.yaml"
     if not path.exists():
         raise FileNotFoundError(f"Battery cell datasheet not found: {name}")
-    return BatteryCellData(**_load_yaml(path))
+    return BatteryCellData.model_validate(_load_yaml(path))
 
 
+@functools.lru_cache(maxsize=128)
 def load_eps(name: str) -> EPSData:
     """Load an EPS board profile by name (e.g. 'gomspace_p31u')."""
     path = _DATA_DIR / "eps" / f"{name}.yaml"
     if not path.exists():
         raise FileNotFoundError(f"EPS profile not found: {name}")
-    return EPSData(**_load_yaml(path))
+    return EPSData.model_validate(_load_yaml(path))
@@ -17,16 +17,60 @@ _DATA_DIR = Path(__file__).parent
 
 
 class ComponentRegistry:
-    """Lazy-loading registry for component datasheets."""
+    """Lazy-loading registry for component datasheets.
+
+    Each datasheet is parsed and validated on first lookup and the same
+    instance is returned afterwards (the loaders are memoized, so models
+    built via from_datasheet() share it too); the models are frozen. Call
+    clear_cache() to force a reload (e.g. after editing YAML files).
+    """
+
+    def __init__(self) -> None:
+        # Sorted datasheet names per data subdirectory, scanned once
+        self._listings: dict[str, tuple[str, ...]] = {}
+
+    def _list(self, subdir: str) -> list[str]:
+        names = self._listings.get(subdir)
+        if names is None:
+            folder = _DATA_DIR / subdir
+            names = self._listings[subdir] = tuple(
+                sorted(p.stem for p in folder.glob("*.yaml"))
+            )
+        return list(names)
+
+    def clear_cache(self) -> None:
+        """Drop all cached datasheets, cell models and directory listings."""
+        # Imported here: satpower.battery imports this package
+        from satpower.battery._pack import _get_cell
+
+        self._listings.clear()
+        load_solar_cell.cache_clear()
+        load_battery_cell.cache_clear()
+        load_eps.cache_clear()
+        # BatteryPack.from_cell() keeps cell models built from the datasheets
+        _get_cell.cache_clear()
+
+    def preload(self) -> None:
+        """Parse and validate every bundled datasheet now.
+
+        Validation then happens once, up front (e.g. at worker start-up),
+        and later lookups in this process are cache hits.
+        """
+        for name in self.list_solar_cells():
+            load_solar_cell(name)
+        for name in self.list_battery_cells():
+            load_battery_cell(name)
+        for name in self.list_eps():
+            load_eps(name)
 
     def list_solar_cells(self) -> list[str]:
-        return [p.stem for p in (_DATA_DIR / "cells").glob("*.yaml")]
+        return self._list("cells")
 
     def list_battery_cells(self) -> list[str]:
-        return [p.stem for p in (_DATA_DIR / "batteries").glob("*.yaml")]
+        return self._list("batteries")
 
     def list_eps(self) -> list[str]:
-        return [p.stem for p in (_DATA_DIR / "eps").glob("*.yaml")]
+        return self._list("eps")
 
     def get_solar_cell(self, name: str) -> SolarCellData:
         return load_solar_cell(name)
@@ -38,10 +82,8 @@ class ComponentRegistry:
         return load_eps(name)
 
     def list_missions(self) -> list[str]:
-        missions_dir = _DATA_DIR / "missions"
-        if not missions_dir.exists():
-            return []
-        return [p.stem for p in missions_dir.glob("*.yaml")]
+        # A missing directory globs to nothing
+        return self._list("missions")
 
 
 registry = ComponentRegistry()
@@ -2,15 +2,50 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+import numpy as np
 
-_ALLOWED_TRIGGERS = {"always", "sunlight", "eclipse", "scheduled"}
 _DEFAULT_SCHEDULE_PERIOD_S = 5400.0
+# Time samples per block when evaluating schedules in materialize(); keeps
+# the (block, modes) scratch matrix cache-sized for long grids
+_MATERIALIZE_BLOCK = 4096
+
+
+class TriggerKind(IntEnum):
+    """Integer codes for LoadMode triggers, resolved once per mode."""
+
+    ALWAYS = 0
+    SUNLIGHT = 1
+    ECLIPSE = 2
+    SCHEDULED = 3
+
 
+_TRIGGER_KINDS = {kind.name.lower(): kind for kind in TriggerKind}
+_ALLOWED_TRIGGERS = set(_TRIGGER_KINDS)
 
-@dataclass
+
+# Trigger activity indexed by [trigger code, in_eclipse]. Scheduled modes are
+# gated by their own timetable instead, so they never count as constant load.
+_TRIGGER_ACTIVE = np.array(
+    [
+        [True, True],  # ALWAYS
+        [True, False],  # SUNLIGHT
+        [False, True],  # ECLIPSE
+        [False, False],  # SCHEDULED
+    ]
+)
+
+
+@dataclass(frozen=True, slots=True)
 class LoadMode:
-    """A single operational mode with power consumption."""
+    """A single operational mode with power consumption.
+
+    Frozen: LoadProfile folds each mode into its cached power totals when
+    the mode is added, so changing a mode afterwards would not be seen.
+    Add a new mode to a fresh profile instead.
+    """
 
     name: str
     power_w: float
@@ -19,6 +54,16 @@ class LoadMode:
     priority: int = 0
     period_s: float = _DEFAULT_SCHEDULE_PERIOD_S
     phase_s: float = 0.0
+    # Integer form of ``trigger``, resolved once so per-step checks compare ints
+    kind: TriggerKind = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        kind = _TRIGGER_KINDS.get(self.trigger)
+        if kind is None:
+            raise ValueError(
+                f"trigger must be one of {_ALLOWED_TRIGGERS}, got {self.trigger!r}"
+            )
+        object.__setattr__(self, "kind", kind)
 
 
 class LoadProfile:
@@ -26,6 +71,25 @@ class LoadProfile:
 
     def __init__(self) -> None:
         self._modes: list[LoadMode] = []
+        # Bumped by add_mode() so derived views (e.g. ModeScheduler) can
+        # tell when to rebuild
+        self._version = 0
+        # Structure-of-arrays view of the modes, kept in sync by add_mode()
+        self._trigger_codes = np.empty(0, dtype=np.int8)
+        self._mean_powers = np.empty(0)
+        self._scheduled: list[LoadMode] = []
+        # Scheduled-mode timetable columns: power, duty cycle, period, phase
+        self._sched_power = np.empty(0)
+        self._sched_duty = np.empty(0)
+        self._sched_period = np.empty(0)
+        self._sched_phase = np.empty(0)
+        # Summed duty-averaged power of unscheduled modes: (sunlight, eclipse)
+        self._constant_power = (0.0, 0.0)
+        # Summed duty-averaged power of scheduled modes
+        self._scheduled_mean_power = 0.0
+        # (phase_s, period_s, duty_cycle, power_w) of scheduled modes that
+        # can ever be on, as plain floats for power_at()
+        self._schedule: list[tuple[float, float, float, float]] = []
 
     def add_mode(
         self,
@@ -49,23 +113,36 @@ class LoadProfile:
         """
         if not 0.0 <= duty_cycle <= 1.0:
             raise ValueError(f"duty_cycle must be in [0, 1], got {duty_cycle}")
-        if trigger not in _ALLOWED_TRIGGERS:
-            raise ValueError(
-                f"trigger must be one of {_ALLOWED_TRIGGERS}, got {trigger!r}"
-            )
         if period_s <= 0.0:
             raise ValueError(f"period_s must be > 0, got {period_s}")
-        self._modes.append(
-            LoadMode(
-                name=name,
-                power_w=power_w,
-                duty_cycle=duty_cycle,
-                trigger=trigger,
-                priority=priority,
-                period_s=period_s,
-                phase_s=phase_s,
-            )
+        mode = LoadMode(
+            name=name,
+            power_w=power_w,
+            duty_cycle=duty_cycle,
+            trigger=trigger,
+            priority=priority,
+            period_s=period_s,
+            phase_s=phase_s,
         )
+        self._modes.append(mode)
+        self._version += 1
+
+        code = mode.kind
+        if code == TriggerKind.SCHEDULED:
+            self._scheduled.append(mode)
+            self._sched_power = np.append(self._sched_power, power_w)
+            self._sched_duty = np.append(self._sched_duty, duty_cycle)
+            self._sched_period = np.append(self._sched_period, period_s)
+            self._sched_phase = np.append(self._sched_phase, phase_s)
+            self._scheduled_mean_power += power_w * duty_cycle
+            if duty_cycle > 0.0:
+                self._schedule.append(
+                    (float(phase_s), float(period_s), float(duty_cycle), float(power_w))
+                )
+        self._trigger_codes = np.append(self._trigger_codes, np.int8(code))
+        self._mean_powers = np.append(self._mean_powers, power_w * duty_cycle)
+        sunlit, eclipsed = self._mean_powers @ _TRIGGER_ACTIVE[self._trigger_codes]
+        self._constant_power = (float(sunlit), float(eclipsed))
 
     @staticmethod
     def _scheduled_active(mode: LoadMode, time: float) -> bool:
@@ -89,33 +166,99 @@ class LoadProfile:
         time : Time (seconds from epoch)
         in_eclipse : Whether satellite is in eclipse
         """
-        total = 0.0
-        for mode in self._modes:
-            if mode.trigger == "sunlight" and in_eclipse:
-                continue
-            if mode.trigger == "eclipse" and not in_eclipse:
-                continue
-            if mode.trigger == "scheduled":
-                if self._scheduled_active(mode, time):
-                    total += mode.power_w
-                continue
-            total += mode.power_w * mode.duty_cycle
+        total = self._constant_power[bool(in_eclipse)]
+        for phase_s, period_s, duty_cycle, power_w in self._schedule:
+            if ((time + phase_s) % period_s) / period_s < duty_cycle:
+                total += power_w
+        return total
+
+    def materialize(self, times: np.ndarray, eclipse: np.ndarray) -> np.ndarray:
+        """Total power consumption over a whole time grid.
+
+        Array counterpart of power_at(): unscheduled modes collapse to one
+        sunlight/eclipse lookup, and all scheduled modes are evaluated
+        against the time grid as a (samples, modes) phase matrix, built in
+        blocks of time samples in one reused scratch buffer.
+
+        Parameters
+        ----------
+        times : (N,) times (seconds from epoch)
+        eclipse : (N,) eclipse flags, or a single bool for all samples
+        """
+        times = np.asarray(times, dtype=float)
+        eclipse = np.broadcast_to(np.asarray(eclipse, dtype=bool), times.shape)
+        total = np.asarray(self._constant_power)[eclipse.astype(np.intp)]
+        if self._scheduled:
+            period = self._sched_period
+            n = times.shape[0]
+            scratch = np.empty((min(n, _MATERIALIZE_BLOCK), period.shape[0]))
+            for start in range(0, n, _MATERIALIZE_BLOCK):
+                block = times[start:start + _MATERIALIZE_BLOCK]
+                phase = scratch[: block.shape[0]]
+                np.add(block[:, np.newaxis], self._sched_phase, out=phase)
+                np.mod(phase, period, out=phase)
+                np.divide(phase, period, out=phase)
+                total[start:start + block.shape[0]] += (
+                    (phase < self._sched_duty) @ self._sched_power
+                )
         return total
 
     def active_modes(self, time: float, in_eclipse: bool = False) -> list[str]:
         """List of active mode names at given time."""
         active = []
         for mode in self._modes:
-            if mode.trigger == "sunlight" and in_eclipse:
+            kind = mode.kind
+            if kind == TriggerKind.SUNLIGHT and in_eclipse:
                 continue
-            if mode.trigger == "eclipse" and not in_eclipse:
+            if kind == TriggerKind.ECLIPSE and not in_eclipse:
                 continue
-            if mode.trigger == "scheduled" and not self._scheduled_active(mode, time):
+            if kind == TriggerKind.SCHEDULED and not self._scheduled_active(mode, time):
                 continue
             if mode.duty_cycle > 0:
                 active.append(mode.name)
         return active
 
+    def materialize_modes(
+        self, times: np.ndarray, eclipse: np.ndarray
+    ) -> list[str]:
+        """Comma-joined active mode names over a whole time grid.
+
+        Array counterpart of active_modes(): activity is evaluated as one
+        (samples, modes) boolean matrix, and each distinct row is joined
+        into a label once rather than once per sample.
+
+        Parameters
+        ----------
+        times : (N,) times (seconds from epoch)
+        eclipse : (N,) eclipse flags, or a single bool for all samples
+        """
+        times = np.asarray(times, dtype=float)
+        eclipse = np.broadcast_to(np.asarray(eclipse, dtype=bool), times.shape)
+        if not self._modes:
+            return [""] * times.shape[0]
+
+        # Trigger gating for every mode, then each scheduled column replaced
+        # by its timetable
+        active = _TRIGGER_ACTIVE[self._trigger_codes][:, eclipse.astype(np.intp)].T
+        scheduled = self._trigger_codes == TriggerKind.SCHEDULED
+        if self._scheduled:
+            phase = np.mod(times[:, np.newaxis] + self._sched_phase, self._sched_period)
+            active[:, scheduled] = phase / self._sched_period < self._sched_duty
+        active &= np.array([mode.duty_cycle > 0 for mode in self._modes])
+
+        # Encode each row as one integer (bit j = mode j) so the distinct
+        # activity patterns come from a 1-D unique
+        n_modes = active.shape[1]
+        if n_modes < 63:
+            keys = active @ (np.int64(1) << np.arange(n_modes, dtype=np.int64))
+            codes, inverse = np.unique(keys, return_inverse=True)
+            rows = (codes[:, np.newaxis] >> np.arange(n_modes)) & 1 == 1
+        else:
+            rows, inverse = np.unique(active, axis=0, return_inverse=True)
+        names = np.array([mode.name for mode in self._modes], dtype=object)
+        labels = np.array([",".join(names[row]) for row in rows], dtype=object)
+        return labels[inverse.ravel()].tolist()
+
     def orbit_average_power(self, eclipse_fraction: float) -> float:
         """Compute orbit-averaged power consumption.
 
@@ -123,16 +266,11 @@ class LoadProfile:
         ----------
         eclipse_fraction : Fraction of orbit in eclipse [0, 1]
         """
-        sunlight_fraction = 1.0 - eclipse_fraction
-
-        total = 0.0
-        for mode in self._modes:
-            if mode.trigger == "always":
-                total += mode.power_w * mode.duty_cycle
-            elif mode.trigger == "sunlight":
-                total += mode.power_w * mode.duty_cycle * sunlight_fraction
-            elif mode.trigger == "eclipse":
-                total += mode.power_w * mode.duty_cycle * eclipse_fraction
-            elif mode.trigger == "scheduled":
-                total += mode.power_w * mode.duty_cycle
-        return total
+        # Blend of the precomputed sunlit/eclipsed totals; scheduled modes
+        # contribute their duty-averaged power regardless of eclipse.
+        sunlit, eclipsed = self._constant_power
+        return (
+            sunlit
+            + (eclipsed - sunlit) * eclipse_fraction
+            + self._scheduled_mean_power
+        )
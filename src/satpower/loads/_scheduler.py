@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from satpower.loads._profile import LoadMode, LoadProfile
+from satpower.loads._profile import LoadMode, LoadProfile, TriggerKind
 
 
 class ModeScheduler:
@@ -20,13 +20,33 @@ class ModeScheduler:
 
     def __init__(self, profile: LoadProfile):
         self._profile = profile
+        self._version = -1
+        self._modes: list[LoadMode] = []
+        # Modes with duty > 0 grouped by priority (profile order within a
+        # level), levels sorted high to low
+        self._levels: list[tuple[int, list[LoadMode]]] = []
+        self._baseline: list[LoadMode] = []
+
+    def _refresh(self) -> None:
+        """Regroup modes by priority if the profile changed since last call."""
+        profile = self._profile
+        if self._version == profile._version:
+            return
+        self._modes = [m for m in profile.modes if m.duty_cycle > 0.0]
+        by_priority: dict[int, list[LoadMode]] = {}
+        for mode in self._modes:
+            by_priority.setdefault(mode.priority, []).append(mode)
+        self._levels = sorted(by_priority.items(), key=lambda kv: kv[0], reverse=True)
+        self._baseline = by_priority.get(0, [])
+        self._version = profile._version
 
     def _mode_active(self, mode: LoadMode, time: float, in_eclipse: bool) -> bool:
-        if mode.trigger == "sunlight" and in_eclipse:
+        kind = mode.kind
+        if kind == TriggerKind.SUNLIGHT and in_eclipse:
             return False
-        if mode.trigger == "eclipse" and not in_eclipse:
+        if kind == TriggerKind.ECLIPSE and not in_eclipse:
             return False
-        if mode.trigger == "scheduled":
+        if kind == TriggerKind.SCHEDULED:
             return self._profile._scheduled_active(mode, time)
         return True
 
@@ -36,25 +56,28 @@ class ModeScheduler:
         Returns all baseline (priority=0) modes whose triggers are satisfied,
         plus all modes at the single highest active priority level (override).
         """
-        active = [
-            m for m in self._profile.modes
-            if m.duty_cycle > 0.0 and self._mode_active(m, time, in_eclipse)
-        ]
-        if not active:
+        self._refresh()
+        # Highest priority level with an active mode; levels are visited
+        # high to low, so the first hit is the override
+        for priority, level in self._levels:
+            override = [m for m in level if self._mode_active(m, time, in_eclipse)]
+            if override:
+                break
+        else:
             return []
-        highest_priority = max(m.priority for m in active)
-        if highest_priority == 0:
-            # All modes are baseline — return them all
-            return active
-        baseline = [m for m in active if m.priority == 0]
-        override = [m for m in active if m.priority == highest_priority]
+        if priority == 0:
+            # All active modes are at or below baseline — return them all
+            return [m for m in self._modes if self._mode_active(m, time, in_eclipse)]
+        baseline = [
+            m for m in self._baseline if self._mode_active(m, time, in_eclipse)
+        ]
         return baseline + override
 
     def power_at(self, time: float, in_eclipse: bool = False) -> float:
         """Get total power consumption considering mode transitions."""
         total = 0.0
         for mode in self._active_priority_set(time, in_eclipse):
-            if mode.trigger == "scheduled":
+            if mode.kind == TriggerKind.SCHEDULED:
                 total += mode.power_w
             else:
                 total += mode.power_w * mode.duty_cycle
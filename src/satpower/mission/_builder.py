@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
+import numpy as np
 
+from satpower.data._loader import _load_yaml
 from satpower.mission._config import MissionConfig
 from satpower.orbit._propagator import Orbit
 from satpower.solar._panel import SolarPanel
@@ -15,6 +16,9 @@ from satpower.regulation._eps_board import EPSBoard
 from satpower.simulation._engine import Simulation
 from satpower.thermal._model import ThermalModel, ThermalConfig
 
+# Orbit array dtype for each OrbitConfig.precision setting
+_ORBIT_DTYPES = {"fp32": np.float32, "fp64": np.float64}
+
 
 def load_mission(path: str | Path) -> MissionConfig:
     """Load a mission configuration from a YAML file.
@@ -32,8 +36,7 @@ def load_mission(path: str | Path) -> MissionConfig:
         else:
             raise FileNotFoundError(f"Mission file not found: {path}")
 
-    with open(p) as f:
-        data = yaml.safe_load(f)
+    data = _load_yaml(p)
 
     # Merge satellite.loads into top-level loads if top-level is empty
     sat = data.get("satellite", {})
@@ -42,7 +45,7 @@ def load_mission(path: str | Path) -> MissionConfig:
     elif "loads" in sat:
         sat.pop("loads", None)
 
-    return MissionConfig(**data)
+    return MissionConfig.model_validate(data)
 
 
 def build_simulation(config: MissionConfig) -> Simulation:
@@ -53,6 +56,7 @@ def build_simulation(config: MissionConfig) -> Simulation:
         inclination_deg=config.orbit.inclination_deg,
         raan_deg=config.orbit.raan_deg,
         j2=config.orbit.j2,
+        dtype=_ORBIT_DTYPES[config.orbit.precision],
     )
 
     # Solar panels
@@ -90,6 +94,8 @@ def build_simulation(config: MissionConfig) -> Simulation:
             power_w=load.power_w,
             duty_cycle=load.duty_cycle,
             trigger=load.trigger,
+            period_s=load.period_s,
+            phase_s=load.phase_s,
         )
 
     # EPS board (optional)
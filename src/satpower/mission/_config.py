@@ -6,6 +6,13 @@ from typing import Literal
 
 from pydantic import BaseModel, Field
 
+# Choice types shared with the API request schemas (satpower.api._schemas)
+EclipseModelName = Literal["cylindrical", "conical"]
+FormFactor = Literal["1U", "3U", "6U"]
+LoadTrigger = Literal["always", "sunlight", "eclipse", "scheduled"]
+OrbitPrecision = Literal["fp32", "fp64"]
+WingCount = Literal[2, 4]
+
 
 class OrbitConfig(BaseModel):
     type: Literal["circular"] = "circular"
@@ -13,11 +20,12 @@ class OrbitConfig(BaseModel):
     inclination_deg: float = Field(ge=0.0, le=180.0)
     raan_deg: float = 0.0
     j2: bool = False
-    eclipse_model: Literal["cylindrical", "conical"] = "cylindrical"
+    eclipse_model: EclipseModelName = "cylindrical"
+    precision: OrbitPrecision = "fp64"
 
 
 class DeployedWingsConfig(BaseModel):
-    count: Literal[2, 4] = 2
+    count: WingCount = 2
     area_m2: float | None = Field(default=None, gt=0.0)
 
 
@@ -37,11 +45,14 @@ class LoadConfig(BaseModel):
     name: str
     power_w: float = Field(ge=0.0)
     duty_cycle: float = Field(default=1.0, ge=0.0, le=1.0)
-    trigger: Literal["always", "sunlight", "eclipse", "scheduled"] = "always"
+    trigger: LoadTrigger = "always"
+    # Timetable for trigger="scheduled": on for duty_cycle of each period
+    period_s: float = Field(default=5400.0, gt=0.0)
+    phase_s: float = 0.0
 
 
 class SatelliteConfig(BaseModel):
-    form_factor: Literal["1U", "3U", "6U"] = "3U"
+    form_factor: FormFactor = "3U"
     eps_board: str | None = None
     solar: SolarConfig
     battery: BatteryConfig
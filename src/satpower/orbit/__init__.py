@@ -1,7 +1,7 @@
 """Orbital environment — propagation, eclipse detection, environmental fluxes."""
 
 from satpower.orbit._propagator import Orbit, OrbitState
-from satpower.orbit._eclipse import EclipseModel, EclipseEvent
+from satpower.orbit._eclipse import EclipseModel, EclipseEvent, EclipseEvents
 from satpower.orbit._environment import OrbitalEnvironment
 from satpower.orbit._geometry import sun_vector, panel_incidence_angle
 
@@ -10,6 +10,7 @@ __all__ = [
     "OrbitState",
     "EclipseModel",
     "EclipseEvent",
+    "EclipseEvents",
     "OrbitalEnvironment",
     "sun_vector",
     "panel_incidence_angle",
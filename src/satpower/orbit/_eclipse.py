@@ -3,15 +3,50 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import ClassVar
 
 import numpy as np
 
-from satpower.orbit._propagator import R_EARTH
+from satpower.orbit._geometry import _diff_and_norm
+from satpower.orbit._propagator import Orbit, R_EARTH
 
 # Sun radius in meters
 R_SUN = 6.957e8
 
 
+def _as_position_arrays(
+    sat_pos: np.ndarray, sun_pos: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Satellite and Sun positions as float arrays of the satellite's dtype.
+
+    A float32 trajectory (see Orbit's ``dtype``) stays float32 rather than
+    being upcast; anything that is not floating point becomes float64.
+    """
+    sat_pos = np.asarray(sat_pos)
+    if sat_pos.dtype.kind != "f":
+        sat_pos = sat_pos.astype(float)
+    return sat_pos, np.asarray(sun_pos, dtype=sat_pos.dtype)
+
+
+def _cylindrical_shadow_single(sat_pos: np.ndarray, sun_pos: np.ndarray) -> float:
+    """Cylindrical shadow test for one (3,) position pair on Python floats.
+
+    Same test as the array path; per-step callers (the ODE right-hand side)
+    would otherwise pay NumPy call overhead many times over for ~20 flops.
+    """
+    s0, s1, s2 = np.asarray(sat_pos, dtype=float).tolist()
+    u0, u1, u2 = np.asarray(sun_pos, dtype=float).tolist()
+    d0, d1, d2 = u0 - s0, u1 - s1, u2 - s2
+    dot = s0 * d0 + s1 * d1 + s2 * d2
+    if dot >= 0.0:
+        return 0.0
+    to_sun_sq = d0 * d0 + d1 * d1 + d2 * d2
+    sat_sq = s0 * s0 + s1 * s1 + s2 * s2
+    if sat_sq - dot * dot / to_sun_sq < R_EARTH * R_EARTH:
+        return 1.0
+    return 0.0
+
+
 @dataclass
 class EclipseEvent:
     """An eclipse entry or exit event."""
@@ -20,6 +55,32 @@ class EclipseEvent:
     event_type: str  # "entry" or "exit"
 
 
+@dataclass
+class EclipseEvents:
+    """Eclipse entry/exit events as parallel arrays.
+
+    Array counterpart of a list of EclipseEvent, for long runs and
+    vectorized analysis, e.g. ``events.times[events.kinds == events.ENTRY]``.
+    """
+
+    ENTRY: ClassVar[int] = 0
+    EXIT: ClassVar[int] = 1
+
+    times: np.ndarray  # (K,) seconds from epoch
+    kinds: np.ndarray  # (K,) uint8, ENTRY or EXIT
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def as_list(self) -> list[EclipseEvent]:
+        """The same events as EclipseEvent objects."""
+        names = ("entry", "exit")
+        return [
+            EclipseEvent(time=float(t), event_type=names[k])
+            for t, k in zip(self.times, self.kinds)
+        ]
+
+
 class EclipseModel:
     """Eclipse detection using shadow models.
 
@@ -33,6 +94,17 @@ class EclipseModel:
                 f"Unknown eclipse method: {method!r}. Use 'cylindrical' or 'conical'."
             )
         self._method = method
+        # Bound once so shadow_fraction() does no per-call method lookup
+        self._shadow_impl = (
+            self._conical_shadow_fraction
+            if method == "conical"
+            else self._cylindrical_shadow_fraction
+        )
+
+    @property
+    def method(self) -> str:
+        """Shadow model name, ``"cylindrical"`` or ``"conical"``."""
+        return self._method
 
     def shadow_fraction(
         self, sat_pos: np.ndarray, sun_pos: np.ndarray
@@ -44,42 +116,32 @@ class EclipseModel:
         sat_pos : (3,) or (N, 3) satellite position in ECI (meters)
         sun_pos : (3,) or (N, 3) Sun position in ECI (meters)
         """
-        if self._method == "conical":
-            return self._conical_shadow_fraction(sat_pos, sun_pos)
-        return self._cylindrical_shadow_fraction(sat_pos, sun_pos)
+        return self._shadow_impl(sat_pos, sun_pos)
 
     def _cylindrical_shadow_fraction(
         self, sat_pos: np.ndarray, sun_pos: np.ndarray
     ) -> float | np.ndarray:
         """Cylindrical shadow model — sharp boundary, no penumbra."""
-        sat_pos = np.asarray(sat_pos, dtype=float)
-        sun_pos = np.asarray(sun_pos, dtype=float)
+        if np.ndim(sat_pos) == 1 and np.ndim(sun_pos) == 1:
+            return _cylindrical_shadow_single(sat_pos, sun_pos)
 
-        single = sat_pos.ndim == 1
-        if single:
-            sat_pos = sat_pos[np.newaxis, :]
-            sun_pos = sun_pos[np.newaxis, :]
+        sat_pos, sun_pos = _as_position_arrays(sat_pos, sun_pos)
 
-        # Unit vector from satellite to Sun
+        # Projection of the satellite position onto the satellite-to-Sun
+        # direction, kept unnormalized: proj = dot / |to_sun|
         to_sun = sun_pos - sat_pos
-        to_sun_norm = np.linalg.norm(to_sun, axis=-1, keepdims=True)
-        to_sun_hat = to_sun / to_sun_norm
+        to_sun_sq = np.einsum("ij,ij->i", to_sun, to_sun)
+        dot = np.einsum("ij,ij->i", sat_pos, to_sun)
 
-        # Project satellite position onto Sun direction
-        proj = np.sum(sat_pos * to_sun_hat, axis=-1)
-
-        # Distance from satellite to the Earth-Sun line
-        rejection = sat_pos - proj[:, np.newaxis] * to_sun_hat
-        dist_from_axis = np.linalg.norm(rejection, axis=-1)
+        # Squared distance from the Earth-Sun line: |r|² - proj²
+        sat_sq = np.einsum("ij,ij->i", sat_pos, sat_pos)
+        dist_from_axis_sq = sat_sq - dot * dot / to_sun_sq
 
         # In shadow if: satellite is behind Earth (proj < 0) AND
         # distance from shadow axis < Earth radius
-        in_shadow = (proj < 0) & (dist_from_axis < R_EARTH)
+        in_shadow = (dot < 0) & (dist_from_axis_sq < R_EARTH * R_EARTH)
 
-        result = np.where(in_shadow, 1.0, 0.0)
-        if single:
-            return float(result[0])
-        return result
+        return np.where(in_shadow, 1.0, 0.0)
 
     def _conical_shadow_fraction(
         self, sat_pos: np.ndarray, sun_pos: np.ndarray
@@ -88,8 +150,7 @@ class EclipseModel:
 
         Uses angular overlap between Sun and Earth disks as seen from satellite.
         """
-        sat_pos = np.asarray(sat_pos, dtype=float)
-        sun_pos = np.asarray(sun_pos, dtype=float)
+        sat_pos, sun_pos = _as_position_arrays(sat_pos, sun_pos)
 
         single = sat_pos.ndim == 1
         if single:
@@ -98,42 +159,113 @@ class EclipseModel:
 
         # Vectors from satellite to Earth center and Sun center
         to_earth = -sat_pos  # Earth is at origin
-        to_sun = sun_pos - sat_pos
-
-        d_earth = np.linalg.norm(to_earth, axis=-1)
-        d_sun = np.linalg.norm(to_sun, axis=-1)
-
-        # Angular radii of Earth and Sun as seen from satellite
-        theta_earth = np.arcsin(np.clip(R_EARTH / d_earth, 0.0, 1.0))
-        theta_sun = np.arcsin(np.clip(R_SUN / d_sun, 0.0, 1.0))
-
-        # Angular separation between Earth center and Sun center
-        to_earth_hat = to_earth / d_earth[:, np.newaxis]
-        to_sun_hat = to_sun / d_sun[:, np.newaxis]
-        cos_sep = np.sum(to_earth_hat * to_sun_hat, axis=-1)
-        theta_sep = np.arccos(np.clip(cos_sep, -1.0, 1.0))
+        to_sun, d_sun = _diff_and_norm(sat_pos, sun_pos)
+        d_earth = np.sqrt(np.einsum("ij,ij->i", to_earth, to_earth))
+
+        # Sines/cosines of the angular radii of Earth and Sun as seen from
+        # the satellite, and cosine of the Earth-Sun center separation
+        sin_earth = np.clip(R_EARTH / d_earth, 0.0, 1.0)
+        sin_sun = np.clip(R_SUN / d_sun, 0.0, 1.0)
+        cos_earth = np.sqrt(1.0 - sin_earth * sin_earth)
+        cos_sun = np.sqrt(1.0 - sin_sun * sin_sun)
+        cos_sep = np.clip(
+            np.einsum("ij,ij->i", to_earth, to_sun) / (d_earth * d_sun), -1.0, 1.0
+        )
 
         # Shadow classification
         # Full sun: separation >= earth_angular_radius + sun_angular_radius
         # Full umbra: separation <= earth_angular_radius - sun_angular_radius
         # Penumbra: linear ramp between
+        # Both bounds are compared in cosine space (cos is decreasing on
+        # [0, π]), so only penumbra samples need the inverse trig functions.
         result = np.zeros(len(sat_pos))
 
-        full_sun = theta_sep >= (theta_earth + theta_sun)
-        full_shadow = theta_sep <= (theta_earth - theta_sun)
+        full_sun = cos_sep <= cos_earth * cos_sun - sin_earth * sin_sun
+        full_shadow = (sin_earth >= sin_sun) & (
+            cos_sep >= cos_earth * cos_sun + sin_earth * sin_sun
+        )
         penumbra = ~full_sun & ~full_shadow
 
         result[full_shadow] = 1.0
         # Linear interpolation through penumbra
         if np.any(penumbra):
-            pen_range = 2.0 * theta_sun[penumbra]
-            pen_pos = (theta_earth[penumbra] + theta_sun[penumbra]) - theta_sep[penumbra]
+            theta_earth = np.arcsin(sin_earth[penumbra])
+            theta_sun = np.arcsin(sin_sun[penumbra])
+            theta_sep = np.arccos(cos_sep[penumbra])
+            pen_range = 2.0 * theta_sun
+            pen_pos = (theta_earth + theta_sun) - theta_sep
             result[penumbra] = np.clip(pen_pos / pen_range, 0.0, 1.0)
 
         if single:
             return float(result[0])
         return result
 
+    def precompute(
+        self, orbit: Orbit, sun_vec: np.ndarray, time: float = 0.0
+    ) -> tuple[float, float]:
+        """Eclipse interval of a circular orbit in anomaly space.
+
+        Solves the cylindrical shadow conditions (r·ŝ < 0 and
+        |r - (r·ŝ)ŝ| < R_earth) analytically for a fixed Sun direction.
+        Anomalies are measured like ``orbit.mean_motion * t``, i.e. from the
+        ascending node, with the orbital plane taken at ``time``.
+
+        Parameters
+        ----------
+        orbit : circular Orbit
+        sun_vec : (3,) Sun direction (or position) in ECI
+        time : epoch (s) at which the orbital plane is evaluated
+
+        Returns
+        -------
+        (nu_enter, nu_exit) in [0, 2π); both NaN when the orbit never
+        enters the shadow cylinder (high beta angle).
+        """
+        s_hat = np.asarray(sun_vec, dtype=float)
+        s_hat = s_hat / np.linalg.norm(s_hat)
+
+        # In-plane basis: P toward ascending node, Q 90° ahead of it
+        state = orbit.propagate(np.array([time]))
+        a = orbit.semi_major_axis
+        theta = time * 2.0 * np.pi / orbit.period
+        r_hat = state.position[0] / a
+        v_hat = state.velocity[0] / np.linalg.norm(state.velocity[0])
+        p_hat = np.cos(theta) * r_hat - np.sin(theta) * v_hat
+        q_hat = np.sin(theta) * r_hat + np.cos(theta) * v_hat
+
+        # r·ŝ = a * amp * cos(nu - phi)
+        ps = float(np.dot(p_hat, s_hat))
+        qs = float(np.dot(q_hat, s_hat))
+        amp = np.hypot(ps, qs)
+        phi = np.arctan2(qs, ps)
+
+        # Shadow when cos(nu - phi) < -sqrt(1 - (R/a)²) / amp
+        threshold = np.sqrt(1.0 - (R_EARTH / a) ** 2)
+        if amp <= threshold:
+            return float("nan"), float("nan")
+
+        half_width = np.arccos(threshold / amp)
+        center = phi + np.pi
+        two_pi = 2.0 * np.pi
+        return (
+            float((center - half_width) % two_pi),
+            float((center + half_width) % two_pi),
+        )
+
+    @staticmethod
+    def in_eclipse_array(
+        nu: np.ndarray, interval: tuple[float, float]
+    ) -> np.ndarray:
+        """Branchless eclipse membership for anomalies ``nu`` (rad).
+
+        ``interval`` is the ``(nu_enter, nu_exit)`` pair from precompute();
+        wrap-around through 0 is handled with modular arithmetic.
+        """
+        nu_enter, nu_exit = interval
+        two_pi = 2.0 * np.pi
+        nu = np.asarray(nu, dtype=float)
+        return ((nu - nu_enter) % two_pi) <= ((nu_exit - nu_enter) % two_pi)
+
     def find_transitions(
         self,
         sat_positions: np.ndarray,
@@ -141,18 +273,42 @@ class EclipseModel:
         times: np.ndarray,
         threshold: float = 0.5,
     ) -> list[EclipseEvent]:
-        """Find eclipse entry/exit events by threshold crossing."""
-        fractions = self.shadow_fraction(sat_positions, sun_positions)
-        events = []
-
-        for i in range(1, len(fractions)):
-            prev_in = fractions[i - 1] >= threshold
-            curr_in = fractions[i] >= threshold
-            if not prev_in and curr_in:
-                t_event = 0.5 * (times[i - 1] + times[i])
-                events.append(EclipseEvent(time=t_event, event_type="entry"))
-            elif prev_in and not curr_in:
-                t_event = 0.5 * (times[i - 1] + times[i])
-                events.append(EclipseEvent(time=t_event, event_type="exit"))
-
-        return events
+        """Find eclipse entry/exit events by threshold crossing.
+
+        See find_transition_arrays(), which this wraps, for the timing of
+        events.
+        """
+        return self.find_transition_arrays(
+            sat_positions, sun_positions, times, threshold
+        ).as_list()
+
+    def find_transition_arrays(
+        self,
+        sat_positions: np.ndarray,
+        sun_positions: np.ndarray,
+        times: np.ndarray,
+        threshold: float = 0.5,
+    ) -> EclipseEvents:
+        """Find eclipse entry/exit events by threshold crossing, as arrays.
+
+        Event times are linearly interpolated between the two samples that
+        straddle ``threshold``. The conical model's penumbra ramp thus places
+        events well inside the sample spacing; with the cylindrical model
+        (fractions of exactly 0 or 1) the default threshold gives the
+        midpoint of the pair.
+        """
+        fractions = np.atleast_1d(self.shadow_fraction(sat_positions, sun_positions))
+        times = np.asarray(times, dtype=float)
+
+        # +1 where the threshold is crossed into shadow, -1 out of it
+        crossing = np.diff((fractions >= threshold).view(np.int8))
+        idx = np.flatnonzero(crossing)
+        f0 = fractions[idx]
+        t0 = times[idx]
+        weight = (threshold - f0) / (fractions[idx + 1] - f0)
+        t_event = t0 + weight * (times[idx + 1] - t0)
+
+        kinds = np.where(
+            crossing[idx] > 0, EclipseEvents.ENTRY, EclipseEvents.EXIT
+        ).astype(np.uint8)
+        return EclipseEvents(times=t_event, kinds=kinds)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 from satpower.orbit._propagator import R_EARTH
@@ -15,6 +17,10 @@ EARTH_ALBEDO = 0.30
 # Earth average IR emission (W/m^2 at surface)
 EARTH_IR_EMISSION = 237.0
 
+# Obliquity of the ecliptic (23.44°)
+_COS_OBLIQUITY = math.cos(math.radians(23.44))
+_SIN_OBLIQUITY = math.sin(math.radians(23.44))
+
 
 class OrbitalEnvironment:
     """Orbital environmental fluxes: solar, albedo, Earth IR."""
@@ -63,15 +69,19 @@ class OrbitalEnvironment:
 
     def beta_angle(
         self,
-        inclination_rad: float,
-        raan_rad: float,
-        sun_ecliptic_lon_rad: float,
-    ) -> float:
+        inclination_rad: float | np.ndarray,
+        raan_rad: float | np.ndarray,
+        sun_ecliptic_lon_rad: float | np.ndarray,
+    ) -> float | np.ndarray:
         """Beta angle — angle between orbital plane and Sun vector (radians).
 
         The beta angle determines eclipse duration and thermal environment.
         Higher |beta| = shorter eclipses (or none if |beta| > ~70° for LEO).
 
+        Arguments may be scalars or arrays, broadcast against each other
+        (e.g. a year of Sun longitudes, or a sweep over RAAN); array inputs
+        give an array result.
+
         Parameters
         ----------
         inclination_rad : Orbit inclination
@@ -79,18 +89,20 @@ class OrbitalEnvironment:
         sun_ecliptic_lon_rad : Sun ecliptic longitude (varies over the year)
         """
         # Sun direction in ECI (simplified: Sun in ecliptic plane)
-        obliquity = np.radians(23.44)
+        sin_lon = np.sin(sun_ecliptic_lon_rad)
         sun_x = np.cos(sun_ecliptic_lon_rad)
-        sun_y = np.sin(sun_ecliptic_lon_rad) * np.cos(obliquity)
-        sun_z = np.sin(sun_ecliptic_lon_rad) * np.sin(obliquity)
-        sun_hat = np.array([sun_x, sun_y, sun_z])
+        sun_y = sin_lon * _COS_OBLIQUITY
+        sun_z = sin_lon * _SIN_OBLIQUITY
 
         # Orbital plane normal (from RAAN and inclination)
-        h_x = np.sin(raan_rad) * np.sin(inclination_rad)
-        h_y = -np.cos(raan_rad) * np.sin(inclination_rad)
+        sin_inc = np.sin(inclination_rad)
+        h_x = np.sin(raan_rad) * sin_inc
+        h_y = -np.cos(raan_rad) * sin_inc
         h_z = np.cos(inclination_rad)
-        h_hat = np.array([h_x, h_y, h_z])
 
-        # Beta angle = arcsin(dot(sun_hat, h_hat))
-        sin_beta = np.dot(sun_hat, h_hat)
-        return np.arcsin(np.clip(sin_beta, -1.0, 1.0))
+        # Beta angle = arcsin(dot(sun_hat, h_hat)), one dot per element
+        sin_beta = sun_x * h_x + sun_y * h_y + sun_z * h_z
+        beta = np.arcsin(np.clip(sin_beta, -1.0, 1.0))
+        if np.ndim(beta):
+            return beta
+        return float(beta)
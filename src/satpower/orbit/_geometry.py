@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
 # Mean Earth-Sun distance (meters)
 AU_METERS = 1.496e11
 
+# Obliquity of the ecliptic (23.44°), folded into the Sun's y/z amplitudes
+_SUN_Y_SCALE = AU_METERS * math.cos(math.radians(23.44))
+_SUN_Z_SCALE = AU_METERS * math.sin(math.radians(23.44))
+
 
 def sun_position_eci(time_s: float | np.ndarray, epoch_day_of_year: float = 80.0) -> np.ndarray:
     """Approximate Sun position in ECI frame (meters).
@@ -32,14 +38,11 @@ def sun_position_eci(time_s: float | np.ndarray, epoch_day_of_year: float = 80.0
     total_days = epoch_day_of_year + days
     sun_lon = 2.0 * np.pi * (total_days - 80.0) / 365.25  # 0 at vernal equinox
 
-    # Obliquity of ecliptic
-    obliquity = np.radians(23.44)
-
-    x = AU_METERS * np.cos(sun_lon)
-    y = AU_METERS * np.sin(sun_lon) * np.cos(obliquity)
-    z = AU_METERS * np.sin(sun_lon) * np.sin(obliquity)
-
-    result = np.column_stack([x, y, z])
+    sin_lon = np.sin(sun_lon)
+    result = np.empty((time_s.size, 3))
+    np.multiply(np.cos(sun_lon), AU_METERS, out=result[:, 0])
+    np.multiply(sin_lon, _SUN_Y_SCALE, out=result[:, 1])
+    np.multiply(sin_lon, _SUN_Z_SCALE, out=result[:, 2])
     if scalar:
         return result[0]
     return result
@@ -57,9 +60,19 @@ def sun_vector(sat_pos: np.ndarray, sun_pos: np.ndarray) -> np.ndarray:
     -------
     (3,) or (N, 3) unit vector toward Sun
     """
-    diff = np.asarray(sun_pos) - np.asarray(sat_pos)
-    norm = np.linalg.norm(diff, axis=-1, keepdims=True)
-    return diff / norm
+    diff, norm = _diff_and_norm(sat_pos, sun_pos)
+    return diff / norm[..., np.newaxis]
+
+
+def _diff_and_norm(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Vector(s) ``b - a`` and their lengths, for callers needing both.
+
+    Returns
+    -------
+    (3,) or (N, 3) difference and () or (N,) Euclidean norm
+    """
+    diff = np.asarray(b) - np.asarray(a)
+    return diff, np.sqrt(np.einsum("...i,...i->...", diff, diff))
 
 
 def panel_incidence_angle(panel_normal: np.ndarray, sun_dir: np.ndarray) -> float | np.ndarray:
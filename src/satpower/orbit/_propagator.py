@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 
 import numpy as np
+import numpy.typing as npt
 
 # Earth constants
 MU_EARTH = 3.986004418e14  # m^3/s^2
@@ -40,13 +42,17 @@ class Orbit:
         inclination_rad: float,
         raan_rad: float = 0.0,
         j2: bool = False,
+        dtype: npt.DTypeLike = np.float64,
     ):
+        self._dtype = np.dtype(dtype)
+        if self._dtype.kind != "f":
+            raise ValueError(f"Orbit dtype must be a floating type, got {self._dtype}")
         self._altitude_m = altitude_m
         self._inclination_rad = inclination_rad
         self._raan_rad = raan_rad
+        self._j2 = j2
         self._semi_major_axis = R_EARTH + altitude_m
         self._mean_motion = np.sqrt(MU_EARTH / self._semi_major_axis**3)  # rad/s
-        self._j2 = j2
 
         # J2 RAAN drift rate: dΩ/dt = -1.5 * n * J2 * (R_E/a)² * cos(i)
         if j2:
@@ -60,6 +66,25 @@ class Orbit:
         else:
             self._raan_rate = 0.0
 
+        # Time-invariant trig terms, hoisted out of propagate()
+        self._cos_inc = np.cos(inclination_rad)
+        self._sin_inc = np.sin(inclination_rad)
+        # Perifocal basis vectors P (ascending node) and Q (90° ahead in-plane)
+        # as rows in ECI; constant when the RAAN does not drift.
+        cos_raan = np.cos(raan_rad)
+        sin_raan = np.sin(raan_rad)
+        self._perifocal_basis = np.array([
+            [cos_raan, sin_raan, 0.0],
+            [-sin_raan * self._cos_inc, cos_raan * self._cos_inc, self._sin_inc],
+        ])
+        # [cos θ, sin θ] maps onto position via a·[P; Q] and onto velocity
+        # via a·n·[Q; -P]
+        p_hat, q_hat = self._perifocal_basis
+        self._position_basis = self._semi_major_axis * self._perifocal_basis
+        self._velocity_basis = (self._semi_major_axis * self._mean_motion) * np.array(
+            [q_hat, -p_hat]
+        )
+
     @classmethod
     def circular(
         cls,
@@ -67,6 +92,7 @@ class Orbit:
         inclination_deg: float,
         raan_deg: float = 0.0,
         j2: bool = False,
+        dtype: npt.DTypeLike = np.float64,
     ) -> Orbit:
         """Create a circular orbit from altitude (km) and inclination (deg)."""
         return cls(
@@ -74,6 +100,7 @@ class Orbit:
             inclination_rad=np.radians(inclination_deg),
             raan_rad=np.radians(raan_deg),
             j2=j2,
+            dtype=dtype,
         )
 
     @property
@@ -93,11 +120,83 @@ class Orbit:
     def inclination_deg(self) -> float:
         return np.degrees(self._inclination_rad)
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating dtype of the position/velocity arrays from propagate()."""
+        return self._dtype
+
     @property
     def semi_major_axis(self) -> float:
         """Semi-major axis in meters."""
         return self._semi_major_axis
 
+    def eclipse_fraction(self, sun_vec: np.ndarray) -> float:
+        """Analytic fraction of the orbit spent in Earth's shadow.
+
+        Closed form for the cylindrical shadow model with a fixed Sun
+        direction, using the orbital plane at epoch:
+
+            f = acos(sqrt(1 - (R_E/a)²) / cos(β)) / π
+
+        where β is the beta angle; 0 when |β| is too large for an eclipse.
+
+        Parameters
+        ----------
+        sun_vec : (3,) Sun direction (or position) in ECI
+        """
+        s_hat = np.asarray(sun_vec, dtype=float)
+        s_hat = s_hat / np.linalg.norm(s_hat)
+        p_hat, q_hat = self._perifocal_basis
+        cos_beta = float(np.hypot(np.dot(p_hat, s_hat), np.dot(q_hat, s_hat)))
+
+        threshold = np.sqrt(1.0 - (R_EARTH / self._semi_major_axis) ** 2)
+        if cos_beta <= threshold:
+            return 0.0
+        return float(np.arccos(threshold / cos_beta) / np.pi)
+
+    def state_at(self, t: float) -> tuple[np.ndarray, np.ndarray]:
+        """Position and velocity (ECI, m and m/s) at a single time ``t`` (s).
+
+        Scalar counterpart of propagate() for per-step callers such as the
+        ODE right-hand side: the trig is done with ``math`` on floats and
+        only the two (3,) results are allocated.
+        """
+        theta = self._mean_motion * t
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+
+        if self._raan_rate == 0.0:
+            p_pos, q_pos = self._position_basis
+            p_vel, q_vel = self._velocity_basis
+            return (
+                cos_theta * p_pos + sin_theta * q_pos,
+                cos_theta * p_vel + sin_theta * q_vel,
+            )
+
+        raan = self._raan_rad + self._raan_rate * t
+        cos_raan = math.cos(raan)
+        sin_raan = math.sin(raan)
+        a = self._semi_major_axis
+        v = a * self._mean_motion
+        cos_inc = self._cos_inc
+        sin_inc = self._sin_inc
+
+        x_orb = a * cos_theta
+        y_inc = a * cos_inc * sin_theta
+        vx_orb = -v * sin_theta
+        vy_inc = v * cos_inc * cos_theta
+        position = np.array([
+            cos_raan * x_orb - sin_raan * y_inc,
+            sin_raan * x_orb + cos_raan * y_inc,
+            a * sin_inc * sin_theta,
+        ])
+        velocity = np.array([
+            cos_raan * vx_orb - sin_raan * vy_inc,
+            sin_raan * vx_orb + cos_raan * vy_inc,
+            v * sin_inc * cos_theta,
+        ])
+        return position, velocity
+
     def propagate(self, times: np.ndarray) -> OrbitState:
         """Propagate orbit to given times (seconds from epoch).
 
@@ -105,43 +204,52 @@ class Orbit:
         - Circular orbit (constant radius)
         - RAAN and inclination define the orbital plane
         - Satellite starts at ascending node at t=0
+
+        Angles are always formed in float64; the trig results and the
+        returned state arrays use the orbit's ``dtype``. float32 halves the
+        memory traffic of long trajectories at metre-level position error.
         """
         times = np.asarray(times, dtype=float)
         a = self._semi_major_axis
         n = self._mean_motion
-        inc = self._inclination_rad
-
-        # RAAN: static or drifting with J2
-        raan = self._raan_rad + self._raan_rate * times
 
-        # True anomaly (= mean anomaly for circular orbit)
+        # True anomaly (= mean anomaly for circular orbit). Both trig passes
+        # write into one (2, N) buffer, so the fixed-plane products below
+        # read it directly instead of stacking copies of the columns.
         theta = n * times
+        trig = np.empty((2, times.size), dtype=self._dtype)
+        cos_theta = np.cos(theta, out=trig[0])
+        sin_theta = np.sin(theta, out=trig[1])
 
-        # Position in orbital plane
-        x_orb = a * np.cos(theta)
-        y_orb = a * np.sin(theta)
+        if self._raan_rate == 0.0:
+            # Fixed orbital plane: one (N, 2) @ (2, 3) product per quantity
+            position = trig.T @ self._position_basis.astype(self._dtype, copy=False)
+            velocity = trig.T @ self._velocity_basis.astype(self._dtype, copy=False)
+            return OrbitState(time=times, position=position, velocity=velocity)
 
-        # Rotation to ECI: R_z(-RAAN) @ R_x(-inc) @ [x_orb, y_orb, 0]
+        # RAAN drifting with J2: rotate per sample
+        raan = self._raan_rad + self._raan_rate * times
         cos_raan = np.cos(raan)
-        sin_raan = np.sin(raan)
-        cos_inc = np.cos(inc)
-        sin_inc = np.sin(inc)
-
-        x_eci = cos_raan * x_orb - sin_raan * cos_inc * y_orb
-        y_eci = sin_raan * x_orb + cos_raan * cos_inc * y_orb
-        z_eci = sin_inc * y_orb
+        sin_raan = np.sin(raan, out=raan)
+        cos_inc = self._cos_inc
+        sin_inc = self._sin_inc
+
+        # Rotation to ECI: R_z(-RAAN) @ R_x(-inc) @ [x_orb, y_orb, 0], with
+        # the inclination folded into the scalar factors and each component
+        # written straight into the (N, 3) outputs
+        position = np.empty((times.size, 3), dtype=self._dtype)
+        x_orb = a * cos_theta
+        y_inc = (a * cos_inc) * sin_theta
+        position[:, 0] = cos_raan * x_orb - sin_raan * y_inc
+        position[:, 1] = sin_raan * x_orb + cos_raan * y_inc
+        np.multiply(sin_theta, a * sin_inc, out=position[:, 2])
 
-        position = np.column_stack([x_eci, y_eci, z_eci])
-
-        # Velocity in orbital plane
         v = a * n
-        vx_orb = -v * np.sin(theta)
-        vy_orb = v * np.cos(theta)
-
-        vx_eci = cos_raan * vx_orb - sin_raan * cos_inc * vy_orb
-        vy_eci = sin_raan * vx_orb + cos_raan * cos_inc * vy_orb
-        vz_eci = sin_inc * vy_orb
-
-        velocity = np.column_stack([vx_eci, vy_eci, vz_eci])
+        velocity = np.empty((times.size, 3), dtype=self._dtype)
+        vx_orb = -v * sin_theta
+        vy_inc = (v * cos_inc) * cos_theta
+        velocity[:, 0] = cos_raan * vx_orb - sin_raan * vy_inc
+        velocity[:, 1] = sin_raan * vx_orb + cos_raan * vy_inc
+        np.multiply(cos_theta, v * sin_inc, out=velocity[:, 2])
 
         return OrbitState(time=times, position=position, velocity=velocity)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from satpower.regulation._converter import DcDcConverter
 
 
@@ -31,10 +33,10 @@ class PowerBus:
 
     def net_battery_current(
         self,
-        solar_power: float,
-        load_power: float,
-        battery_voltage: float,
-    ) -> float:
+        solar_power: float | np.ndarray,
+        load_power: float | np.ndarray,
+        battery_voltage: float | np.ndarray,
+    ) -> float | np.ndarray:
         """Compute net current flowing into/out of battery.
 
         Positive = discharge (load > solar), negative = charge (solar > load).
@@ -42,12 +44,22 @@ class PowerBus:
         - Discharge: battery must supply load_power / efficiency
         - Charge: battery receives excess solar * efficiency
 
+        Accepts scalars or (N,) arrays; array inputs are evaluated in one
+        vectorized pass (e.g. over a whole solved trajectory).
+
         Parameters
         ----------
         solar_power : Total solar array power (W)
         load_power : Total load power demand (W)
         battery_voltage : Current battery terminal voltage (V)
         """
+        if np.ndim(solar_power) or np.ndim(load_power) or np.ndim(battery_voltage):
+            return self._net_battery_current_array(
+                np.asarray(solar_power, dtype=float),
+                np.asarray(load_power, dtype=float),
+                np.asarray(battery_voltage, dtype=float),
+            )
+
         if battery_voltage <= 0:
             return 0.0
 
@@ -70,3 +82,21 @@ class PowerBus:
             battery_power = net_power_bus
 
         return battery_power / battery_voltage
+
+    def _net_battery_current_array(
+        self,
+        solar_power: np.ndarray,
+        load_power: np.ndarray,
+        battery_voltage: np.ndarray,
+    ) -> np.ndarray:
+        """Vectorized net_battery_current() — the sign split becomes np.where."""
+        discharge_eff = self._converter.efficiency_for_discharge(load_power)
+        charge_eff = self._converter.efficiency_for_charge(solar_power)
+        net_power_bus = load_power - solar_power * charge_eff
+
+        battery_power = np.where(
+            net_power_bus > 0, net_power_bus / discharge_eff, net_power_bus
+        )
+        valid = battery_voltage > 0
+        safe_voltage = np.where(valid, battery_voltage, 1.0)
+        return np.where(valid, battery_power / safe_voltage, 0.0)
@@ -2,8 +2,20 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
+# Efficiency lookup table: samples over [0, _LUT_MAX_LOAD_FRACTION * rated power]
+_LUT_POINTS = 256
+_LUT_MAX_LOAD_FRACTION = 2.0
+
+# Load-dependent efficiency curve, in load fraction x = P / rated power:
+# rise rate of 1 - exp(-k x), droop knee, and quadratic droop coefficient
+_RISE_RATE = 6.0
+_DROOP_KNEE = 0.5
+_DROOP_COEFF = 0.15
+
 
 class DcDcConverter:
     """DC-DC converter with efficiency model.
@@ -30,6 +42,19 @@ class DcDcConverter:
         self._peak_efficiency = peak_efficiency
         self._light_load_efficiency = light_load_efficiency
 
+        # Tabulate the load-dependent curve once; lookups are then np.interp
+        if load_dependent and rated_power_w > 0:
+            self._lut_load_w = np.linspace(
+                0.0, _LUT_MAX_LOAD_FRACTION * rated_power_w, _LUT_POINTS
+            )
+            self._lut_efficiency = self._efficiency_curve(self._lut_load_w)
+            # Plain-float copy and knot spacing for the scalar lookup
+            self._lut_list = self._lut_efficiency.tolist()
+            self._lut_step_w = float(self._lut_load_w[1])
+        else:
+            self._lut_load_w = None
+            self._lut_efficiency = None
+
     @property
     def efficiency(self) -> float:
         return self._efficiency
@@ -38,7 +63,24 @@ class DcDcConverter:
     def name(self) -> str:
         return self._name
 
-    def efficiency_at_load(self, load_power_w: float) -> float:
+    def _efficiency_curve(self, load_power_w: np.ndarray) -> np.ndarray:
+        """Analytical load-dependent efficiency curve (array in, array out)."""
+        load_power_w = np.asarray(load_power_w, dtype=float)
+        x = load_power_w / self._rated_power_w
+
+        # Model: peak at x ≈ 0.5, with droop at high and low loads
+        # Uses a quadratic-in-log model: eff = peak - a*(ln(x) - ln(0.5))^2
+        # Simplified approach: rise with 1-exp, then droop above 0.5
+        eta_range = self._peak_efficiency - self._light_load_efficiency
+        # Rise: saturates quickly, reaching ~98% of range at x=0.5
+        rise = 1.0 - np.exp(-_RISE_RATE * x)
+        # Droop above 50% load: quadratic droop
+        droop = _DROOP_COEFF * eta_range * np.maximum(0.0, x - _DROOP_KNEE) ** 2
+        eff = self._light_load_efficiency + eta_range * rise - droop
+        eff = np.clip(eff, self._light_load_efficiency, self._peak_efficiency)
+        return np.where(load_power_w > 0, eff, self._light_load_efficiency)
+
+    def efficiency_at_load(self, load_power_w: float | np.ndarray) -> float | np.ndarray:
         """Return converter efficiency at a given load power.
 
         When load_dependent is False, returns the constant efficiency.
@@ -46,25 +88,52 @@ class DcDcConverter:
         - Low efficiency at light loads (switching losses dominate)
         - Peak efficiency at ~50% rated load
         - Mild droop above ~80% rated load (conduction losses)
+
+        The load-dependent curve is read from a lookup table built at
+        construction (linear interpolation); loads beyond the table range
+        fall back to the analytical curve. Accepts scalars or arrays.
         """
         if not self._load_dependent:
             return self._efficiency
 
-        if self._rated_power_w <= 0 or load_power_w <= 0:
+        if self._rated_power_w <= 0:
+            if np.ndim(load_power_w):
+                return np.full(np.shape(load_power_w), self._light_load_efficiency)
             return self._light_load_efficiency
 
-        x = load_power_w / self._rated_power_w
+        if not np.ndim(load_power_w):
+            return self._efficiency_at_load_scalar(float(load_power_w))
 
-        # Model: peak at x ≈ 0.5, with droop at high and low loads
-        # Uses a quadratic-in-log model: eff = peak - a*(ln(x) - ln(0.5))^2
-        # Simplified approach: rise with 1-exp, then droop above 0.5
-        eta_range = self._peak_efficiency - self._light_load_efficiency
-        # Rise: saturates quickly, reaching ~98% of range at x=0.5
-        rise = 1.0 - np.exp(-6.0 * x)
-        # Droop above 50% load: quadratic droop
-        droop = 0.15 * eta_range * max(0.0, x - 0.5) ** 2
-        eff = self._light_load_efficiency + eta_range * rise - droop
-        return float(np.clip(eff, self._light_load_efficiency, self._peak_efficiency))
+        load = np.asarray(load_power_w, dtype=float)
+        eff = np.interp(load, self._lut_load_w, self._lut_efficiency)
+        beyond = load > self._lut_load_w[-1]
+        if np.any(beyond):
+            # Analytical curve only for the out-of-table samples
+            eff[beyond] = self._efficiency_curve(load[beyond])
+        return eff
+
+    def _efficiency_at_load_scalar(self, load_power_w: float) -> float:
+        """Scalar efficiency_at_load() for the load-dependent model.
+
+        The table knots are uniformly spaced, so the segment index comes
+        from one division instead of a search; loads beyond the table use
+        the analytical curve with math.exp and a min/max clamp.
+        """
+        lut = self._lut_list
+        x = load_power_w / self._lut_step_w
+        if x <= 0.0:
+            return lut[0]
+        if x >= len(lut) - 1:
+            if load_power_w <= self._lut_load_w[-1]:
+                return lut[-1]
+            x = load_power_w / self._rated_power_w
+            eta_range = self._peak_efficiency - self._light_load_efficiency
+            rise = 1.0 - math.exp(-_RISE_RATE * x)
+            droop = _DROOP_COEFF * eta_range * max(0.0, x - _DROOP_KNEE) ** 2
+            eff = self._light_load_efficiency + eta_range * rise - droop
+            return min(max(eff, self._light_load_efficiency), self._peak_efficiency)
+        i = int(x)
+        return lut[i] + (x - i) * (lut[i + 1] - lut[i])
 
     def efficiency_for_discharge(self, load_power_w: float) -> float:
         """Efficiency for battery -> bus path."""
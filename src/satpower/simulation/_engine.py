@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
-from scipy.integrate import solve_ivp
 
 from satpower.orbit._propagator import Orbit, R_EARTH
 from satpower.orbit._eclipse import EclipseModel
 from satpower.orbit._environment import OrbitalEnvironment
 from satpower.orbit._geometry import sun_position_eci, sun_vector
-from satpower.solar._panel import SolarPanel
+from satpower.solar._panel import SolarPanel, _PanelArray
 from satpower.solar._mppt import MpptModel
 from satpower.battery._pack import BatteryPack
 from satpower.battery._soc import CoulombCounter
@@ -18,6 +19,26 @@ from satpower.regulation._bus import PowerBus
 from satpower.regulation._eps_board import EPSBoard
 from satpower.simulation._results import SimulationResults
 
+# Longest run (s) over which the Sun direction is treated as fixed for the
+# analytic eclipse fraction (~1°/day of Sun motion)
+_ANALYTIC_ECLIPSE_MAX_DURATION_S = 86400.0
+
+# Relative tolerance on the orbit count for a run to span whole orbits
+_WHOLE_ORBITS_RTOL = 1e-9
+
+# Knot spacing (s) of the Sun ephemeris table used inside the ODE right-hand
+# side; the Sun moves ~0.04° per hour, so linear interpolation is exact to
+# well below the model's own accuracy.
+_SUN_LUT_STEP_S = 3600.0
+
+# Adaptive output grid: half-width (s) of the window around each analytic
+# eclipse transition, and how much finer than dt_max it is sampled there
+_ECLIPSE_REFINE_WINDOW_S = 120.0
+_ECLIPSE_REFINE_FACTOR = 10
+
+# solve_ivp methods that use a Jacobian
+_IMPLICIT_METHODS = frozenset({"Radau", "BDF", "LSODA"})
+
 # Default panel temperature (K) — used when thermal model is disabled
 _DEFAULT_PANEL_TEMP_K = 301.15  # ~28°C (standard test conditions)
 _DEFAULT_BATTERY_TEMP_K = 298.15  # ~25°C
@@ -33,26 +54,79 @@ def _nadir_rotation_matrix(sat_pos: np.ndarray, sat_vel: np.ndarray) -> np.ndarr
 
     Parameters
     ----------
-    sat_pos : (3,) satellite position in ECI
-    sat_vel : (3,) satellite velocity in ECI
+    sat_pos : (3,) or (N, 3) satellite position in ECI
+    sat_vel : (3,) or (N, 3) satellite velocity in ECI
 
     Returns
     -------
-    (3, 3) rotation matrix R such that v_body = R @ v_eci
+    (3, 3) or (N, 3, 3) rotation matrix R such that v_body = R @ v_eci
     """
+    if np.ndim(sat_pos) == 1:
+        return _nadir_rotation_matrix_single(sat_pos, sat_vel)
+
     # Z_body = -r_hat (toward Earth)
-    z_body = -sat_pos / np.linalg.norm(sat_pos)
+    z_body = -sat_pos / np.linalg.norm(sat_pos, axis=-1, keepdims=True)
 
     # Y_body = orbit normal = -(r x v) / |r x v|  (negative so X ends up in ram direction)
     h = np.cross(sat_pos, sat_vel)
-    y_body = -h / np.linalg.norm(h)
+    y_body = -h / np.linalg.norm(h, axis=-1, keepdims=True)
 
     # X_body = Y x Z (completes right-hand frame, roughly along velocity)
     x_body = np.cross(y_body, z_body)
-    x_body = x_body / np.linalg.norm(x_body)
+    x_body = x_body / np.linalg.norm(x_body, axis=-1, keepdims=True)
 
     # Rotation matrix: rows are body axes expressed in ECI
-    return np.array([x_body, y_body, z_body])
+    return np.stack([x_body, y_body, z_body], axis=-2)
+
+
+def _nadir_rotation_matrix_single(
+    sat_pos: np.ndarray, sat_vel: np.ndarray
+) -> np.ndarray:
+    """(3, 3) specialisation of _nadir_rotation_matrix for one sample.
+
+    Called once per ODE right-hand-side evaluation; plain float arithmetic
+    avoids the per-call overhead of np.cross / np.linalg.norm on 3-vectors.
+    """
+    rx, ry, rz = float(sat_pos[0]), float(sat_pos[1]), float(sat_pos[2])
+    vx, vy, vz = float(sat_vel[0]), float(sat_vel[1]), float(sat_vel[2])
+
+    r = math.sqrt(rx * rx + ry * ry + rz * rz)
+    zx, zy, zz = -rx / r, -ry / r, -rz / r
+
+    hx, hy, hz = ry * vz - rz * vy, rz * vx - rx * vz, rx * vy - ry * vx
+    h = math.sqrt(hx * hx + hy * hy + hz * hz)
+    yx, yy, yz = -hx / h, -hy / h, -hz / h
+
+    xx, xy, xz = yy * zz - yz * zy, yz * zx - yx * zz, yx * zy - yy * zx
+    x = math.sqrt(xx * xx + xy * xy + xz * xz)
+
+    return np.array([
+        [xx / x, xy / x, xz / x],
+        [yx, yy, yz],
+        [zx, zy, zz],
+    ])
+
+
+def _refined_time_grid(
+    t_end: float, dt_max: float, transitions: np.ndarray
+) -> np.ndarray:
+    """Output grid at dt_max, refined to dt_max / 10 around eclipse transitions.
+
+    Parameters
+    ----------
+    t_end : end of the run (s)
+    dt_max : coarse spacing away from transitions (s)
+    transitions : (K,) eclipse entry/exit times (s)
+    """
+    coarse = np.linspace(0.0, t_end, max(int(np.ceil(t_end / dt_max)) + 1, 2))
+    if len(transitions) == 0:
+        return coarse
+
+    dt_fine = dt_max / _ECLIPSE_REFINE_FACTOR
+    offsets = np.arange(-_ECLIPSE_REFINE_WINDOW_S, _ECLIPSE_REFINE_WINDOW_S, dt_fine)
+    fine = (np.asarray(transitions, dtype=float)[:, np.newaxis] + offsets).ravel()
+    fine = fine[(fine > 0.0) & (fine < t_end)]
+    return np.unique(np.concatenate([coarse, fine]))
 
 
 class Simulation:
@@ -103,13 +177,221 @@ class Simulation:
         self._thermal_model = thermal_model
         self._thermal_enabled = thermal_model is not None
 
+        # Per-run scratch reused across run() calls: the Sun ephemeris table
+        # (grown to the longest window seen) and the output time grid.
+        self._sun_lut: np.ndarray | None = None
+        self._t_eval: np.ndarray | None = None
+        # Last _time_terms() result, keyed on (t, T_panel); reset per run
+        self._time_terms_cache: tuple | None = None
+
+        # Stacked panel normals and cell counts for the solar-power sums
+        self._panel_array = _PanelArray(self._panels)
+
         # Precompute total panel area for thermal model
         self._total_panel_area = sum(p.area_m2 for p in panels) if panels else 0.0
+        # Area-weighted fraction of the panels facing nadir (body +Z); fixed
+        # for a nadir-pointing attitude
+        if self._total_panel_area > 0.0:
+            nadir_axis_body = np.array([0.0, 0.0, 1.0])
+            self._earth_view_factor = sum(
+                p.area_m2 * max(float(np.dot(p.normal, nadir_axis_body)), 0.0)
+                for p in panels
+            ) / self._total_panel_area
+        else:
+            self._earth_view_factor = 0.0
+
+    @property
+    def loads(self) -> LoadProfile:
+        """Load profile driven by this simulation."""
+        return self._loads
+
+    @property
+    def battery(self) -> BatteryPack:
+        """Battery pack integrated by this simulation."""
+        return self._battery
+
+    @property
+    def panels(self) -> list[SolarPanel]:
+        """Solar panels illuminated by this simulation."""
+        return list(self._panels)
+
+    @property
+    def eps_board(self) -> EPSBoard | None:
+        """EPS board the simulation was configured with, if any."""
+        return self._eps_board
 
     def set_capacity_scale(self, scale: float) -> None:
         """Scale effective battery capacity for aging studies."""
         self._capacity_scale = float(np.clip(scale, 1e-6, 1.0))
 
+    def _build_sun_lut(self, t_end: float) -> None:
+        """Tabulate the Sun position over [0, t_end] at _SUN_LUT_STEP_S knots.
+
+        An existing table that already covers the window is kept as is.
+        """
+        n_knots = int(np.ceil(t_end / _SUN_LUT_STEP_S)) + 2
+        if self._sun_lut is not None and len(self._sun_lut) >= n_knots:
+            return
+        knots = np.arange(n_knots) * _SUN_LUT_STEP_S
+        self._sun_lut = sun_position_eci(knots, self._epoch_doy)
+
+    def _sun_position(self, t: float) -> np.ndarray:
+        """Sun position in ECI at time t, interpolated from the run's table."""
+        lut = self._sun_lut
+        if lut is None:
+            return sun_position_eci(t, self._epoch_doy)
+        x = t / _SUN_LUT_STEP_S
+        i = min(max(int(x), 0), len(lut) - 2)
+        frac = x - i
+        return lut[i] + frac * (lut[i + 1] - lut[i])
+
+    def _geometry_at(
+        self, t: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """Satellite position/velocity, Sun position and shadow fraction at t.
+
+        Single-time path used by the ODE right-hand side: the orbit state
+        comes from Orbit.state_at() rather than a one-sample propagate(),
+        and the Sun from the run's interpolation table.
+        """
+        sat_pos, sat_vel = self._orbit.state_at(t)
+        sun_pos = self._sun_position(t)
+        shadow = self._eclipse_model.shadow_fraction(sat_pos, sun_pos)
+        return sat_pos, sat_vel, sun_pos, shadow
+
+    def _time_terms(
+        self, t: float, t_panel: float
+    ) -> tuple[float, float, float, float]:
+        """RHS inputs that depend only on time (and panel temperature).
+
+        Returns shadow fraction, solar power, load power and absorbed panel
+        heat (zero when the thermal model is off). Implicit solvers evaluate
+        the RHS once per Jacobian column at an unchanged t, so the last
+        result is kept and reused while (t, t_panel) stays the same.
+        """
+        cached = self._time_terms_cache
+        if cached is not None and cached[0] == t and cached[1] == t_panel:
+            return cached[2]
+
+        sat_pos, sat_vel, sun_pos, shadow = self._geometry_at(t)
+        # One attitude rotation serves both the electrical and thermal terms
+        sun_dir_body = (
+            self._sun_direction_body(sat_pos, sat_vel, sun_pos)
+            if shadow < 1.0 else None
+        )
+        solar_power = self._compute_solar_power(
+            sat_pos, sat_vel, sun_pos, shadow, t, t_panel, sun_dir_body
+        )
+        load_power = self._loads.power_at(t, shadow >= 0.5)
+        solar_absorbed = (
+            self._compute_solar_absorbed_heat(
+                sat_pos, sat_vel, sun_pos, shadow, t, t_panel, sun_dir_body
+            )
+            if self._thermal_enabled else 0.0
+        )
+        terms = (shadow, solar_power, load_power, solar_absorbed)
+        self._time_terms_cache = (t, t_panel, terms)
+        return terms
+
+    def _eclipse_transition_times(self, t_end: float) -> np.ndarray:
+        """Analytic eclipse entry/exit times over [0, t_end] (s).
+
+        Uses EclipseModel.precompute() with the Sun direction and orbital
+        plane refreshed every _ANALYTIC_ECLIPSE_MAX_DURATION_S. Requires the
+        Sun table for the run to be built.
+        """
+        n = 2.0 * np.pi / self._orbit.period
+        two_pi = 2.0 * np.pi
+        times = []
+        for start in np.arange(0.0, t_end, _ANALYTIC_ECLIPSE_MAX_DURATION_S):
+            stop = min(start + _ANALYTIC_ECLIPSE_MAX_DURATION_S, t_end)
+            mid = 0.5 * (start + stop)
+            interval = self._eclipse_model.precompute(
+                self._orbit, self._sun_position(mid), time=mid
+            )
+            if np.isnan(interval[0]):
+                continue
+            for nu in interval:
+                k = np.arange(
+                    np.ceil((n * start - nu) / two_pi),
+                    np.floor((n * stop - nu) / two_pi) + 1,
+                )
+                times.append((nu + two_pi * k) / n)
+        if not times:
+            return np.empty(0)
+        return np.sort(np.concatenate(times))
+
+    def _integrate(
+        self,
+        y0: np.ndarray,
+        t_eval: np.ndarray,
+        breakpoints: np.ndarray,
+        dt_max: float,
+        method: str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Integrate the state over t_eval, restarting the solver at breakpoints.
+
+        Restarting at eclipse transitions keeps the solver from stepping
+        across the discontinuity in solar power.
+
+        Returns
+        -------
+        (times, states) with states of shape (n_states, len(times))
+        """
+        # scipy.integrate imported here to keep package import light
+        from scipy.integrate import solve_ivp
+
+        # Implicit methods take the analytic Jacobian; explicit ones warn on it
+        options = {}
+        if method in _IMPLICIT_METHODS and not self._thermal_enabled:
+            options["jac"] = self._jac
+
+        t_end = float(t_eval[-1])
+        edges = np.concatenate([
+            [0.0], breakpoints[(breakpoints > 0.0) & (breakpoints < t_end)], [t_end]
+        ])
+        times, states = [], []
+        y = y0
+        for t0, t1 in zip(edges[:-1], edges[1:]):
+            last = t1 == t_end
+            # Each segment also evaluates its end point to seed the next one
+            seg = t_eval[(t_eval >= t0) & ((t_eval <= t1) if last else (t_eval < t1))]
+            if not last or len(seg) == 0 or seg[-1] != t1:
+                seg = np.append(seg, t1)
+            sol = solve_ivp(
+                self._rhs,
+                (t0, t1),
+                y,
+                method=method,
+                t_eval=seg,
+                max_step=dt_max,
+                rtol=1e-6,
+                atol=1e-8,
+                **options,
+            )
+            if not sol.success:
+                raise RuntimeError(f"ODE solver failed: {sol.message}")
+            y = sol.y[:, -1]
+            keep = len(sol.t) if last else len(sol.t) - 1
+            times.append(sol.t[:keep])
+            states.append(sol.y[:, :keep])
+
+        return np.concatenate(times), np.hstack(states)
+
+    @staticmethod
+    def _sun_direction_body(
+        sat_pos: np.ndarray, sat_vel: np.ndarray, sun_pos: np.ndarray
+    ) -> np.ndarray:
+        """Unit vector toward the Sun in the nadir-pointing body frame.
+
+        Single sample or (N, 3) batch, as for _nadir_rotation_matrix().
+        """
+        sun_dir_eci = sun_vector(sat_pos, sun_pos)
+        r_eci_to_body = _nadir_rotation_matrix(sat_pos, sat_vel)
+        if np.ndim(sat_pos) == 1:
+            return r_eci_to_body @ sun_dir_eci
+        return np.einsum("nij,nj->ni", r_eci_to_body, sun_dir_eci)
+
     def _compute_solar_power(
         self,
         sat_pos: np.ndarray,
@@ -118,28 +400,27 @@ class Simulation:
         shadow_frac: float,
         t: float = 0.0,
         panel_temp_k: float = _DEFAULT_PANEL_TEMP_K,
+        sun_dir_body: np.ndarray | None = None,
     ) -> float:
-        """Compute total solar array power at a single timestep."""
+        """Compute total solar array power at a single timestep.
+
+        sun_dir_body, if given, is the precomputed body-frame Sun direction
+        for this sample (see _sun_direction_body()).
+        """
         if shadow_frac >= 1.0:
             return 0.0
 
-        # Sun direction in ECI
-        sun_dir_eci = sun_vector(sat_pos, sun_pos)
-
-        # Rotate Sun direction to body frame (nadir-pointing attitude)
-        r_eci_to_body = _nadir_rotation_matrix(sat_pos, sat_vel)
-        sun_dir_body = r_eci_to_body @ sun_dir_eci
+        if sun_dir_body is None:
+            sun_dir_body = self._sun_direction_body(sat_pos, sat_vel, sun_pos)
 
         current_doy = self._epoch_doy + t / 86400.0
         irradiance = self._environment.solar_flux_at_epoch(current_doy) * (1.0 - shadow_frac)
 
         if self._mppt_model is not None and self._mppt_model._power_dependent:
             # Two-pass: first compute raw power, then apply power-dependent MPPT
-            raw_power = 0.0
-            for panel in self._panels:
-                raw_power += panel.power(
-                    sun_dir_body, irradiance, panel_temp_k, 1.0
-                )
+            raw_power = self._panel_array.power(
+                sun_dir_body, irradiance, panel_temp_k, 1.0
+            )
             mppt_eff = self._mppt_model.tracking_efficiency(panel_power=raw_power)
             return raw_power * mppt_eff
 
@@ -147,12 +428,49 @@ class Simulation:
             self._mppt_model.efficiency if self._mppt_model is not None
             else self._mppt_efficiency
         )
-        total_power = 0.0
-        for panel in self._panels:
-            total_power += panel.power(
-                sun_dir_body, irradiance, panel_temp_k, mppt_eff
-            )
+        return self._panel_array.power(
+            sun_dir_body, irradiance, panel_temp_k, mppt_eff
+        )
+
+    def _compute_solar_power_series(
+        self,
+        positions: np.ndarray,
+        velocities: np.ndarray,
+        sun_positions: np.ndarray,
+        shadow: np.ndarray,
+        times: np.ndarray,
+        panel_temp_k: float | np.ndarray = _DEFAULT_PANEL_TEMP_K,
+    ) -> np.ndarray:
+        """Compute total solar array power for (N,) timesteps in one pass.
+
+        Array counterpart of _compute_solar_power(); inputs are (N, 3)
+        positions/velocities/Sun positions and (N,) shadow fractions.
+        """
+        sun_dir_body = self._sun_direction_body(positions, velocities, sun_positions)
+
+        current_doy = self._epoch_doy + times / 86400.0
+        irradiance = self._environment.solar_flux_at_epoch(current_doy) * np.clip(
+            1.0 - shadow, 0.0, 1.0
+        )
+
+        power_dependent = (
+            self._mppt_model is not None and self._mppt_model._power_dependent
+        )
+        if power_dependent:
+            mppt_eff = 1.0
+        elif self._mppt_model is not None:
+            mppt_eff = self._mppt_model.efficiency
+        else:
+            mppt_eff = self._mppt_efficiency
 
+        total_power = self._panel_array.power(
+            sun_dir_body, irradiance, panel_temp_k, mppt_eff
+        )
+
+        if power_dependent:
+            total_power = total_power * self._mppt_model.tracking_efficiency(
+                panel_power=total_power
+            )
         return total_power
 
     def _compute_solar_absorbed_heat(
@@ -163,10 +481,12 @@ class Simulation:
         shadow_frac: float,
         t: float,
         panel_temp_k: float,
+        sun_dir_body: np.ndarray | None = None,
     ) -> float:
         """Compute solar heat absorbed by panels (not converted to electricity).
 
-        Returns absorbed solar thermal power in watts.
+        Returns absorbed solar thermal power in watts. sun_dir_body is as
+        for _compute_solar_power().
         """
         if shadow_frac >= 1.0:
             return 0.0
@@ -177,9 +497,8 @@ class Simulation:
         if self._total_panel_area <= 0.0:
             return 0.0
 
-        sun_dir_eci = sun_vector(sat_pos, sun_pos)
-        r_eci_to_body = _nadir_rotation_matrix(sat_pos, sat_vel)
-        sun_dir_body = r_eci_to_body @ sun_dir_eci
+        if sun_dir_body is None:
+            sun_dir_body = self._sun_direction_body(sat_pos, sat_vel, sun_pos)
 
         alpha = self._thermal_model.config.panel_absorptance if self._thermal_model else 0.91
 
@@ -209,54 +528,42 @@ class Simulation:
             t_battery = _DEFAULT_BATTERY_TEMP_K
 
         # Clamp SoC for intermediate calculations
-        soc_clamped = np.clip(soc, 0.0, 1.0)
-
-        # Orbit state at time t
-        orbit_state = self._orbit.propagate(np.array([t]))
-        sat_pos = orbit_state.position[0]
-        sat_vel = orbit_state.velocity[0]
+        soc_clamped = min(max(soc, 0.0), 1.0)
 
-        # Sun position
-        sun_pos = sun_position_eci(t, self._epoch_doy)
-
-        # Eclipse
-        shadow = self._eclipse_model.shadow_fraction(sat_pos, sun_pos)
-        in_eclipse = shadow >= 0.5
-
-        # Solar power (using dynamic panel temperature if thermal enabled)
-        solar_power = self._compute_solar_power(
-            sat_pos, sat_vel, sun_pos, shadow, t, t_panel
+        # Shadow, solar power and panel heating (at the panel temperature)
+        # and load power
+        shadow, solar_power, load_power, solar_absorbed = self._time_terms(
+            t, t_panel
         )
 
-        # Load power
-        load_power = self._loads.power_at(t, in_eclipse)
+        # Pack terminal voltage as a function of current. OCV and R0 depend
+        # only on SoC and temperature, so they are looked up once per call
+        # and reused for the no-load estimate and the loaded correction.
+        cell = self._battery.cell
+        ocv = cell.ocv(soc_clamped)
+        r0 = cell.internal_resistance(soc_clamped, t_battery)
+        n_series = self._battery.n_series
+        inv_n_parallel = 1.0 / self._battery.n_parallel
 
-        # Battery voltage (use OCV estimate for current computation)
-        battery_voltage = self._battery.terminal_voltage(
-            soc_clamped, 0.0, t_battery, v_rc1, v_rc2
-        )
+        def pack_voltage(current: float) -> float:
+            return (ocv - current * inv_n_parallel * r0 - v_rc1 - v_rc2) * n_series
 
-        # Battery current from power balance
+        # Battery current from power balance (OCV estimate first)
         battery_current = self._bus.net_battery_current(
-            solar_power, load_power, battery_voltage
+            solar_power, load_power, pack_voltage(0.0)
         )
 
         # Iterative correction: recompute voltage with estimated current
-        battery_voltage_loaded = self._battery.terminal_voltage(
-            soc_clamped, battery_current, t_battery, v_rc1, v_rc2
-        )
+        battery_voltage_loaded = pack_voltage(battery_current)
         if battery_voltage_loaded > 0:
             battery_current = self._bus.net_battery_current(
                 solar_power, load_power, battery_voltage_loaded
             )
 
         # Apply current and voltage safety limits from battery datasheet.
-        battery_current = float(
-            np.clip(
-                battery_current,
-                -self._battery.max_charge_current_a,
-                self._battery.max_discharge_current_a,
-            )
+        battery_current = min(
+            max(battery_current, -self._battery.max_charge_current_a),
+            self._battery.max_discharge_current_a,
         )
 
         # State derivatives
@@ -276,18 +583,7 @@ class Simulation:
 
         # Thermal derivatives
         altitude_m = self._orbit.altitude_m
-        solar_absorbed = self._compute_solar_absorbed_heat(
-            sat_pos, sat_vel, sun_pos, shadow, t, t_panel
-        )
-        if self._total_panel_area > 0.0:
-            nadir_axis_body = np.array([0.0, 0.0, 1.0])
-            earth_view = sum(
-                p.area_m2 * max(float(np.dot(p.normal, nadir_axis_body)), 0.0)
-                for p in self._panels
-            ) / self._total_panel_area
-        else:
-            earth_view = 0.0
-
+        earth_view = self._earth_view_factor
         albedo_flux = self._environment.earth_albedo_flux(altitude_m) * earth_view * (1.0 - shadow)
         earth_ir_flux = self._environment.earth_ir_flux(altitude_m) * earth_view
 
@@ -296,20 +592,82 @@ class Simulation:
         )
 
         # Battery Joule heating: I²R
-        r_cell = self._battery.cell.internal_resistance(soc_clamped, t_battery)
-        r_pack = r_cell * self._battery.n_series / self._battery.n_parallel
+        r_pack = r0 * n_series / self._battery.n_parallel
         joule_heat = battery_current**2 * r_pack
 
         dt_battery = self._thermal_model.battery_derivatives(t_battery, joule_heat)
 
         return np.array([dsoc_dt, dv_rc1_dt, dv_rc2_dt, dt_panel, dt_battery])
 
+    def _jac(self, t: float, state: np.ndarray) -> np.ndarray:
+        """Analytic Jacobian of _rhs() for the state [SoC, V_rc1, V_rc2].
+
+        Solar and load power do not depend on the state, so the coupling is
+        through the battery current I = P / V alone, with V from the same
+        two-pass terminal-voltage estimate as _rhs() (the no-load voltage
+        depends on SoC via the OCV slope and on both RC voltages). The RC
+        rows are linear in I and in their own voltage. Thermal states are
+        not covered; those runs use finite differences.
+        """
+        soc, v_rc1, v_rc2 = state
+        soc_clamped = min(max(soc, 0.0), 1.0)
+        _, solar_power, load_power, _ = self._time_terms(t, _DEFAULT_PANEL_TEMP_K)
+
+        cell = self._battery.cell
+        n_series = self._battery.n_series
+        r_pack = (
+            cell.internal_resistance(soc_clamped, _DEFAULT_BATTERY_TEMP_K)
+            * n_series / self._battery.n_parallel
+        )
+
+        # dI/dV0, with V0 the no-load pack voltage
+        v0 = (cell.ocv(soc_clamped) - v_rc1 - v_rc2) * n_series
+        i0 = self._bus.net_battery_current(solar_power, load_power, v0)
+        v1 = v0 - i0 * r_pack
+        if v0 <= 0:
+            current, di_dv0 = 0.0, 0.0
+        elif v1 > 0:
+            current = self._bus.net_battery_current(solar_power, load_power, v1)
+            di_dv0 = -current / v1 * (1.0 + i0 * r_pack / v0)
+        else:
+            current, di_dv0 = i0, -i0 / v0
+        if not (
+            -self._battery.max_charge_current_a
+            < current
+            < self._battery.max_discharge_current_a
+        ):
+            di_dv0 = 0.0
+
+        dv0_dx = np.array([
+            n_series * cell.ocv_slope(soc_clamped) if 0.0 < soc < 1.0 else 0.0,
+            -n_series,
+            -n_series,
+        ])
+        di_dx = di_dv0 * dv0_dx
+
+        effective_capacity_ah = self._battery.capacity_ah * self._capacity_scale
+        jac = np.zeros((3, 3))
+        dsoc_dt = CoulombCounter.dsoc_dt(current, effective_capacity_ah)
+        # Rows frozen by the SoC bounds in _rhs() stay zero
+        if not ((soc >= 1.0 and dsoc_dt > 0) or (soc <= 0.0 and dsoc_dt < 0)):
+            jac[0] = CoulombCounter.dsoc_dt(di_dx, effective_capacity_ah)
+
+        # Battery RC derivatives are linear: unit current and unit voltages
+        drc_di = self._battery.derivatives(1.0, 0.0, 0.0)
+        drc_dv = self._battery.derivatives(0.0, 1.0, 1.0)
+        jac[1] = drc_di[0] * di_dx
+        jac[2] = drc_di[1] * di_dx
+        jac[1, 1] += drc_dv[0]
+        jac[2, 2] += drc_dv[1]
+        return jac
+
     def run(
         self,
         duration_orbits: float | None = None,
         duration_s: float | None = None,
         dt_max: float = 30.0,
         method: str = "RK45",
+        adaptive: bool = False,
     ) -> SimulationResults:
         """Run the simulation.
 
@@ -318,7 +676,15 @@ class Simulation:
         duration_orbits : Simulation duration in orbital periods
         duration_s : Simulation duration in seconds (overrides duration_orbits)
         dt_max : Maximum timestep (seconds)
-        method : ODE solver method ('RK45', 'BDF', etc.)
+        method : ODE solver method ('RK45', 'BDF', etc.). The implicit
+            methods ('BDF', 'Radau', 'LSODA') get an analytic Jacobian of
+            the electrical state when the thermal model is off; 'BDF' is
+            then the fastest choice. 'LSODA' stalls once SoC is clamped
+            at full charge.
+        adaptive : Sample outputs at dt_max only away from eclipse
+            transitions and at dt_max / 10 within ±2 min of them, restarting
+            the solver at each transition. Lets a much coarser dt_max keep
+            the accuracy of a fine uniform grid.
         """
         if duration_s is not None:
             t_end = duration_s
@@ -337,78 +703,93 @@ class Simulation:
         else:
             y0 = np.array([self._initial_soc, 0.0, 0.0])
 
-        # Time evaluation points (for dense output)
-        n_points = max(int(t_end / dt_max) + 1, 100)
-        t_eval = np.linspace(0, t_end, n_points)
-
-        # Solve ODE
-        sol = solve_ivp(
-            self._rhs,
-            (0, t_end),
-            y0,
-            method=method,
-            t_eval=t_eval,
-            max_step=dt_max,
-            rtol=1e-6,
-            atol=1e-8,
-        )
+        self._build_sun_lut(t_end)
+        self._time_terms_cache = None
 
-        if not sol.success:
-            raise RuntimeError(f"ODE solver failed: {sol.message}")
+        if adaptive:
+            # Non-uniform output grid, refined around analytic eclipse edges
+            transitions = self._eclipse_transition_times(t_end)
+            t_eval = _refined_time_grid(t_end, dt_max, transitions)
+        else:
+            # Time evaluation points (for dense output)
+            transitions = np.empty(0)
+            n_points = max(int(t_end / dt_max) + 1, 100)
+            t_eval = self._t_eval
+            if t_eval is None or len(t_eval) != n_points or t_eval[-1] != t_end:
+                t_eval = self._t_eval = np.linspace(0, t_end, n_points)
+
+        times, states = self._integrate(y0, t_eval, transitions, dt_max, method)
 
         # Extract results and compute auxiliary quantities
-        times = sol.t
-        soc = np.clip(sol.y[0], 0.0, 1.0)
-        v_rc1 = sol.y[1]
-        v_rc2 = sol.y[2]
+        soc = np.clip(states[0], 0.0, 1.0)
+        v_rc1 = states[1]
+        v_rc2 = states[2]
 
         if self._thermal_enabled:
-            panel_temperature = sol.y[3]
-            battery_temperature = sol.y[4]
+            panel_temperature = states[3]
+            battery_temperature = states[4]
         else:
             panel_temperature = None
             battery_temperature = None
 
-        # Recompute auxiliary arrays
-        n = len(times)
-        power_generated = np.zeros(n)
-        power_consumed = np.zeros(n)
-        battery_voltage = np.zeros(n)
-        eclipse = np.zeros(n, dtype=bool)
-        modes = []
-
-        for i, t in enumerate(times):
-            orbit_state = self._orbit.propagate(np.array([t]))
-            sat_pos = orbit_state.position[0]
-            sat_vel = orbit_state.velocity[0]
-            sun_pos = sun_position_eci(t, self._epoch_doy)
-
-            shadow = self._eclipse_model.shadow_fraction(sat_pos, sun_pos)
-            in_ecl = shadow > 0.0
-            eclipse[i] = in_ecl
-
-            t_panel = panel_temperature[i] if panel_temperature is not None else _DEFAULT_PANEL_TEMP_K
-            t_bat = battery_temperature[i] if battery_temperature is not None else _DEFAULT_BATTERY_TEMP_K
-
-            power_generated[i] = self._compute_solar_power(
-                sat_pos, sat_vel, sun_pos, shadow, t, t_panel
-            )
-            power_consumed[i] = self._loads.power_at(t, in_ecl)
+        # Recompute auxiliary arrays — geometry and solar power in one pass
+        orbit_states = self._orbit.propagate(times)
+        sun_positions = sun_position_eci(times, self._epoch_doy)
+        shadow = np.atleast_1d(
+            self._eclipse_model.shadow_fraction(orbit_states.position, sun_positions)
+        )
+        eclipse = shadow > 0.0
 
-            # Compute battery current for voltage under load
-            v_ocv = self._battery.terminal_voltage(
-                soc[i], 0.0, t_bat, v_rc1[i], v_rc2[i]
-            )
-            i_bat = self._bus.net_battery_current(
-                power_generated[i], power_consumed[i], v_ocv
-            )
-            battery_voltage[i] = self._battery.terminal_voltage(
-                soc[i], i_bat, t_bat, v_rc1[i], v_rc2[i]
-            )
+        t_panel = (
+            panel_temperature if panel_temperature is not None else _DEFAULT_PANEL_TEMP_K
+        )
+        power_generated = self._compute_solar_power_series(
+            orbit_states.position,
+            orbit_states.velocity,
+            sun_positions,
+            shadow,
+            times,
+            t_panel,
+        )
 
-            modes.append(
-                ",".join(self._loads.active_modes(t, in_ecl))
+        if isinstance(self._loads, LoadProfile):
+            power_consumed = self._loads.materialize(times, eclipse)
+        else:
+            power_consumed = np.array(
+                [self._loads.power_at(t, bool(e)) for t, e in zip(times, eclipse)]
             )
+        # Battery voltage under load, from the current the power balance draws
+        t_bat = (
+            battery_temperature
+            if battery_temperature is not None
+            else _DEFAULT_BATTERY_TEMP_K
+        )
+        v_ocv = self._battery.terminal_voltage(soc, 0.0, t_bat, v_rc1, v_rc2)
+        i_bat = self._bus.net_battery_current(power_generated, power_consumed, v_ocv)
+        battery_voltage = self._battery.terminal_voltage(
+            soc, i_bat, t_bat, v_rc1, v_rc2
+        )
+
+        if isinstance(self._loads, LoadProfile):
+            modes = self._loads.materialize_modes(times, eclipse)
+        else:
+            modes = [
+                ",".join(self._loads.active_modes(t, bool(e)))
+                for t, e in zip(times, eclipse)
+            ]
+
+        # Closed-form eclipse fraction for short cylindrical-shadow runs over
+        # whole orbits; a partial orbit keeps the sampled fraction
+        analytic_eclipse_fraction = None
+        n_orbits = t_end / self._orbit.period
+        if (
+            self._eclipse_model.method == "cylindrical"
+            and 0 < t_end <= _ANALYTIC_ECLIPSE_MAX_DURATION_S
+            and n_orbits >= 1
+            and abs(n_orbits - round(n_orbits)) <= _WHOLE_ORBITS_RTOL * n_orbits
+        ):
+            sun_mid = sun_position_eci(0.5 * t_end, self._epoch_doy)
+            analytic_eclipse_fraction = self._orbit.eclipse_fraction(sun_mid)
 
         return SimulationResults(
             time=times,
@@ -421,4 +802,5 @@ class Simulation:
             orbit_period=self._orbit.period,
             panel_temperature=panel_temperature,
             battery_temperature=battery_temperature,
+            analytic_eclipse_fraction=analytic_eclipse_fraction,
         )
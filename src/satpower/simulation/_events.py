@@ -4,10 +4,31 @@ from __future__ import annotations
 
 import numpy as np
 
+from satpower.orbit._eclipse import EclipseEvents
+
 
 class EclipseEventDetector:
     """Detects eclipse entry/exit from shadow fraction array."""
 
+    @staticmethod
+    def find_transition_arrays(
+        times: np.ndarray, eclipse: np.ndarray
+    ) -> EclipseEvents:
+        """Find eclipse entry/exit events from boolean eclipse array, as arrays.
+
+        Each event is placed midway between the two samples that straddle it.
+        """
+        times = np.asarray(times, dtype=float)
+        eclipse = np.asarray(eclipse, dtype=bool)
+
+        # +1 on entry into eclipse, -1 on exit
+        change = np.diff(eclipse.view(np.int8))
+        idx = np.flatnonzero(change)
+        kinds = np.where(
+            change[idx] > 0, EclipseEvents.ENTRY, EclipseEvents.EXIT
+        ).astype(np.uint8)
+        return EclipseEvents(times=0.5 * (times[idx] + times[idx + 1]), kinds=kinds)
+
     @staticmethod
     def find_transitions(
         times: np.ndarray, eclipse: np.ndarray
@@ -16,15 +37,12 @@ class EclipseEventDetector:
 
         Returns list of dicts with 'time' and 'type' ('entry' or 'exit').
         """
-        events = []
-        for i in range(1, len(eclipse)):
-            if not eclipse[i - 1] and eclipse[i]:
-                t_event = 0.5 * (times[i - 1] + times[i])
-                events.append({"time": t_event, "type": "entry"})
-            elif eclipse[i - 1] and not eclipse[i]:
-                t_event = 0.5 * (times[i - 1] + times[i])
-                events.append({"time": t_event, "type": "exit"})
-        return events
+        events = EclipseEventDetector.find_transition_arrays(times, eclipse)
+        names = ("entry", "exit")
+        return [
+            {"time": t, "type": names[k]}
+            for t, k in zip(events.times.tolist(), events.kinds.tolist())
+        ]
 
     @staticmethod
     def eclipse_fraction(eclipse: np.ndarray) -> float:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import os
 
 import numpy as np
@@ -10,6 +10,10 @@ import numpy as np
 # NumPy 2.0 removed np.trapz in favour of np.trapezoid
 _trapz = getattr(np, "trapezoid", None) or np.trapz
 
+# Storage precision for derived, display-only series (power, voltage).
+# Time and SoC stay float64: they come straight from the integrator.
+_SERIES_DTYPE = np.float32
+
 
 def _pyplot():
     """Import matplotlib.pyplot with a safe non-interactive backend.
@@ -34,14 +38,35 @@ class SimulationResults:
 
     time: np.ndarray  # seconds from epoch
     soc: np.ndarray  # state of charge [0, 1]
-    power_generated: np.ndarray  # W
-    power_consumed: np.ndarray  # W
-    battery_voltage: np.ndarray  # V
+    power_generated: np.ndarray  # W (float32)
+    power_consumed: np.ndarray  # W (float32)
+    battery_voltage: np.ndarray  # V (float32)
     eclipse: np.ndarray  # boolean
     modes: list[str]  # active modes at each timestep
     orbit_period: float  # seconds
     panel_temperature: np.ndarray | None = None  # K (when thermal enabled)
     battery_temperature: np.ndarray | None = None  # K (when thermal enabled)
+    analytic_eclipse_fraction: float | None = None  # closed form, when available
+    # (soc array, soc in percent) — rebuilt if soc is replaced
+    _soc_percent_cache: tuple | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Store every time series as a contiguous column array so plotting
+        # and reductions never re-materialize lists or strided views.
+        self.time = np.ascontiguousarray(self.time, dtype=float)
+        self.soc = np.ascontiguousarray(self.soc, dtype=float)
+        self.power_generated = np.ascontiguousarray(
+            self.power_generated, dtype=_SERIES_DTYPE
+        )
+        self.power_consumed = np.ascontiguousarray(
+            self.power_consumed, dtype=_SERIES_DTYPE
+        )
+        self.battery_voltage = np.ascontiguousarray(
+            self.battery_voltage, dtype=_SERIES_DTYPE
+        )
+        self.eclipse = np.ascontiguousarray(self.eclipse, dtype=bool)
 
     @property
     def time_minutes(self) -> np.ndarray:
@@ -55,6 +80,16 @@ class SimulationResults:
     def time_orbits(self) -> np.ndarray:
         return self.time / self.orbit_period
 
+    @property
+    def soc_percent(self) -> np.ndarray:
+        """State of charge in percent (read-only, computed once)."""
+        cache = self._soc_percent_cache
+        if cache is None or cache[0] is not self.soc:
+            pct = np.multiply(self.soc, 100.0)
+            pct.flags.writeable = False
+            cache = self._soc_percent_cache = (self.soc, pct)
+        return cache[1]
+
     @property
     def worst_case_dod(self) -> float:
         """Maximum depth of discharge encountered."""
@@ -63,7 +98,10 @@ class SimulationResults:
     @property
     def power_margin(self) -> float:
         """Average power margin (generated - consumed) in W."""
-        return float(np.mean(self.power_generated - self.power_consumed))
+        return float(
+            np.mean(self.power_generated, dtype=float)
+            - np.mean(self.power_consumed, dtype=float)
+        )
 
     @property
     def energy_balance_per_orbit(self) -> float:
@@ -72,14 +110,21 @@ class SimulationResults:
         n_orbits = total_time / self.orbit_period
         if n_orbits <= 0:
             return 0.0
-        net_power = self.power_generated - self.power_consumed
+        net_power = self.power_generated.astype(float) - self.power_consumed
         total_energy_ws = float(_trapz(net_power, self.time))
         return total_energy_ws / 3600.0 / n_orbits
 
     @property
     def eclipse_fraction(self) -> float:
-        """Fraction of simulation time in eclipse."""
-        return float(np.mean(self.eclipse.astype(float)))
+        """Fraction of simulation time in eclipse.
+
+        Uses the analytic orbit value when the engine provided one (runs of
+        whole orbits only), otherwise the fraction of samples flagged as
+        eclipse.
+        """
+        if self.analytic_eclipse_fraction is not None:
+            return self.analytic_eclipse_fraction
+        return float(np.mean(self.eclipse))
 
     def report(
         self,
@@ -100,18 +145,25 @@ class SimulationResults:
         return generate_power_budget(self, loads, battery, mission_name)
 
     def summary(self) -> dict:
-        """Summary statistics."""
+        """Summary statistics.
+
+        Each series is reduced once; derived figures (DoD, margin) reuse
+        those reductions instead of sweeping the arrays again.
+        """
+        min_soc = float(self.soc.min())
+        avg_generated = float(np.mean(self.power_generated, dtype=float))
+        avg_consumed = float(np.mean(self.power_consumed, dtype=float))
         return {
-            "min_soc": float(np.min(self.soc)),
-            "max_soc": float(np.max(self.soc)),
-            "worst_case_dod": self.worst_case_dod,
-            "avg_power_generated_w": float(np.mean(self.power_generated)),
-            "avg_power_consumed_w": float(np.mean(self.power_consumed)),
-            "power_margin_w": self.power_margin,
+            "min_soc": min_soc,
+            "max_soc": float(self.soc.max()),
+            "worst_case_dod": 1.0 - min_soc,
+            "avg_power_generated_w": avg_generated,
+            "avg_power_consumed_w": avg_consumed,
+            "power_margin_w": avg_generated - avg_consumed,
             "energy_balance_per_orbit_wh": self.energy_balance_per_orbit,
             "eclipse_fraction": self.eclipse_fraction,
-            "min_battery_voltage_v": float(np.min(self.battery_voltage)),
-            "max_battery_voltage_v": float(np.max(self.battery_voltage)),
+            "min_battery_voltage_v": float(self.battery_voltage.min()),
+            "max_battery_voltage_v": float(self.battery_voltage.max()),
             "duration_orbits": (self.time[-1] - self.time[0]) / self.orbit_period,
         }
 
@@ -128,7 +180,7 @@ class SimulationResults:
             fig = ax.get_figure()
 
         t = self.time_orbits
-        ax.plot(t, self.soc * 100, "b-", linewidth=1.5)
+        ax.plot(t, self.soc_percent, "b-", linewidth=1.5)
 
         # Shade eclipse regions
         self._shade_eclipses(ax, t)
@@ -185,16 +237,19 @@ class SimulationResults:
         fig.tight_layout()
         return fig
 
+    def _eclipse_spans(self) -> tuple[np.ndarray, np.ndarray]:
+        """Index pairs (start, end) of contiguous eclipse runs.
+
+        ``end`` is the first sunlit sample after the run, or the last sample
+        when the run reaches the end of the simulation.
+        """
+        edges = np.diff(np.concatenate(([0], self.eclipse.view(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.minimum(np.flatnonzero(edges == -1), len(self.eclipse) - 1)
+        return starts, ends
+
     def _shade_eclipses(self, ax, t: np.ndarray) -> None:
         """Add gray shading for eclipse periods."""
-        in_ecl = False
-        start = 0.0
-        for i in range(len(self.eclipse)):
-            if self.eclipse[i] and not in_ecl:
-                start = t[i]
-                in_ecl = True
-            elif not self.eclipse[i] and in_ecl:
-                ax.axvspan(start, t[i], alpha=0.15, color="gray")
-                in_ecl = False
-        if in_ecl:
-            ax.axvspan(start, t[-1], alpha=0.15, color="gray")
+        starts, ends = self._eclipse_spans()
+        for start, end in zip(t[starts], t[ends]):
+            ax.axvspan(start, end, alpha=0.15, color="gray")
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import numpy as np
-from scipy.optimize import brentq
 
 from satpower.data._loader import load_solar_cell, SolarCellData
 
@@ -12,6 +11,10 @@ K_B = 1.380649e-23
 # Electron charge (C)
 Q_E = 1.602176634e-19
 
+# Newton solver settings for iv_curve()
+_IV_NEWTON_MAX_ITER = 100
+_IV_NEWTON_TOL_A = 1e-13
+
 
 class SolarCell:
     """Single-diode solar cell model.
@@ -119,36 +122,43 @@ class SolarCell:
 
         I = I_ph - I_0 * (exp((V + I*Rs) / Vt) - 1) - (V + I*Rs) / Rsh
 
-        Solved iteratively for each voltage point.
+        Solved for all voltage points at once with Newton's method. The
+        residual is concave and decreasing in I, so iterating from I = I_ph
+        (right of the root) converges monotonically without bracketing.
+        Voltages beyond Voc (no positive root) give zero current.
         """
         i_ph, i0, vt = self._adjust_for_conditions(irradiance, temperature_k)
         voltage = np.asarray(voltage, dtype=float)
-
-        def _current_at_v(v: float) -> float:
-            if i_ph <= 0:
-                return 0.0
-
-            def residual(i: float) -> float:
-                return (
-                    i_ph
-                    - i0 * (np.exp((v + i * self._rs) / vt) - 1.0)
-                    - (v + i * self._rs) / self._rsh
-                    - i
-                )
-
-            try:
-                return brentq(residual, 0.0, i_ph * 1.1)
-            except ValueError:
-                return 0.0
-
-        return np.array([_current_at_v(v) for v in voltage])
+        if i_ph <= 0:
+            return np.zeros(voltage.shape)
+
+        rs = self._rs
+        g_sh = 1.0 / self._rsh
+
+        def residual(i: np.ndarray) -> np.ndarray:
+            v_d = voltage + i * rs
+            return i_ph - i0 * np.expm1(v_d / vt) - v_d * g_sh - i
+
+        current = np.full(voltage.shape, i_ph)
+        for _ in range(_IV_NEWTON_MAX_ITER):
+            v_d = voltage + current * rs
+            exp_term = np.exp(v_d / vt)
+            f = i_ph - i0 * (exp_term - 1.0) - v_d * g_sh - current
+            df = -i0 * rs / vt * exp_term - rs * g_sh - 1.0
+            step = f / df
+            current = current - step
+            if np.all(np.abs(step) <= _IV_NEWTON_TOL_A):
+                break
+
+        # No root in [0, I_ph] once the diode is forward-biased past Voc
+        return np.where(residual(np.zeros(voltage.shape)) > 0, current, 0.0)
 
     def mpp(
         self, irradiance: float, temperature_k: float
     ) -> tuple[float, float]:
         """Find maximum power point (V_mp, I_mp).
 
-        Uses the full I-V curve with brentq root-finding for accuracy.
+        Uses the full I-V curve (Newton solve of the diode equation) for accuracy.
         For fast repeated evaluation, use power_at_mpp() which uses an
         analytical approximation.
         """
@@ -163,12 +173,23 @@ class SolarCell:
         idx = np.argmax(p_range)
         return float(v_range[idx]), float(i_range[idx])
 
-    def power_at_mpp(self, irradiance: float, temperature_k: float) -> float:
+    def power_at_mpp(
+        self, irradiance: float | np.ndarray, temperature_k: float | np.ndarray
+    ) -> float | np.ndarray:
         """Power output at maximum power point (W).
 
         Uses analytical fill-factor approximation for performance.
         For the full I-V curve solution, use mpp() instead.
+
+        Accepts scalars or arrays; array inputs are broadcast against each
+        other and evaluated in a single vectorized pass.
         """
+        if np.ndim(irradiance) or np.ndim(temperature_k):
+            return self._power_at_mpp_array(
+                np.asarray(irradiance, dtype=float),
+                np.asarray(temperature_k, dtype=float),
+            )
+
         if irradiance <= 0:
             return 0.0
 
@@ -200,3 +221,32 @@ class SolarCell:
 
         ff = np.clip(ff, 0.5, 0.95)
         return float(isc * voc * ff)
+
+    def _power_at_mpp_array(
+        self, irradiance: np.ndarray, temperature_k: np.ndarray
+    ) -> np.ndarray:
+        """Vectorized power_at_mpp() — same model, evaluated elementwise."""
+        g_ratio = irradiance / self._irrad_ref
+        dt = temperature_k - self._temp_ref_k
+        vt = self._n * K_B * temperature_k / Q_E
+
+        isc = (self._isc + self._disc_dt * dt) * g_ratio
+        voc = (
+            self._voc
+            + self._dvoc_dt * dt
+            + vt * np.log(np.maximum(g_ratio, 1e-10))
+        )
+        valid = (irradiance > 0) & (isc > 0) & (voc > 0)
+
+        # Evaluate the fill factor on safe values; invalid samples are zeroed below
+        voc_safe = np.where(valid, voc, 1.0)
+        voc_norm = voc_safe / vt
+        ff_norm = np.where(
+            voc_norm > 1,
+            (voc_norm - np.log(np.maximum(voc_norm, 1.0) + 0.72)) / (voc_norm + 1),
+            0.7,
+        )
+        rs_loss = np.where(voc_norm > 1, self._rs * isc / voc_safe, 0.0)
+        ff = np.clip(ff_norm * (1.0 - rs_loss), 0.5, 0.95)
+
+        return np.where(valid, isc * voc_safe * ff, 0.0)
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import numpy as np
+
+_LOG_F14 = 14.0
+_LOG_F15 = 15.0
+
 
 def apply_radiation_degradation(
     power_bol: float,
@@ -24,26 +29,22 @@ def apply_radiation_degradation(
     -------
     Degraded power (W)
     """
-    import numpy as np
-
     if fluence_1mev <= 0:
         return power_bol
 
     log_f = np.log10(fluence_1mev)
-    log_f14 = 14.0
-    log_f15 = 15.0
+    # Per-decade slope between the two datasheet points
+    slope = (remaining_factor_1e15 - remaining_factor_1e14) / (_LOG_F15 - _LOG_F14)
 
-    if log_f <= log_f14:
+    if log_f <= _LOG_F14:
         # Linear interpolation from 1.0 at 0 fluence to rf_1e14
-        rf = 1.0 - (1.0 - remaining_factor_1e14) * (log_f / log_f14)
-    elif log_f <= log_f15:
+        rf = 1.0 - (1.0 - remaining_factor_1e14) * (log_f / _LOG_F14)
+    elif log_f <= _LOG_F15:
         # Interpolate between the two known points
-        t = (log_f - log_f14) / (log_f15 - log_f14)
-        rf = remaining_factor_1e14 + t * (remaining_factor_1e15 - remaining_factor_1e14)
+        rf = remaining_factor_1e14 + slope * (log_f - _LOG_F14)
     else:
         # Extrapolate beyond 1e15
-        slope = (remaining_factor_1e15 - remaining_factor_1e14) / (log_f15 - log_f14)
-        rf = remaining_factor_1e15 + slope * (log_f - log_f15)
+        rf = remaining_factor_1e15 + slope * (log_f - _LOG_F15)
 
     rf = max(0.0, min(1.0, rf))
     return power_bol * rf
@@ -35,13 +35,17 @@ class MpptModel:
         return self._efficiency
 
     def tracking_efficiency(
-        self, panel_power: float = 0.0, v_mpp: float = 0.0, v_bus: float = 0.0
-    ) -> float:
+        self,
+        panel_power: float | np.ndarray = 0.0,
+        v_mpp: float = 0.0,
+        v_bus: float = 0.0,
+    ) -> float | np.ndarray:
         """Return MPPT tracking efficiency.
 
         Parameters
         ----------
-        panel_power : Raw panel power before MPPT (W). Used in power-dependent mode.
+        panel_power : Raw panel power before MPPT (W), scalar or array.
+            Used in power-dependent mode.
         v_mpp : Maximum power point voltage (unused, for future extension).
         v_bus : Bus voltage (unused, for future extension).
         """
@@ -56,4 +60,6 @@ class MpptModel:
         eta = self._efficiency - (self._efficiency - self._min_efficiency) * np.exp(
             -5.0 * p_frac
         )
+        if np.ndim(eta):
+            return eta
         return float(eta)
@@ -126,7 +126,8 @@ class SolarPanel:
             w, h = dims["long"]
             wing_area_m2 = 2.0 * w * h
 
-        cell = SolarCell.from_datasheet(cell_type)
+        # Reuse the body panels' cell model rather than loading it again
+        cell = panels[0].cell if panels else SolarCell.from_datasheet(cell_type)
         effective_wing_area = wing_area_m2 * cell.packing_factor
 
         if wing_count == 2:
@@ -182,34 +183,109 @@ class SolarPanel:
     def power(
         self,
         sun_direction: np.ndarray,
-        irradiance: float,
-        temperature_k: float,
+        irradiance: float | np.ndarray,
+        temperature_k: float | np.ndarray,
         mppt_efficiency: float = 0.97,
-    ) -> float:
+    ) -> float | np.ndarray:
         """Compute panel power output (W).
 
         Parameters
         ----------
-        sun_direction : (3,) unit vector toward Sun in body frame
-        irradiance : solar irradiance at satellite (W/m^2)
-        temperature_k : panel temperature (K)
+        sun_direction : (3,) or (N, 3) unit vector(s) toward Sun in body frame
+        irradiance : solar irradiance at satellite (W/m^2), scalar or (N,)
+        temperature_k : panel temperature (K), scalar or (N,)
         mppt_efficiency : MPPT tracking efficiency (default 0.97)
         """
         # Cosine of incidence angle
-        cos_angle = float(np.dot(sun_direction, self._normal))
-        if cos_angle <= 0:
-            return 0.0  # Panel faces away from Sun
+        cos_angle = np.dot(sun_direction, self._normal)
+        n_cells = self._area_m2 / self._cell.area_m2
 
-        # Effective irradiance on panel
-        effective_irradiance = irradiance * cos_angle
+        if np.ndim(cos_angle) == 0 and np.ndim(irradiance) == 0:
+            cos_angle = float(cos_angle)
+            if cos_angle <= 0:
+                return 0.0  # Panel faces away from Sun
 
-        # Power output of a single cell at this irradiance
-        power_per_cell = self._cell.power_at_mpp(
-            effective_irradiance, temperature_k
-        )
+            # Effective irradiance on panel
+            effective_irradiance = irradiance * cos_angle
 
-        # Scale by number of cells that fit on this panel
-        n_cells = self._area_m2 / self._cell.area_m2
-        total_power = power_per_cell * n_cells * mppt_efficiency
+            # Power output of a single cell at this irradiance
+            power_per_cell = self._cell.power_at_mpp(
+                effective_irradiance, temperature_k
+            )
+
+            # Scale by number of cells that fit on this panel
+            total_power = power_per_cell * n_cells * mppt_efficiency
+
+            return max(0.0, total_power)
+
+        # Batched path: back-facing samples get zero irradiance
+        effective_irradiance = irradiance * np.maximum(cos_angle, 0.0)
+        power_per_cell = self._cell.power_at_mpp(effective_irradiance, temperature_k)
+        return np.maximum(power_per_cell * n_cells * mppt_efficiency, 0.0)
+
+
+class _PanelArray:
+    """Structure-of-arrays view of a fixed set of panels.
+
+    Face normals are stacked into an (F, 3) matrix and cell counts into an
+    (F,) vector once, so incidence cosines for every face and sample come
+    from one product and are clamped with np.maximum instead of a per-face
+    ``if``. Panels are grouped by cell model for one vectorized cell
+    evaluation per group.
+    """
+
+    def __init__(self, panels: list[SolarPanel]):
+        self._normals = np.array([p._normal for p in panels]).reshape(-1, 3)
+        self._n_cells = np.array([p._area_m2 / p._cell.area_m2 for p in panels])
+
+        by_cell: dict[int, tuple[SolarCell, list[int]]] = {}
+        for idx, panel in enumerate(panels):
+            by_cell.setdefault(id(panel._cell), (panel._cell, []))[1].append(idx)
+        self._groups = [(cell, np.array(idx)) for cell, idx in by_cell.values()]
+        # The usual case — every face shares one cell model — needs no gather
+        self._single_cell = self._groups[0][0] if len(self._groups) == 1 else None
+
+    def __len__(self) -> int:
+        return len(self._n_cells)
+
+    def power(
+        self,
+        sun_direction: np.ndarray,
+        irradiance: float | np.ndarray,
+        temperature_k: float | np.ndarray,
+        mppt_efficiency: float = 0.97,
+    ) -> float | np.ndarray:
+        """Summed power of all panels (W).
+
+        Parameters
+        ----------
+        sun_direction : (3,) or (N, 3) unit vector(s) toward Sun in body frame
+        irradiance : solar irradiance at satellite (W/m^2), scalar or (N,)
+        temperature_k : panel temperature (K), scalar or (N,)
+        mppt_efficiency : MPPT tracking efficiency (default 0.97)
+        """
+        sun_direction = np.asarray(sun_direction, dtype=float)
+        if not len(self):
+            return np.zeros(sun_direction.shape[:-1]) if sun_direction.ndim > 1 else 0.0
+
+        # (F,) or (N, F) clamped incidence cosines
+        cos_angle = np.maximum(sun_direction @ self._normals.T, 0.0)
+        effective_irradiance = np.asarray(irradiance, dtype=float)[..., np.newaxis] * cos_angle
+        temperature_k = np.asarray(temperature_k, dtype=float)[..., np.newaxis]
+
+        if self._single_cell is not None:
+            power_per_cell = self._single_cell._power_at_mpp_array(
+                effective_irradiance, temperature_k
+            )
+        else:
+            power_per_cell = np.zeros(effective_irradiance.shape)
+            for cell, idx in self._groups:
+                power_per_cell[..., idx] = cell._power_at_mpp_array(
+                    effective_irradiance[..., idx], temperature_k
+                )
+
+        total = np.maximum(power_per_cell @ self._n_cells * mppt_efficiency, 0.0)
+        if total.ndim == 0:
+            return float(total)
+        return total
 
-        return max(0.0, total_power)
@@ -1,5 +1,9 @@
 """Tests for satpower API services."""
 
+import asyncio
+import json
+
+import numpy as np
 import pytest
 
 from satpower.api import (
@@ -13,6 +17,10 @@ from satpower.api import (
     PresetSimulationRequest,
     PlotFormat,
     run_simulation,
+    run_simulation_async,
+    run_simulation_json,
+    shutdown_executor,
+    clear_caches,
     run_preset,
     list_components,
     get_component,
@@ -21,6 +29,7 @@ from satpower.api import (
     ComponentNotFoundError,
     SimulationError,
     PresetNotFoundError,
+    InvalidConfigurationError,
 )
 
 
@@ -66,6 +75,27 @@ class TestRunSimulation:
             assert plot.time_series is not None
             assert len(plot.time_series) > 0
 
+    def test_structured_plots_dump_to_json_lists(self, basic_request):
+        """Time series arrays should serialize as plain JSON number lists."""
+        basic_request.plot_format = PlotFormat.STRUCTURED
+        response = run_simulation(basic_request)
+        data = json.loads(response.model_dump_json())
+        series = data["plots"][0]["time_series"][0]
+        assert isinstance(series["x"], list)
+        assert len(series["x"]) == len(series["y"])
+        assert series["x"] == response.plots[0].time_series[0].x.tolist()
+        assert isinstance(response.model_dump()["plots"][0]["time_series"][0]["y"], list)
+
+    def test_float32_series_dumped_without_noise(self, basic_request):
+        """float32 series are dumped at float32 precision, not widened noise."""
+        basic_request.plot_format = PlotFormat.STRUCTURED
+        response = run_simulation(basic_request)
+        voltage = response.plots[2].time_series[0].y
+        assert voltage.dtype == np.float32
+        dumped = json.loads(response.model_dump_json())["plots"][2]["time_series"][0]["y"]
+        assert max(len(repr(v).replace(".", "").lstrip("0")) for v in dumped) <= 7
+        np.testing.assert_allclose(dumped, voltage, rtol=5e-7)
+
     def test_plots_base64(self, basic_request):
         """Base64 plots should contain PNG data."""
         basic_request.plot_format = PlotFormat.PNG_BASE64
@@ -76,6 +106,65 @@ class TestRunSimulation:
             assert plot.png_base64 is not None
             assert len(plot.png_base64) > 100  # non-trivial PNG data
 
+    def test_response_round_trips_through_schema(self, basic_request):
+        """Responses built without validation must still satisfy the schema."""
+        response = run_simulation(basic_request)
+        restored = SimulationResponse.model_validate_json(response.model_dump_json())
+        assert restored.summary.min_soc == pytest.approx(response.summary.min_soc)
+        assert len(restored.plots) == len(response.plots)
+        assert list(restored.plots[0].time_series[0].x) == pytest.approx(
+            list(response.plots[0].time_series[0].x)
+        )
+
+    def test_async_runs_in_worker_process(self, basic_request):
+        try:
+            response = asyncio.run(run_simulation_async(basic_request))
+        finally:
+            shutdown_executor()
+        assert isinstance(response, SimulationResponse)
+        assert response.name == "Test Mission"
+        assert response.summary.duration_orbits > 0
+
+    def test_async_error_does_not_break_pool(self, basic_request):
+        bad = basic_request.model_copy(
+            update={"solar": SolarRequest(cell="nonexistent_cell", form_factor="3U")}
+        )
+
+        async def run_both():
+            with pytest.raises(ComponentNotFoundError) as excinfo:
+                await run_simulation_async(bad)
+            assert excinfo.value.details["name"] == "nonexistent_cell"
+            return await run_simulation_async(basic_request)
+
+        try:
+            response = asyncio.run(run_both())
+        finally:
+            shutdown_executor()
+        assert response.name == "Test Mission"
+
+    def test_json_body(self, basic_request):
+        body = run_simulation_json(basic_request)
+        assert isinstance(body, bytes)
+        restored = SimulationResponse.model_validate_json(body)
+        assert restored.name == "Test Mission"
+        assert len(restored.plots) == 3
+
+    def test_response_is_immutable(self, basic_request):
+        from pydantic import ValidationError
+
+        response = run_simulation(basic_request)
+        with pytest.raises(ValidationError):
+            response.name = "changed"
+        with pytest.raises(ValidationError):
+            response.summary.min_soc = 0.0
+
+    def test_validation_with_eps_board(self, basic_request):
+        basic_request.eps_board = "gomspace_p31u"
+        basic_request.validate_system = True
+        response = run_simulation(basic_request)
+        assert response.validation is not None
+        assert isinstance(response.validation.passed, bool)
+
     def test_bad_solar_cell_raises(self):
         request = SimulationRequest(
             orbit=OrbitRequest(altitude_km=500, inclination_deg=45),
@@ -94,6 +183,24 @@ class TestRunSimulation:
         with pytest.raises(ComponentNotFoundError):
             run_simulation(request)
 
+    @pytest.mark.parametrize(
+        "error",
+        [
+            SatpowerAPIError("boom", code="X", details={"k": 1}),
+            ComponentNotFoundError("solar_cell", "nonexistent_cell"),
+            SimulationError("failed", details={"step": 3}),
+            PresetNotFoundError("nope"),
+        ],
+    )
+    def test_errors_survive_pickling(self, error):
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is type(error)
+        assert (restored.message, restored.code, restored.details) == (
+            error.message, error.code, error.details
+        )
+
 
 class TestComponentListing:
     def test_list_solar_cells(self):
@@ -115,6 +222,15 @@ class TestComponentListing:
         with pytest.raises(SatpowerAPIError):
             list_components("nonexistent")
 
+    def test_listing_cached_until_cleared(self):
+        first = list_components("eps")
+        assert list_components("eps") is first
+        assert get_presets() is get_presets()
+        clear_caches()
+        second = list_components("eps")
+        assert second is not first
+        assert second == first
+
 
 class TestComponentDetail:
     def test_valid_solar_cell(self):
@@ -141,6 +257,96 @@ class TestPresets:
         assert isinstance(response, SimulationResponse)
         assert response.summary.duration_orbits > 0
 
+    def test_overrides_applied(self):
+        response = run_preset(PresetSimulationRequest(
+            preset_name="earth_observation_3u",
+            overrides={"name": "Override", "simulation": {"duration_orbits": 0.5}},
+        ))
+        assert response.name == "Override"
+        assert response.summary.duration_orbits == pytest.approx(0.5)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"simulation": {"duration_orbits": -1.0}},
+            {"orbit": "not an orbit"},
+            {"model_dump": 1},
+        ],
+    )
+    def test_invalid_overrides_rejected(self, overrides):
+        with pytest.raises(InvalidConfigurationError):
+            run_preset(PresetSimulationRequest(
+                preset_name="earth_observation_3u", overrides=overrides
+            ))
+
     def test_invalid_preset_raises(self):
         with pytest.raises(PresetNotFoundError):
             run_preset(PresetSimulationRequest(preset_name="nonexistent_preset"))
+
+
+class TestRequestConversion:
+    def test_matches_validated_config(self, basic_request):
+        from satpower.api._services import _request_to_mission_config
+        from satpower.mission._config import MissionConfig
+
+        request = basic_request.model_copy(
+            update={
+                "solar": SolarRequest(
+                    cell="azur_3g30c",
+                    exclude_faces=["-Z"],
+                    deployed_wings_count=2,
+                    deployed_wings_area_m2=0.06,
+                ),
+                "loads": [
+                    LoadRequest(name="downlink", power_w=6.0, duty_cycle=0.1,
+                                trigger="scheduled", period_s=600.0, phase_s=30.0),
+                ],
+            }
+        )
+        config = _request_to_mission_config(request)
+        validated = MissionConfig.model_validate(config.model_dump())
+        assert config.loads[0].period_s == 600.0
+        assert config == validated
+        assert config.satellite.solar.exclude_faces is not request.solar.exclude_faces
+
+
+class TestSerializers:
+    def test_shared_eclipse_regions(self, basic_request):
+        from satpower.api._serializers import (
+            _extract_eclipse_regions,
+            serialize_plot_power_balance,
+        )
+        from satpower.mission._builder import build_simulation
+        from satpower.api._services import _request_to_mission_config
+
+        sim = build_simulation(_request_to_mission_config(basic_request))
+        results = sim.run(duration_orbits=1, dt_max=60.0)
+        regions = _extract_eclipse_regions(results)
+        plot = serialize_plot_power_balance(results, PlotFormat.STRUCTURED, regions)
+        assert plot.eclipse_regions == regions
+        assert serialize_plot_power_balance(
+            results, PlotFormat.STRUCTURED
+        ).eclipse_regions == regions
+        generated, consumed = plot.time_series
+        assert generated.x is consumed.x
+
+    def test_eclipse_regions_edges(self):
+        from satpower.api._serializers import _extract_eclipse_regions
+        from satpower.simulation._results import SimulationResults
+
+        eclipse = np.array([True, True, False, False, True, False, True, True])
+        n = len(eclipse)
+        results = SimulationResults(
+            time=np.arange(n) * 10.0,
+            soc=np.ones(n),
+            power_generated=np.zeros(n),
+            power_consumed=np.zeros(n),
+            battery_voltage=np.zeros(n),
+            eclipse=eclipse,
+            modes=[""] * n,
+            orbit_period=100.0,
+        )
+        # Runs end at the first sunlit sample, or the last sample at the end
+        assert _extract_eclipse_regions(results) == [
+            (0.0, 0.2), (0.4, 0.5), (0.6, 0.7),
+        ]
@@ -1,5 +1,6 @@
 """Tests for battery aging model."""
 
+import numpy as np
 import pytest
 
 from satpower.battery._aging import AgingModel
@@ -67,3 +68,34 @@ class TestArrheniusAging:
         cap_default = model.capacity_remaining(years=3, n_cycles=5000, avg_dod=0.5)
         cap_explicit = model.capacity_remaining(years=3, n_cycles=5000, avg_dod=0.5, temperature_k=298.15)
         assert abs(cap_default - cap_explicit) < 1e-10
+
+
+class TestVectorizedAging:
+    def test_array_matches_scalar(self):
+        model = AgingModel()
+        years = np.arange(6)
+        n_cycles = (15.5 * 365.25 * years).astype(int)
+        dods = np.array([0.1, 0.25, 0.5, 0.6, 0.9, 1.0])
+        temps = np.array([0.0, 288.15, 298.15, 308.15, 318.15, 298.15])
+        remaining = model.capacity_remaining(years, n_cycles, dods, temps)
+        assert remaining.shape == (6,)
+        expected = [
+            model.capacity_remaining(y, c, d, t)
+            for y, c, d, t in zip(years, n_cycles, dods, temps)
+        ]
+        np.testing.assert_allclose(remaining, expected, rtol=1e-12)
+
+    def test_scalar_returns_float(self):
+        model = AgingModel()
+        assert isinstance(model.capacity_remaining(1.0, 100, 0.3), float)
+
+    def test_cycle_fade_piecewise_linear(self):
+        model = AgingModel(
+            calendar_fade_per_year=0.0,
+            cycle_fade_per_cycle_50dod=0.0001,
+            cycle_fade_per_cycle_100dod=0.0005,
+        )
+        dods = np.array([-0.2, 0.0, 0.25, 0.5, 0.75, 1.0, 1.3])
+        fade = 1.0 - model.capacity_remaining(0.0, 1000, dods)
+        expected = np.array([0.0, 0.0, 0.05, 0.1, 0.3, 0.5, 0.5])
+        np.testing.assert_allclose(fade, expected, atol=1e-12)
@@ -36,6 +36,33 @@ class TestOCV:
         for i in range(1, len(ocvs)):
             assert ocvs[i] >= ocvs[i - 1]
 
+    def test_ocv_array_matches_scalar(self, ncr18650b):
+        socs = np.linspace(-0.1, 1.1, 25)
+        ocvs = ncr18650b.ocv(socs)
+        assert ocvs.shape == (25,)
+        np.testing.assert_allclose(ocvs, [ncr18650b.ocv(s) for s in socs])
+
+    def test_ocv_clamped_outside_soc_range(self, ncr18650b):
+        assert ncr18650b.ocv(-0.1) == ncr18650b.ocv(0.0)
+        assert ncr18650b.ocv(1.2) == ncr18650b.ocv(1.0)
+
+    def test_partial_unsorted_table_extrapolated_to_bounds(self, ncr18650b):
+        data = ncr18650b._data
+        rows = [r for r in data.ocv_soc_table if 0.05 <= r[0] <= 0.95]
+        cell = BatteryCell(data.model_copy(update={"ocv_soc_table": rows[::-1]}))
+        (s0, v0), (s1, v1) = rows[0], rows[1]
+        expected = v0 - (v1 - v0) / (s1 - s0) * s0
+        assert cell.ocv(0.0) == pytest.approx(expected)
+        assert cell.ocv(rows[2][0]) == pytest.approx(rows[2][1])
+    def test_ocv_slope_matches_finite_difference(self, ncr18650b):
+        # Points inside segments (finite differences straddle knots)
+        socs = np.array([0.05, 0.15, 0.27, 0.41, 0.63, 0.8, 0.95])
+        h = 1e-7
+        fd = (ncr18650b.ocv(socs + h) - ncr18650b.ocv(socs - h)) / (2 * h)
+        np.testing.assert_allclose(ncr18650b.ocv_slope(socs), fd, rtol=1e-5)
+        assert isinstance(ncr18650b.ocv_slope(0.5), float)
+        assert ncr18650b.ocv_slope(1.1) == 0.0
+
 
 class TestTerminalVoltage:
     def test_no_load_equals_ocv(self, ncr18650b):
@@ -79,3 +106,45 @@ class TestDerivatives:
         # With current and zero initial RC voltage, RC should build up
         dv1, _ = ncr18650b.derivatives(1.0, 0.0)
         assert dv1 > 0  # RC voltage increases during discharge
+
+    def test_rc_equilibrium_at_i_r(self, ncr18650b):
+        current = 1.5
+        dv1, dv2 = ncr18650b.derivatives(
+            current, current * ncr18650b._r1, current * ncr18650b._r2
+        )
+        assert dv1 == pytest.approx(0.0, abs=1e-12)
+        assert dv2 == pytest.approx(0.0, abs=1e-12)
+
+    def test_disabled_second_branch(self, ncr18650b):
+        data = ncr18650b._data
+        model = data.thevenin_model.model_copy(update={"c2_f": 0.0})
+        cell = BatteryCell(data.model_copy(update={"thevenin_model": model}))
+        _, dv2 = cell.derivatives(2.0, 0.0, 0.3)
+        assert dv2 == 0.0
+
+
+class TestBatchedEvaluation:
+    def test_terminal_voltage_array_matches_scalar(self, ncr18650b):
+        soc = np.linspace(0.1, 1.0, 12)
+        current = np.linspace(-2.0, 3.0, 12)
+        temp = np.linspace(263.15, 313.15, 12)
+        v_rc1 = np.linspace(0.0, 0.05, 12)
+        batched = ncr18650b.terminal_voltage(soc, current, temp, v_rc1, 0.01)
+        expected = [
+            ncr18650b.terminal_voltage(s, i, t, v, 0.01)
+            for s, i, t, v in zip(soc, current, temp, v_rc1)
+        ]
+        np.testing.assert_allclose(batched, expected, rtol=1e-12)
+
+    def test_derivatives_array_matches_scalar(self, ncr18650b):
+        current = np.array([-1.0, 0.0, 2.5])
+        v_rc1 = np.array([0.01, 0.0, -0.02])
+        dv1, dv2 = ncr18650b.derivatives(current, v_rc1, 0.0)
+        for k in range(3):
+            s1, s2 = ncr18650b.derivatives(current[k], v_rc1[k], 0.0)
+            assert dv1[k] == pytest.approx(s1)
+            assert dv2[k] == pytest.approx(s2)
+
+    def test_scalar_resistance_is_float(self, ncr18650b):
+        assert isinstance(ncr18650b.internal_resistance(0.5, 280.0), float)
+
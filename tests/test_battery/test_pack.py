@@ -20,6 +20,18 @@ class TestConfigParsing:
         with pytest.raises(ValueError):
             _parse_config("2x2")
 
+    def test_lowercase_accepted(self):
+        assert _parse_config("4s3p") == (4, 3)
+
+    @pytest.mark.parametrize("config", ["2S", "SP", "2SP", "S2P", "2S2S2P", "2S2P2", " 2S2P"])
+    def test_malformed_rejected(self, config):
+        with pytest.raises(ValueError, match="Expected format"):
+            _parse_config(config)
+
+    def test_zero_count_rejected(self):
+        with pytest.raises(ValueError, match="must be > 0"):
+            _parse_config("0S1P")
+
 
 class TestBatteryPack:
     def test_from_cell_creation(self):
@@ -47,3 +59,16 @@ class TestBatteryPack:
     def test_voltage_limits(self, battery_2s2p):
         assert abs(battery_2s2p.max_voltage - 8.4) < 0.01
         assert abs(battery_2s2p.min_voltage - 5.0) < 0.01
+
+    def test_current_limit_scaling(self, battery_2s2p):
+        # Current limits scale with the parallel count only
+        cell = battery_2s2p.cell
+        assert battery_2s2p.max_charge_current_a == cell.max_charge_current_a * 2
+        assert (
+            battery_2s2p.max_discharge_current_a == cell.max_discharge_current_a * 2
+        )
+
+    def test_from_cell_shares_cell_model(self):
+        pack_a = BatteryPack.from_cell("panasonic_ncr18650b", "2S2P")
+        pack_b = BatteryPack.from_cell("panasonic_ncr18650b", "4S1P")
+        assert pack_a.cell is pack_b.cell
@@ -0,0 +1,57 @@
+"""Tests for Coulomb counting SoC estimation."""
+
+import numpy as np
+import pytest
+
+from satpower.battery._soc import CoulombCounter, integrate_soc
+
+
+class TestCoulombCounter:
+    def test_discharge_lowers_soc(self):
+        counter = CoulombCounter(capacity_ah=2.0, initial_soc=1.0)
+        soc = counter.update(current=1.0, dt=3600.0)
+        assert abs(soc - 0.5) < 1e-12
+
+    def test_clamped_at_full(self):
+        counter = CoulombCounter(capacity_ah=2.0, initial_soc=0.99)
+        assert counter.update(current=-5.0, dt=3600.0) == 1.0
+
+    def test_clamped_at_empty(self):
+        counter = CoulombCounter(capacity_ah=2.0, initial_soc=0.01)
+        assert counter.update(current=5.0, dt=3600.0) == 0.0
+
+    def test_initial_soc_clamped_to_float(self):
+        assert CoulombCounter(capacity_ah=2.0, initial_soc=1.5).soc == 1.0
+        soc = CoulombCounter(capacity_ah=2.0, initial_soc=-0.2).soc
+        assert soc == 0.0
+        assert type(soc) is float
+
+    def test_update_series_matches_stepping(self):
+        current = np.array([2.0, 2.0, -6.0, -6.0, 1.0, 3.0])
+        stepped = CoulombCounter(capacity_ah=1.0, initial_soc=0.2)
+        expected = [stepped.update(i, 600.0) for i in current]
+        counter = CoulombCounter(capacity_ah=1.0, initial_soc=0.2)
+        np.testing.assert_allclose(counter.update_series(current, 600.0), expected)
+        assert counter.soc == pytest.approx(stepped.soc)
+
+
+class TestIntegrateSoc:
+    def test_matches_stepwise_counter(self):
+        rng = np.random.default_rng(0)
+        current = rng.uniform(-4.0, 4.0, 500)
+        counter = CoulombCounter(capacity_ah=1.0, initial_soc=0.5)
+        expected = [counter.update(i, 30.0) for i in current]
+        soc = integrate_soc(0.5, current, 30.0, capacity_ah=1.0)
+        np.testing.assert_allclose(soc, expected, atol=1e-12)
+
+    def test_unclamped_is_cumulative(self):
+        current = np.full(10, 0.1)
+        soc = integrate_soc(0.8, current, 60.0, capacity_ah=2.0)
+        expected = 0.8 - np.cumsum(current * 60.0 / 7200.0)
+        np.testing.assert_allclose(soc, expected)
+
+    @pytest.mark.parametrize("current, bound", [(-10.0, 1.0), (10.0, 0.0)])
+    def test_stays_within_bounds(self, current, bound):
+        soc = integrate_soc(0.5, np.full(100, current), 60.0, capacity_ah=1.0)
+        assert np.all((soc >= 0.0) & (soc <= 1.0))
+        assert soc[-1] == bound
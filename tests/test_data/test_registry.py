@@ -72,6 +72,22 @@ class TestBatteryCellLoading:
         with pytest.raises(FileNotFoundError):
             registry.get_battery_cell("nonexistent_battery")
 
+    def test_ocv_soc_arrays_cached_columns(self):
+        data = registry.get_battery_cell("panasonic_ncr18650b")
+        soc, ocv = data.ocv_soc_arrays
+        assert soc.tolist() == [row[0] for row in data.ocv_soc_table]
+        assert ocv.tolist() == [row[1] for row in data.ocv_soc_table]
+        assert data.ocv_soc_arrays[0] is soc
+        assert not soc.flags.writeable
+
+    def test_ocv_soc_arrays_follow_replaced_table(self):
+        data = registry.get_battery_cell("panasonic_ncr18650b")
+        data.ocv_soc_arrays
+        copy = data.model_copy(update={"ocv_soc_table": [[1.0, 4.2], [0.0, 3.0]]})
+        soc, ocv = copy.ocv_soc_arrays
+        assert soc.tolist() == [0.0, 1.0]
+        assert ocv.tolist() == [3.0, 4.2]
+
 
 class TestEPSLoading:
     @pytest.mark.parametrize("name", EXPECTED_EPS)
@@ -85,3 +101,104 @@ class TestEPSLoading:
     def test_unknown_eps_raises(self):
         with pytest.raises(FileNotFoundError):
             registry.get_eps("nonexistent_eps")
+
+
+class TestRegistryCache:
+    def test_repeat_lookup_returns_cached_instance(self):
+        first = registry.get_solar_cell("azur_3g30c")
+        assert registry.get_solar_cell("azur_3g30c") is first
+        assert registry.get_battery_cell("lg_mj1") is registry.get_battery_cell("lg_mj1")
+        assert registry.get_eps("gomspace_p31u") is registry.get_eps("gomspace_p31u")
+
+    def test_clear_cache_reloads(self):
+        first = registry.get_eps("isis_ieps")
+        registry.clear_cache()
+        second = registry.get_eps("isis_ieps")
+        assert second is not first
+        assert second == first
+
+    def test_clear_cache_drops_pack_cell_models(self):
+        from satpower.battery._pack import BatteryPack
+
+        first = BatteryPack.from_cell("lg_mj1", "2S1P").cell
+        assert BatteryPack.from_cell("lg_mj1", "1S1P").cell is first
+        registry.clear_cache()
+        second = BatteryPack.from_cell("lg_mj1", "2S1P").cell
+        assert second is not first
+        assert second._data is registry.get_battery_cell("lg_mj1")
+
+    def test_listing_scanned_once_and_sorted(self):
+        names = registry.list_eps()
+        assert names == sorted(names)
+        names.append("scratch")
+        assert "scratch" not in registry.list_eps()
+        assert registry._listings["eps"] == tuple(registry.list_eps())
+
+    def test_missing_component_not_cached(self):
+        with pytest.raises(FileNotFoundError):
+            registry.get_eps("nonexistent_eps")
+        with pytest.raises(FileNotFoundError):
+            registry.get_eps("nonexistent_eps")
+
+
+class TestYamlParsing:
+    def test_loader_matches_pure_python_safe_load(self):
+        import yaml
+
+        from satpower.data._loader import _DATA_DIR, _load_yaml
+
+        paths = sorted(_DATA_DIR.glob("*/*.yaml"))
+        assert paths
+        for path in paths:
+            assert _load_yaml(path) == yaml.safe_load(path.read_text()), path.name
+
+    def test_parse_cached_until_file_changes(self, tmp_path):
+        import os
+
+        from satpower.data._loader import _load_yaml
+
+        path = tmp_path / "part.yaml"
+        path.write_text("name: a\nvalues: [1, 2]\n")
+        first = _load_yaml(path)
+        first["values"].append(3)
+        assert _load_yaml(path) == {"name": "a", "values": [1, 2]}
+
+        path.write_text("name: bb\nvalues: [1, 2]\n")
+        os.utime(path, ns=(0, 0))
+        assert _load_yaml(path)["name"] == "bb"
+
+
+class TestLoaderMemoization:
+    def test_preload_warms_every_datasheet(self):
+        from satpower.data._loader import load_battery_cell
+
+        registry.clear_cache()
+        registry.preload()
+        info = load_battery_cell.cache_info()
+        assert info.currsize == len(registry.list_battery_cells())
+        registry.get_battery_cell("lg_mj1")
+        assert load_battery_cell.cache_info().hits == info.hits + 1
+
+    def test_from_datasheet_shares_registry_model(self):
+        from satpower.battery._cell import BatteryCell
+        from satpower.solar._cell import SolarCell
+
+        battery = BatteryCell.from_datasheet("lg_mj1")
+        assert battery._data is registry.get_battery_cell("lg_mj1")
+        solar = SolarCell.from_datasheet("azur_3g30c")
+        assert solar._data is registry.get_solar_cell("azur_3g30c")
+
+    def test_shared_models_are_frozen(self):
+        from pydantic import ValidationError
+
+        cell = registry.get_solar_cell("azur_3g30c")
+        with pytest.raises(ValidationError):
+            cell.parameters.efficiency = 0.5
+        eps = registry.get_eps("gomspace_p31u")
+        with pytest.raises(ValidationError):
+            eps.mppt_efficiency = 0.5
+        varied = cell.model_copy(
+            update={"parameters": cell.parameters.model_copy(update={"efficiency": 0.5})}
+        )
+        assert varied.parameters.efficiency == 0.5
+        assert registry.get_solar_cell("azur_3g30c").parameters.efficiency != 0.5
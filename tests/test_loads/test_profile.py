@@ -1,8 +1,11 @@
 """Tests for load profile and duty cycling."""
 
+import dataclasses
+
+import numpy as np
 import pytest
 
-from satpower.loads._profile import LoadProfile
+from satpower.loads._profile import LoadMode, LoadProfile, TriggerKind
 
 
 class TestLoadProfile:
@@ -51,3 +54,87 @@ class TestLoadProfile:
         # idle: 2W always, payload: 5*0.3*0.65 = 0.975W
         expected = 2.0 + 5.0 * 0.3 * 0.65
         assert abs(avg - expected) < 0.01
+
+    def test_materialize_matches_power_at(self):
+        loads = LoadProfile()
+        loads.add_mode("idle", power_w=2.0)
+        loads.add_mode("payload", power_w=5.0, duty_cycle=0.3, trigger="sunlight")
+        loads.add_mode("heater", power_w=3.0, trigger="eclipse")
+        loads.add_mode("downlink", power_w=8.0, duty_cycle=0.1, trigger="scheduled",
+                       period_s=600.0, phase_s=30.0)
+        loads.add_mode("imaging", power_w=4.0, duty_cycle=0.25, trigger="scheduled",
+                       period_s=900.0, phase_s=-100.0)
+        loads.add_mode("spare", power_w=1.0, duty_cycle=0.0, trigger="scheduled")
+        times = np.linspace(0, 3000, 301)
+        eclipse = (times % 1000) > 600
+        power = loads.materialize(times, eclipse)
+        expected = [loads.power_at(t, bool(e)) for t, e in zip(times, eclipse)]
+        np.testing.assert_allclose(power, expected)
+
+    def test_materialize_modes_matches_active_modes(self):
+        loads = LoadProfile()
+        loads.add_mode("idle", power_w=2.0)
+        loads.add_mode("payload", power_w=5.0, duty_cycle=0.3, trigger="sunlight")
+        loads.add_mode("heater", power_w=3.0, trigger="eclipse")
+        loads.add_mode("downlink", power_w=8.0, duty_cycle=0.1, trigger="scheduled",
+                       period_s=600.0, phase_s=30.0)
+        loads.add_mode("spare", power_w=1.0, duty_cycle=0.0, trigger="scheduled")
+        times = np.linspace(0, 3000, 301)
+        eclipse = (times % 1000) > 600
+        modes = loads.materialize_modes(times, eclipse)
+        expected = [
+            ",".join(loads.active_modes(t, bool(e))) for t, e in zip(times, eclipse)
+        ]
+        assert modes == expected
+        assert LoadProfile().materialize_modes(times[:3], False) == ["", "", ""]
+
+    def test_materialize_long_grid_in_blocks(self):
+        from satpower.loads import _profile
+
+        loads = LoadProfile()
+        loads.add_mode("idle", power_w=2.0)
+        loads.add_mode("downlink", power_w=8.0, duty_cycle=0.1, trigger="scheduled",
+                       period_s=600.0, phase_s=30.0)
+        times = np.linspace(0, 50000, 2 * _profile._MATERIALIZE_BLOCK + 17)
+        power = loads.materialize(times, False)
+        expected = [loads.power_at(t) for t in times]
+        np.testing.assert_allclose(power, expected)
+
+    def test_trigger_codes_assigned_once(self):
+        loads = LoadProfile()
+        loads.add_mode("idle", power_w=2.0)
+        loads.add_mode("payload", power_w=5.0, duty_cycle=0.3, trigger="sunlight")
+        loads.add_mode("heater", power_w=3.0, trigger="eclipse")
+        loads.add_mode("downlink", power_w=8.0, trigger="scheduled")
+        assert list(loads._trigger_codes) == [
+            TriggerKind.ALWAYS, TriggerKind.SUNLIGHT,
+            TriggerKind.ECLIPSE, TriggerKind.SCHEDULED,
+        ]
+        # Unscheduled modes fold into one sunlight / eclipse constant
+        assert loads._constant_power == pytest.approx((3.5, 5.0))
+
+    def test_mode_kind_resolved_from_trigger(self):
+        assert LoadMode("heater", 3.0, trigger="eclipse").kind == TriggerKind.ECLIPSE
+        with pytest.raises(ValueError, match="trigger must be one of"):
+            LoadMode("heater", 3.0, trigger="night")
+        with pytest.raises(ValueError, match="trigger must be one of"):
+            LoadProfile().add_mode("heater", 3.0, trigger="night")
+
+    def test_modes_are_immutable(self):
+        loads = LoadProfile()
+        loads.add_mode("idle", power_w=2.0)
+        loads.add_mode("payload", power_w=5.0, duty_cycle=0.3)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            loads.modes[0].power_w = 4.0
+        assert loads.power_at(0.0) == pytest.approx(3.5)
+        assert loads.orbit_average_power(0.35) == pytest.approx(3.5)
+
+    def test_orbit_average_matches_per_mode_sum(self):
+        loads = LoadProfile()
+        loads.add_mode("idle", power_w=2.0)
+        loads.add_mode("payload", power_w=5.0, duty_cycle=0.3, trigger="sunlight")
+        loads.add_mode("heater", power_w=3.0, duty_cycle=0.5, trigger="eclipse")
+        loads.add_mode("downlink", power_w=8.0, duty_cycle=0.1, trigger="scheduled")
+        for ef in (0.0, 0.35, 1.0):
+            expected = 2.0 + 1.5 * (1 - ef) + 1.5 * ef + 0.8
+            assert loads.orbit_average_power(ef) == pytest.approx(expected)
@@ -18,3 +18,21 @@ class TestModeScheduler:
         profile.add_mode("idle", power_w=2.0)
         sched = ModeScheduler(profile)
         assert "idle" in sched.active_modes(0)
+
+    def test_baseline_plus_highest_override(self):
+        profile = LoadProfile()
+        profile.add_mode("obc", power_w=1.0)
+        profile.add_mode("payload", power_w=5.0, trigger="sunlight", priority=1)
+        profile.add_mode("comms", power_w=8.0, trigger="eclipse", priority=2)
+        sched = ModeScheduler(profile)
+        assert sched.active_modes(0, in_eclipse=False) == ["obc", "payload"]
+        assert sched.active_modes(0, in_eclipse=True) == ["obc", "comms"]
+
+    def test_regroups_after_add_mode(self):
+        profile = LoadProfile()
+        profile.add_mode("obc", power_w=1.0)
+        sched = ModeScheduler(profile)
+        assert sched.active_modes(0) == ["obc"]
+        profile.add_mode("payload", power_w=5.0, priority=3)
+        assert sched.active_modes(0) == ["obc", "payload"]
+        assert sched.power_at(0) == pytest.approx(6.0)
@@ -1,5 +1,6 @@
 """Tests for mission YAML configuration parsing."""
 
+import numpy as np
 import pytest
 from pathlib import Path
 
@@ -92,3 +93,23 @@ class TestBuildSimulation:
         sim = build_simulation(config)
         assert sim._eps_board is not None
         assert sim._bus.bus_voltage == 3.3
+
+    def test_build_scheduled_load(self):
+        config = load_mission(_MISSIONS_DIR / "iot_comms_3u.yaml")
+        data = config.model_dump()
+        data["loads"].append(
+            {"name": "downlink", "power_w": 6.0, "duty_cycle": 0.1,
+             "trigger": "scheduled", "period_s": 600.0, "phase_s": 30.0}
+        )
+        sim = build_simulation(MissionConfig.model_validate(data))
+        mode = sim.loads.modes[-1]
+        assert mode.trigger == "scheduled"
+        assert (mode.period_s, mode.phase_s) == (600.0, 30.0)
+
+    def test_build_fp32_orbit(self):
+        config = load_mission(_MISSIONS_DIR / "iot_comms_3u.yaml")
+        assert config.orbit.precision == "fp64"
+        data = config.model_dump()
+        data["orbit"]["precision"] = "fp32"
+        sim = build_simulation(MissionConfig.model_validate(data))
+        assert sim._orbit.dtype == np.float32
@@ -4,7 +4,7 @@ import numpy as np
 import pytest
 
 from satpower.orbit._propagator import Orbit, R_EARTH
-from satpower.orbit._eclipse import EclipseModel
+from satpower.orbit._eclipse import EclipseEvents, EclipseModel
 from satpower.orbit._geometry import sun_position_eci
 
 
@@ -43,11 +43,22 @@ class TestCylindricalShadow:
         assert fracs[1] == 1.0
         assert fracs[2] == 0.0
 
+    def test_single_sample_matches_batch(self):
+        model = EclipseModel()
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=45)
+        times = np.linspace(0, orbit.period, 1000)
+        sat_pos = orbit.propagate(times).position
+        sun_pos = sun_position_eci(times, epoch_day_of_year=80)
+        batch = model.shadow_fraction(sat_pos, sun_pos)
+        single = [model.shadow_fraction(r, s) for r, s in zip(sat_pos, sun_pos)]
+        assert all(isinstance(f, float) for f in single)
+        np.testing.assert_array_equal(single, batch)
+
 
 class TestConicalShadow:
     def test_conical_creation(self):
         model = EclipseModel(method="conical")
-        assert model._method == "conical"
+        assert model.method == "conical"
 
     def test_invalid_method_raises(self):
         with pytest.raises(ValueError):
@@ -133,6 +144,20 @@ class TestEclipseFraction:
         # LEO orbits typically have 30-40% eclipse
         assert 0.1 < eclipse_frac < 0.5
 
+    @pytest.mark.parametrize("method", ["cylindrical", "conical"])
+    def test_float32_trajectory(self, method):
+        times = np.linspace(0, 86400.0, 5000)
+        sun_pos = sun_position_eci(times, epoch_day_of_year=80)
+        model = EclipseModel(method)
+        ref = model.shadow_fraction(
+            Orbit.circular(altitude_km=500, inclination_deg=45).propagate(times).position,
+            sun_pos,
+        )
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=45, dtype=np.float32)
+        fracs = model.shadow_fraction(orbit.propagate(times).position, sun_pos)
+        assert fracs.dtype == np.float64
+        np.testing.assert_allclose(fracs, ref, atol=1e-3)
+
     def test_find_transitions(self):
         orbit = Orbit.circular(altitude_km=500, inclination_deg=45)
         model = EclipseModel()
@@ -143,3 +168,77 @@ class TestEclipseFraction:
         events = model.find_transitions(state.position, sun_pos, times)
         # Should have at least 2 transitions per orbit
         assert len(events) >= 2
+
+    def test_transitions_alternate(self):
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=45)
+        model = EclipseModel()
+        times = np.linspace(0, orbit.period * 3, 3000)
+        state = orbit.propagate(times)
+        sun_pos = sun_position_eci(times, epoch_day_of_year=80)
+
+        events = model.find_transitions(state.position, sun_pos, times)
+        kinds = [e.event_type for e in events]
+        assert kinds[0] == "entry"
+        assert all(a != b for a, b in zip(kinds, kinds[1:]))
+        # Each event sits between the two samples that straddle it
+        fracs = model.shadow_fraction(state.position, sun_pos)
+        for event in events:
+            i = np.searchsorted(times, event.time)
+            assert fracs[i] == (1.0 if event.event_type == "entry" else 0.0)
+            assert fracs[i - 1] != fracs[i]
+
+    def test_transition_arrays(self):
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=45)
+        model = EclipseModel()
+        times = np.linspace(0, orbit.period * 3, 3000)
+        state = orbit.propagate(times)
+        sun_pos = sun_position_eci(times, epoch_day_of_year=80)
+
+        events = model.find_transition_arrays(state.position, sun_pos, times)
+        assert events.kinds.dtype == np.uint8
+        assert len(events) == len(events.times) >= 2
+        assert events.as_list() == model.find_transitions(state.position, sun_pos, times)
+        entries = events.times[events.kinds == EclipseEvents.ENTRY]
+        exits = events.times[events.kinds == EclipseEvents.EXIT]
+        assert np.all(entries[: len(exits)] < exits[: len(entries)])
+
+    def test_conical_transitions_interpolated(self):
+        """Penumbra interpolation makes event times insensitive to sampling."""
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=45)
+        model = EclipseModel("conical")
+
+        def event_times(dt):
+            times = np.arange(0.0, orbit.period * 2, dt)
+            state = orbit.propagate(times)
+            sun_pos = sun_position_eci(times, epoch_day_of_year=80)
+            return np.array([
+                e.time for e in model.find_transitions(state.position, sun_pos, times)
+            ])
+
+        # Midpoints would be off by up to dt/2 = 1.5 s
+        np.testing.assert_allclose(event_times(3.0), event_times(0.1), atol=0.1)
+
+
+class TestPrecomputedInterval:
+    def test_interval_matches_cylindrical_model(self):
+        orbit = Orbit.circular(altitude_km=550, inclination_deg=97.6)
+        model = EclipseModel()
+        times = np.linspace(0, orbit.period, 5000)
+        sun_dir = sun_position_eci(0.0, epoch_day_of_year=80)
+        state = orbit.propagate(times)
+        # Sun at a very large distance so the direction is fixed
+        far_sun = np.tile(sun_dir * 1e6, (len(times), 1))
+        expected = model.shadow_fraction(state.position, far_sun) > 0
+
+        interval = model.precompute(orbit, sun_dir)
+        nu = times * 2.0 * np.pi / orbit.period
+        np.testing.assert_array_equal(model.in_eclipse_array(nu, interval), expected)
+
+    def test_no_eclipse_at_high_beta(self):
+        # Sun along the orbit normal of an equatorial orbit
+        orbit = Orbit.circular(altitude_km=550, inclination_deg=0)
+        model = EclipseModel()
+        interval = model.precompute(orbit, np.array([0.0, 0.0, 1.0]))
+        assert np.isnan(interval[0]) and np.isnan(interval[1])
+        nu = np.linspace(0, 2 * np.pi, 100)
+        assert not model.in_eclipse_array(nu, interval).any()
@@ -94,3 +94,13 @@ class TestBetaAngle:
             sun_ecliptic_lon_rad=0,
         )
         assert abs(beta) > np.radians(1)
+
+    def test_vectorized_matches_scalar(self):
+        env = OrbitalEnvironment()
+        inc = np.radians(97.6)
+        raan = np.radians(30.0)
+        lons = np.linspace(0.0, 2.0 * np.pi, 37)
+        betas = env.beta_angle(inc, raan, lons)
+        assert betas.shape == lons.shape
+        expected = [env.beta_angle(inc, raan, lon) for lon in lons]
+        np.testing.assert_allclose(betas, expected, rtol=0, atol=1e-15)
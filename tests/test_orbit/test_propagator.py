@@ -62,6 +62,65 @@ class TestPropagation:
         expected_r = R_EARTH + 500e3
         assert max_z > expected_r * 0.99
 
+    def test_velocity_perpendicular_to_position(self):
+        orbit = Orbit.circular(altitude_km=550, inclination_deg=97.6, raan_deg=40)
+        times = np.linspace(0, orbit.period * 2, 200)
+        state = orbit.propagate(times)
+        dots = np.sum(state.position * state.velocity, axis=1)
+        assert np.allclose(dots, 0.0, atol=1e-3 * orbit.semi_major_axis)
+        speeds = np.linalg.norm(state.velocity, axis=1)
+        assert np.allclose(speeds, np.sqrt(MU_EARTH / orbit.semi_major_axis), rtol=1e-10)
+
+    @pytest.mark.parametrize("j2", [False, True])
+    def test_float32_trajectory(self, j2):
+        times = np.linspace(0, 86400.0, 500)
+        ref = Orbit.circular(altitude_km=550, inclination_deg=97.6, j2=j2).propagate(times)
+        orbit = Orbit.circular(
+            altitude_km=550, inclination_deg=97.6, j2=j2, dtype=np.float32
+        )
+        state = orbit.propagate(times)
+        assert state.position.dtype == np.float32
+        assert state.velocity.dtype == np.float32
+        np.testing.assert_allclose(state.position, ref.position, atol=5.0)
+        np.testing.assert_allclose(state.velocity, ref.velocity, atol=5e-3)
+
+    def test_non_float_dtype_rejected(self):
+        with pytest.raises(ValueError):
+            Orbit.circular(altitude_km=550, inclination_deg=97.6, dtype=np.int64)
+
+    @pytest.mark.parametrize("j2", [False, True])
+    def test_state_at_matches_propagate(self, j2):
+        orbit = Orbit.circular(altitude_km=550, inclination_deg=97.6, raan_deg=40, j2=j2)
+        times = np.array([0.0, 1234.5, 3.0 * 86400.0])
+        state = orbit.propagate(times)
+        for i, t in enumerate(times):
+            pos, vel = orbit.state_at(t)
+            np.testing.assert_allclose(pos, state.position[i], atol=1e-6)
+            np.testing.assert_allclose(vel, state.velocity[i], atol=1e-9)
+
+
+class TestAnalyticEclipseFraction:
+    def test_sun_in_orbit_plane(self):
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=0)
+        frac = orbit.eclipse_fraction(np.array([1.0, 0.0, 0.0]))
+        expected = np.arccos(np.sqrt(1 - (R_EARTH / orbit.semi_major_axis) ** 2)) / np.pi
+        assert abs(frac - expected) < 1e-12
+
+    def test_sun_along_orbit_normal_no_eclipse(self):
+        orbit = Orbit.circular(altitude_km=500, inclination_deg=0)
+        assert orbit.eclipse_fraction(np.array([0.0, 0.0, 1.0])) == 0.0
+
+    def test_matches_sampled_shadow(self):
+        from satpower.orbit._eclipse import EclipseModel
+
+        orbit = Orbit.circular(altitude_km=550, inclination_deg=97.6, raan_deg=30)
+        sun_dir = np.array([0.8, 0.5, 0.2])
+        times = np.linspace(0, orbit.period, 20000, endpoint=False)
+        state = orbit.propagate(times)
+        far_sun = np.tile(sun_dir * 1e12, (len(times), 1))
+        sampled = np.mean(EclipseModel().shadow_fraction(state.position, far_sun))
+        assert abs(orbit.eclipse_fraction(sun_dir) - sampled) < 1e-3
+
 
 class TestJ2Perturbation:
     def test_j2_raan_drift_sso(self):
@@ -105,3 +164,14 @@ class TestJ2Perturbation:
         # Retrograde orbit (i>90°) should have positive RAAN drift (eastward)
         retro = Orbit.circular(altitude_km=500, inclination_deg=120, j2=True)
         assert retro._raan_rate > 0
+
+    def test_j2_state_matches_fixed_plane_at_drifted_raan(self):
+        """At any instant the J2 orbit lies in the plane of its current RAAN."""
+        orbit = Orbit.circular(altitude_km=550, inclination_deg=97.6, raan_deg=30, j2=True)
+        t = 5.0 * 86400.0 + 1234.0
+        raan_now = orbit._raan_rad + orbit._raan_rate * t
+        frozen = Orbit(orbit.altitude_m, orbit._inclination_rad, raan_now)
+        state = orbit.propagate(np.array([t]))
+        expected = frozen.propagate(np.array([t]))
+        np.testing.assert_allclose(state.position, expected.position, atol=1e-6)
+        np.testing.assert_allclose(state.velocity, expected.velocity, atol=1e-9)
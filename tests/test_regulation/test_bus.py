@@ -1,5 +1,6 @@
 """Tests for power bus and converter."""
 
+import numpy as np
 import pytest
 
 from satpower.regulation._bus import PowerBus
@@ -63,6 +64,18 @@ class TestPowerBus:
         # Battery receives 9W → -9 / 10V = -0.9A
         assert abs(current - (-0.9)) < 0.01
 
+    @pytest.mark.parametrize("load_dependent", [False, True])
+    def test_array_matches_scalar(self, load_dependent):
+        bus = PowerBus(converter=DcDcConverter(load_dependent=load_dependent))
+        solar = np.array([0.0, 3.0, 12.0, 10.0, 50.0])
+        load = np.array([5.0, 3.0, 4.0, 0.0, 8.0])
+        voltage = np.array([7.4, 8.0, 0.0, 8.2, 8.4])
+        currents = bus.net_battery_current(solar, load, voltage)
+        expected = [
+            bus.net_battery_current(s, l, v) for s, l, v in zip(solar, load, voltage)
+        ]
+        np.testing.assert_allclose(currents, expected, rtol=1e-15)
+
 
 class TestCoulombCounter:
     def test_discharge_gives_negative_dsoc(self):
@@ -95,3 +95,35 @@ class TestConverterLoadDependent:
     def test_input_power(self):
         conv = DcDcConverter(efficiency=0.90)
         assert abs(conv.input_power(9.0) - 10.0) < 0.01
+
+
+class TestConverterLookupTable:
+    def _converter(self):
+        return DcDcConverter(
+            load_dependent=True,
+            rated_power_w=20.0,
+            peak_efficiency=0.94,
+            light_load_efficiency=0.80,
+        )
+
+    def test_lut_matches_analytical_curve(self):
+        conv = self._converter()
+        loads = np.linspace(0.0, 60.0, 997)
+        np.testing.assert_allclose(
+            conv.efficiency_at_load(loads), conv._efficiency_curve(loads), atol=1e-4
+        )
+
+    def test_array_matches_scalar(self):
+        conv = self._converter()
+        loads = np.array([-1.0, 0.0, 2.5, 10.0, 39.0, 50.0])
+        effs = conv.efficiency_at_load(loads)
+        assert effs.shape == (6,)
+        np.testing.assert_allclose(effs, [conv.efficiency_at_load(p) for p in loads])
+
+    def test_scalar_path_matches_array(self):
+        conv = self._converter()
+        loads = np.linspace(-5.0, 60.0, 301)
+        effs = conv.efficiency_at_load(loads)
+        scalar = [conv.efficiency_at_load(float(p)) for p in loads]
+        assert all(isinstance(e, float) for e in scalar)
+        np.testing.assert_allclose(scalar, effs, rtol=1e-12)
@@ -7,7 +7,7 @@ from satpower.orbit._propagator import Orbit
 from satpower.solar._panel import SolarPanel
 from satpower.battery._pack import BatteryPack
 from satpower.loads._profile import LoadProfile
-from satpower.simulation._engine import Simulation
+from satpower.simulation._engine import Simulation, _nadir_rotation_matrix
 
 
 @pytest.fixture
@@ -87,6 +87,18 @@ class TestSimulationRun:
         results = basic_sim.run(duration_s=3600, dt_max=60)
         assert abs(results.time[-1] - 3600) < 60
 
+    def test_exposes_loads_and_battery(self, basic_sim):
+        assert isinstance(basic_sim.loads, LoadProfile)
+        assert isinstance(basic_sim.battery, BatteryPack)
+        assert [m.name for m in basic_sim.loads.modes] == ["idle", "comms", "payload"]
+
+    def test_exposes_panels_and_eps_board(self, basic_sim):
+        panels = basic_sim.panels
+        assert len(panels) == 6
+        panels.clear()
+        assert len(basic_sim.panels) == 6
+        assert basic_sim.eps_board is None
+
 
 class TestSimulationResults:
     def test_summary_keys(self, basic_sim):
@@ -107,7 +119,131 @@ class TestSimulationResults:
         # LEO eclipse fraction is typically 30-40%
         assert 0.1 < results.eclipse_fraction < 0.5
 
+    def test_partial_orbit_uses_sampled_eclipse_fraction(self, basic_sim):
+        results = basic_sim.run(duration_s=1500, dt_max=30)
+        assert results.analytic_eclipse_fraction is None
+        assert results.eclipse_fraction == float(np.mean(results.eclipse))
+        assert results.summary()["eclipse_fraction"] == results.eclipse_fraction
+
+    def test_whole_orbits_use_analytic_eclipse_fraction(self, basic_sim):
+        results = basic_sim.run(duration_orbits=2, dt_max=60)
+        assert results.analytic_eclipse_fraction is not None
+        assert abs(results.eclipse_fraction - np.mean(results.eclipse)) < 0.02
+
     def test_time_conversions(self, basic_sim):
         results = basic_sim.run(duration_orbits=1, dt_max=60)
         assert results.time_minutes[-1] == results.time[-1] / 60.0
         assert results.time_hours[-1] == results.time[-1] / 3600.0
+
+
+class TestNadirRotation:
+    def test_single_sample_matches_batch(self):
+        rng = np.random.default_rng(0)
+        positions = rng.normal(size=(20, 3)) * 7.0e6
+        velocities = rng.normal(size=(20, 3)) * 7.5e3
+        batch = _nadir_rotation_matrix(positions, velocities)
+        for i in range(len(positions)):
+            single = _nadir_rotation_matrix(positions[i], velocities[i])
+            np.testing.assert_allclose(single, batch[i], atol=1e-14)
+
+    def test_orthonormal(self):
+        r = _nadir_rotation_matrix(np.array([7.0e6, 0.0, 0.0]), np.array([0.0, 7.5e3, 0.0]))
+        np.testing.assert_allclose(r @ r.T, np.eye(3), atol=1e-14)
+        # Z axis toward Earth, X along velocity
+        np.testing.assert_allclose(r[2], [-1.0, 0.0, 0.0])
+        np.testing.assert_allclose(r[0], [0.0, 1.0, 0.0], atol=1e-14)
+
+
+class TestSunEphemerisTable:
+    def test_interpolated_sun_matches_ephemeris(self, basic_sim):
+        from satpower.orbit._geometry import sun_position_eci
+
+        t_end = 2 * 86400.0
+        basic_sim._build_sun_lut(t_end)
+        for t in np.linspace(0, t_end, 37):
+            exact = sun_position_eci(t, 80.0)
+            interp = basic_sim._sun_position(t)
+            assert np.linalg.norm(interp - exact) / np.linalg.norm(exact) < 1e-6
+
+    def test_table_reused_across_runs(self, basic_sim):
+        basic_sim._build_sun_lut(2 * 86400.0)
+        lut = basic_sim._sun_lut
+        basic_sim._build_sun_lut(86400.0)
+        assert basic_sim._sun_lut is lut
+        basic_sim._build_sun_lut(3 * 86400.0)
+        assert len(basic_sim._sun_lut) > len(lut)
+
+    def test_repeated_runs_do_not_alias_results(self, basic_sim):
+        first = basic_sim.run(duration_orbits=0.5, dt_max=60)
+        first_power = first.power_generated.copy()
+        second = basic_sim.run(duration_orbits=0.5, dt_max=60)
+        np.testing.assert_array_equal(first.power_generated, first_power)
+        np.testing.assert_array_equal(second.soc, first.soc)
+
+
+class TestAdaptiveGrid:
+    def test_transitions_match_shadow_edges(self, basic_sim):
+        t_end = 2 * basic_sim._orbit.period
+        basic_sim._build_sun_lut(t_end)
+        transitions = basic_sim._eclipse_transition_times(t_end)
+        assert len(transitions) == 4
+
+        pos_before = basic_sim._orbit.propagate(transitions - 5.0).position
+        pos_after = basic_sim._orbit.propagate(transitions + 5.0).position
+        sun = np.tile(basic_sim._sun_position(0.5 * t_end), (len(transitions), 1))
+        model = basic_sim._eclipse_model
+        # Alternating entry (sun -> shadow) and exit (shadow -> sun)
+        np.testing.assert_array_equal(
+            model.shadow_fraction(pos_before, sun), [0.0, 1.0, 0.0, 1.0]
+        )
+        np.testing.assert_array_equal(
+            model.shadow_fraction(pos_after, sun), [1.0, 0.0, 1.0, 0.0]
+        )
+
+    def test_grid_refined_near_transitions(self, basic_sim):
+        results = basic_sim.run(duration_orbits=2, dt_max=300, adaptive=True)
+        dt = np.diff(results.time)
+        assert np.all(dt > 0)
+        assert dt.max() <= 300.0 + 1e-9
+        # Four transitions, each with a ±2 min window sampled at dt_max / 10
+        assert np.count_nonzero(np.isclose(dt, 30.0)) >= 4 * 6
+        # Coarse outside the windows: far fewer samples than a uniform 30 s grid
+        assert len(results.time) < 2 * basic_sim._orbit.period / 30.0 / 3
+
+    def test_matches_fine_uniform_run(self, basic_sim):
+        fine = basic_sim.run(duration_orbits=2, dt_max=30)
+        coarse = basic_sim.run(duration_orbits=2, dt_max=300, adaptive=True)
+        assert np.min(coarse.soc) == pytest.approx(np.min(fine.soc), rel=1e-3)
+        assert np.any(coarse.eclipse)
+
+
+class TestTimeTermsCache:
+    def test_reused_at_same_time(self, basic_sim):
+        basic_sim._build_sun_lut(86400.0)
+        first = basic_sim._time_terms(1200.0, 300.0)
+        assert basic_sim._time_terms(1200.0, 300.0) is first
+        assert basic_sim._time_terms(1200.0, 310.0) is not first
+
+    def test_implicit_solver_matches_rk45(self, basic_sim):
+        rk45 = basic_sim.run(duration_orbits=1, dt_max=60)
+        bdf = basic_sim.run(duration_orbits=1, dt_max=60, method="BDF")
+        np.testing.assert_allclose(bdf.soc, rk45.soc, atol=1e-5)
+
+
+class TestAnalyticJacobian:
+    @pytest.mark.parametrize("t", [600.0, 2500.0])
+    def test_matches_finite_difference(self, basic_sim, t):
+        basic_sim._build_sun_lut(86400.0)
+        state = np.array([0.62, 0.01, 0.004])
+        jac = basic_sim._jac(t, state)
+        fd = np.empty((3, 3))
+        for j in range(3):
+            h = np.zeros(3)
+            h[j] = 1e-6
+            fd[:, j] = (basic_sim._rhs(t, state + h) - basic_sim._rhs(t, state - h)) / 2e-6
+        np.testing.assert_allclose(jac, fd, rtol=1e-5, atol=1e-12)
+
+    def test_lsoda_matches_rk45(self, basic_sim):
+        rk45 = basic_sim.run(duration_orbits=1, dt_max=60)
+        lsoda = basic_sim.run(duration_orbits=1, dt_max=60, method="LSODA")
+        np.testing.assert_allclose(lsoda.soc, rk45.soc, atol=1e-5)
@@ -0,0 +1,39 @@
+"""Tests for simulation event detection."""
+
+import numpy as np
+
+from satpower.orbit._eclipse import EclipseEvents
+from satpower.simulation._events import EclipseEventDetector
+
+
+class TestEclipseEventDetector:
+    def test_transitions_at_midpoints(self):
+        times = np.arange(8) * 10.0
+        eclipse = np.array([False, False, True, True, False, False, True, True])
+        events = EclipseEventDetector.find_transitions(times, eclipse)
+        assert events == [
+            {"time": 15.0, "type": "entry"},
+            {"time": 35.0, "type": "exit"},
+            {"time": 55.0, "type": "entry"},
+        ]
+
+    def test_transition_arrays(self):
+        rng = np.random.default_rng(5)
+        eclipse = rng.random(500) < 0.4
+        times = np.cumsum(rng.uniform(1.0, 5.0, 500))
+        events = EclipseEventDetector.find_transition_arrays(times, eclipse)
+        assert isinstance(events, EclipseEvents)
+        # Reference: explicit pairwise scan
+        changed = [i for i in range(1, len(eclipse)) if eclipse[i] != eclipse[i - 1]]
+        np.testing.assert_allclose(
+            events.times, [0.5 * (times[i - 1] + times[i]) for i in changed]
+        )
+        np.testing.assert_array_equal(
+            events.kinds,
+            [EclipseEvents.ENTRY if eclipse[i] else EclipseEvents.EXIT for i in changed],
+        )
+
+    def test_no_transitions(self):
+        events = EclipseEventDetector.find_transition_arrays(np.arange(3.0), np.ones(3))
+        assert len(events) == 0
+        assert EclipseEventDetector.find_transitions(np.arange(1.0), [True]) == []
@@ -1,5 +1,8 @@
 """Tests for simulation results and plotting."""
 
+import subprocess
+import sys
+
 import numpy as np
 import pytest
 
@@ -31,6 +34,11 @@ class TestSimulationResults:
         expected = np.mean([i % 3 == 0 for i in range(100)])
         assert abs(mock_results.eclipse_fraction - expected) < 0.01
 
+    def test_analytic_eclipse_fraction_preferred(self, mock_results):
+        mock_results.analytic_eclipse_fraction = 0.375
+        assert mock_results.eclipse_fraction == 0.375
+        assert mock_results.summary()["eclipse_fraction"] == 0.375
+
     def test_summary_returns_dict(self, mock_results):
         summary = mock_results.summary()
         assert isinstance(summary, dict)
@@ -39,3 +47,47 @@ class TestSimulationResults:
     def test_time_orbits(self, mock_results):
         expected = mock_results.time / 5400.0
         np.testing.assert_allclose(mock_results.time_orbits, expected)
+
+    def test_soc_percent_cached(self, mock_results):
+        pct = mock_results.soc_percent
+        np.testing.assert_allclose(pct, mock_results.soc * 100)
+        assert mock_results.soc_percent is pct
+        assert not pct.flags.writeable
+        mock_results.soc = np.zeros_like(mock_results.soc)
+        assert not mock_results.soc_percent.any()
+
+    def test_series_dtypes(self, mock_results):
+        assert mock_results.soc.dtype == np.float64
+        assert mock_results.time.dtype == np.float64
+        assert mock_results.power_generated.dtype == np.float32
+        assert mock_results.battery_voltage.dtype == np.float32
+        assert isinstance(mock_results.summary()["avg_power_consumed_w"], float)
+
+    def test_eclipse_spans(self):
+        eclipse = np.array([True, True, False, False, True, False, True, True])
+        n = len(eclipse)
+        results = SimulationResults(
+            time=np.arange(n, dtype=float),
+            soc=np.ones(n),
+            power_generated=np.zeros(n),
+            power_consumed=np.zeros(n),
+            battery_voltage=np.full(n, 8.0),
+            eclipse=eclipse,
+            modes=[""] * n,
+            orbit_period=4.0,
+        )
+        starts, ends = results._eclipse_spans()
+        np.testing.assert_array_equal(starts, [0, 4, 6])
+        np.testing.assert_array_equal(ends, [2, 5, 7])
+
+
+class TestLazyImports:
+    def test_package_import_skips_matplotlib_and_scipy(self):
+        code = (
+            "import sys, satpower, satpower.api; "
+            "print(any(m.split('.')[0] in ('matplotlib', 'scipy') for m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
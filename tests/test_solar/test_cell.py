@@ -44,6 +44,18 @@ class TestIVCurve:
         # Current should generally decrease with voltage
         assert current[0] > current[-1]
 
+    def test_iv_curve_satisfies_diode_equation(self, azur_cell):
+        voltage = np.linspace(0, 2.6, 40)
+        current = azur_cell.iv_curve(1361.0, 301.15, voltage)
+        i_ph, i0, vt = azur_cell._adjust_for_conditions(1361.0, 301.15)
+        v_d = voltage + current * azur_cell._rs
+        residual = i_ph - i0 * np.expm1(v_d / vt) - v_d / azur_cell._rsh - current
+        np.testing.assert_allclose(residual, 0.0, atol=1e-10)
+
+    def test_zero_current_beyond_voc(self, azur_cell):
+        current = azur_cell.iv_curve(1361.0, 301.15, np.array([3.0, 3.5]))
+        np.testing.assert_array_equal(current, 0.0)
+
 
 class TestMPP:
     def test_mpp_at_stc(self, azur_cell):
@@ -75,3 +87,11 @@ class TestMPP:
         p_half = azur_cell.power_at_mpp(680.5, 301.15)
         # Half irradiance should give roughly half power
         assert 0.35 < p_half / p_full < 0.65
+
+    def test_power_at_mpp_array_matches_scalar(self, azur_cell):
+        irradiance = np.array([0.0, 100.0, 680.5, 1361.0])
+        temps = np.array([250.0, 280.0, 301.15, 340.0])
+        powers = azur_cell.power_at_mpp(irradiance, temps)
+        assert powers.shape == (4,)
+        expected = [azur_cell.power_at_mpp(g, t) for g, t in zip(irradiance, temps)]
+        np.testing.assert_allclose(powers, expected, rtol=1e-12)
@@ -3,7 +3,7 @@
 import numpy as np
 import pytest
 
-from satpower.solar._panel import SolarPanel
+from satpower.solar._panel import SolarPanel, _PanelArray
 
 
 class TestCubesatBody:
@@ -62,6 +62,21 @@ class TestPanelPower:
         )
         assert total > 0
 
+    def test_batched_sun_directions_match_scalar(self, panels_3u):
+        sun_dirs = np.array([
+            [1.0, 0.0, 0.0],
+            [-1.0, 0.0, 0.0],
+            [0.6, 0.0, 0.8],
+        ])
+        irradiance = np.array([1361.0, 1361.0, 900.0])
+        for panel in panels_3u:
+            powers = panel.power(sun_dirs, irradiance, 301.15)
+            assert powers.shape == (3,)
+            expected = [
+                panel.power(d, g, 301.15) for d, g in zip(sun_dirs, irradiance)
+            ]
+            np.testing.assert_allclose(powers, expected, rtol=1e-12)
+
 
 class TestExcludeFaces:
     def test_exclude_one_face(self):
@@ -105,6 +120,10 @@ class TestCubesatWithWings:
         wing_names = [p.name for p in panels if "wing" in p.name]
         assert len(wing_names) == 4
 
+    def test_wings_share_body_cell(self):
+        panels = SolarPanel.cubesat_with_wings("3U", "azur_3g30c", wing_count=2)
+        assert all(p.cell is panels[0].cell for p in panels)
+
     def test_with_exclude_faces(self):
         panels = SolarPanel.cubesat_with_wings(
             "3U", "azur_3g30c", wing_count=2, exclude_faces=["-Z"]
@@ -152,3 +171,36 @@ class TestDeployed:
         )
         assert panel.name == "wing"
         assert abs(panel.area_m2 - 0.06) < 1e-10
+
+
+class TestPanelArray:
+    def test_matches_per_panel_sum(self):
+        panels = SolarPanel.cubesat_with_wings("3U", "azur_3g30c", wing_count=4)
+        rng = np.random.default_rng(3)
+        sun_dirs = rng.normal(size=(200, 3))
+        sun_dirs /= np.linalg.norm(sun_dirs, axis=1, keepdims=True)
+        irradiance = rng.uniform(0.0, 1400.0, 200)
+        temps = rng.uniform(250.0, 350.0, 200)
+
+        total = _PanelArray(panels).power(sun_dirs, irradiance, temps)
+        expected = sum(p.power(sun_dirs, irradiance, temps) for p in panels)
+        np.testing.assert_allclose(total, expected, rtol=1e-12)
+
+    def test_single_direction_returns_float(self, panels_3u):
+        sun_dir = np.array([0.6, 0.0, 0.8])
+        total = _PanelArray(panels_3u).power(sun_dir, 1361.0, 301.15)
+        assert isinstance(total, float)
+        expected = sum(p.power(sun_dir, 1361.0, 301.15) for p in panels_3u)
+        assert abs(total - expected) < 1e-12
+
+    def test_no_panels(self):
+        assert _PanelArray([]).power(np.array([1.0, 0.0, 0.0]), 1361.0, 301.15) == 0.0
+
+    def test_mixed_cell_models(self):
+        panels = SolarPanel.cubesat_body("3U", "azur_3g30c") + [
+            SolarPanel.deployed(0.06, "spectrolab_xtj_prime", np.array([0.0, 1.0, 0.0]))
+        ]
+        sun_dir = np.array([0.0, 0.6, 0.8])
+        total = _PanelArray(panels).power(sun_dir, 1361.0, 301.15)
+        expected = sum(p.power(sun_dir, 1361.0, 301.15) for p in panels)
+        assert total == pytest.approx(expected, rel=1e-12)